@@ -34,6 +34,12 @@ GROUP_RULES: dict[str, dict[str, list[str]]] = {
     },
 }
 
+# Corpus scorers that accept several group directories at once.
+# SCR scores each manifest once and writes one audit per group; SHS
+# parses every group once and scores Reference Coverage on links
+# across all of them.
+MULTI_GROUP_TOOLS: set[str] = {"scr", "shs"}
+
 
 def _md_files(directory: str) -> list[str]:
     return sorted(glob.glob(f"{directory}/*.md"))
@@ -103,17 +109,23 @@ def main() -> None:
             for tool, files in per_file_tasks:
                 pool.submit(scorers[tool], files)
 
-    # Phase 2: corpus scorers in parallel
-    corpus_tasks: list[tuple[str, str]] = []
+    # Phase 2: corpus scorers in parallel. Tools in MULTI_GROUP_TOOLS
+    # get every group in one invocation so shared work runs once.
+    corpus_tasks: list[tuple[str, list[str]]] = []
+    multi_group: dict[str, list[str]] = {}
     for gname, gdir in groups.items():
         for tool in GROUP_RULES[gname]["corpus"]:
-            corpus_tasks.append((tool, str(gdir)))
+            if tool in MULTI_GROUP_TOOLS:
+                multi_group.setdefault(tool, []).append(str(gdir))
+            else:
+                corpus_tasks.append((tool, [str(gdir)]))
+    corpus_tasks.extend(multi_group.items())
 
     if corpus_tasks:
         print("\n=== Corpus scorers ===")
         with ThreadPoolExecutor(max_workers=len(corpus_tasks)) as pool:
-            for tool, directory in corpus_tasks:
-                pool.submit(scorers[tool], [directory])
+            for tool, directories in corpus_tasks:
+                pool.submit(scorers[tool], directories)
 
     # Phase 3: dashboard
     print("\n=== Dashboard ===")
@@ -0,0 +1 @@
+"""Micro-benchmarks for scoring hot paths (not part of any score)."""
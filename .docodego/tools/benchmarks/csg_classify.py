@@ -0,0 +1,147 @@
+"""Benchmark CSG constant classification against corpus size.
+
+Times the keyword-index classifier on growing samples of context
+windows and, for comparison, the regex-per-keyword scan it
+replaced. Per-constant cost should stay flat as the sample grows
+(linear scaling).
+
+    .docodego/tools/run benchmarks.csg_classify [directory] [--max N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+from scoring_common import fix_encoding, load_dotenv
+
+fix_encoding()
+load_dotenv()
+
+from csg_scorer.dim_constants_http import (
+    _NON_TEMPORAL_GROUPS,
+    _SEMANTIC_GROUPS,
+    _classify_constant_group,
+)
+from csg_scorer.parser import parse_spec
+
+_REFERENCE_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+def _reference_classify(ctx: str, *, is_temporal: bool) -> str | None:
+    """The previous classifier: one word-boundary regex per keyword."""
+    lower = ctx.lower()
+    for group_name, keywords, min_hits, temporal_only in _SEMANTIC_GROUPS:
+        if is_temporal and group_name in _NON_TEMPORAL_GROUPS:
+            continue
+        if temporal_only and not is_temporal:
+            continue
+        matched = []
+        for kw in keywords:
+            pat = _REFERENCE_PATTERNS.get(kw)
+            if pat is None:
+                pat = re.compile(r"\b" + re.escape(kw), re.I)
+                _REFERENCE_PATTERNS[kw] = pat
+            if pat.search(lower):
+                matched.append(kw)
+        unique: list[str] = []
+        for kw in sorted(matched, key=len):
+            if not any(other in kw for other in unique):
+                unique.append(kw)
+        if len(unique) >= min_hits:
+            return group_name
+    return None
+
+
+def _load_constants(directory: Path) -> list[tuple[str, bool]]:
+    """(context, is_temporal) for every constant in the corpus."""
+    samples: list[tuple[str, bool]] = []
+    for md_file in sorted(directory.rglob("*.md")):
+        spec = parse_spec(md_file)
+        samples.extend(
+            (c.context, c.normalized_seconds is not None)
+            for c in spec.constants
+        )
+    return samples
+
+
+def _time(classify, samples: list[tuple[str, bool]]) -> float:
+    start = time.perf_counter()
+    for ctx, is_temporal in samples:
+        classify(ctx, is_temporal=is_temporal)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.csg_classify",
+        description="Time CSG constant classification vs. corpus size.",
+    )
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=None,
+        help="Spec directory (default: $DOCODEGO_CYCLE/output/specs)",
+    )
+    parser.add_argument(
+        "--max",
+        type=int,
+        default=64_000,
+        help="Largest sample size (default: 64000)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.directory:
+        directory = Path(args.directory)
+    else:
+        import os
+
+        directory = Path(os.environ.get("DOCODEGO_CYCLE", ".")) / (
+            "output/specs"
+        )
+    if not directory.is_dir():
+        print(f"Error: directory not found: {directory}", file=sys.stderr)
+        return 1
+
+    corpus = _load_constants(directory)
+    if not corpus:
+        print("Error: no constants found", file=sys.stderr)
+        return 1
+
+    mismatches = sum(
+        1 for ctx, temporal in corpus
+        if _classify_constant_group(ctx, is_temporal=temporal)
+        != _reference_classify(ctx, is_temporal=temporal)
+    )
+    print(
+        f"{len(corpus)} corpus constants, "
+        f"{mismatches} classification mismatches vs. reference",
+    )
+
+    rng = random.Random(0)
+    print(
+        f"{'constants':>10} {'index ms':>9} {'us/const':>9} "
+        f"{'regex ms':>9} {'us/const':>9} {'speedup':>8}",
+    )
+    size = 1000
+    while size <= args.max:
+        samples = [rng.choice(corpus) for _ in range(size)]
+        indexed = _time(_classify_constant_group, samples)
+        reference = _time(_reference_classify, samples)
+        print(
+            f"{size:>10} {indexed * 1e3:>9.1f} "
+            f"{indexed / size * 1e6:>9.2f} "
+            f"{reference * 1e3:>9.1f} "
+            f"{reference / size * 1e6:>9.2f} "
+            f"{reference / indexed:>7.1f}x",
+        )
+        size *= 2
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,14 +6,19 @@ import argparse
 import sys
 from pathlib import Path
 
-from scoring_common import add_common_args, fix_encoding, load_dotenv
+from scoring_common import (
+    add_common_args,
+    add_jobs_arg,
+    fix_encoding,
+    load_dotenv,
+)
 
 fix_encoding()
 load_dotenv()
 
 from scoring_common.audit import resolve_audit_dir, write_audit
 
-from .parser import parse_spec
+from .corpus import CorpusCache, load_corpus
 from .reporter import TOOL_KEY, _result_to_dict, format_json, format_text
 from .scorer import score_corpus
 
@@ -32,6 +37,7 @@ def main(argv: list[str] | None = None) -> int:
         help="Directory containing spec files to check",
     )
     add_common_args(parser)
+    add_jobs_arg(parser)
 
     args = parser.parse_args(argv)
 
@@ -52,18 +58,18 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 1
 
-    # Parse all specs
-    specs = []
-    for filepath in md_files:
-        spec = parse_spec(filepath)
-        specs.append(spec)
+    # Parse all specs, reusing cached extracts of unchanged files
+    cache = CorpusCache()
+    index = load_corpus(md_files, cache, jobs=args.jobs)
 
     # Score the corpus
     result = score_corpus(
-        specs,
+        index.specs,
         threshold=args.threshold,
         fail_on_zero_dimension=not args.no_zero_veto,
+        index=index,
     )
+    cache.save()
 
     display_path = directory.as_posix()
 
@@ -27,6 +27,106 @@ TIME_UNITS: dict[str, int] = {
     "weeks": 604800,
 }
 
+# ── Unit families ─────────────────────────────────────────────────────
+# Each extracted unit belongs to a family with a base unit, so that
+# "5 MB" and "5120 KB" (or "2 hours" and "120 minutes") normalize to
+# the same value. Binary multiples, as upload limits are written.
+
+BYTE_UNITS: dict[str, int] = {
+    "byte": 1,
+    "bytes": 1,
+    "kb": 1024,
+    "mb": 1024 ** 2,
+    "gb": 1024 ** 3,
+}
+
+PIXEL_UNITS: dict[str, int] = {
+    "pixel": 1,
+    "pixels": 1,
+    "px": 1,
+}
+
+# Count nouns → family name (singular, plural and short spellings)
+COUNT_UNITS: dict[str, str] = {
+    "retry": "retries",
+    "retries": "retries",
+    "attempt": "attempts",
+    "attempts": "attempts",
+    "digit": "digits",
+    "digits": "digits",
+    "character": "characters",
+    "characters": "characters",
+    "char": "characters",
+    "chars": "characters",
+    "item": "items",
+    "items": "items",
+    "option": "options",
+    "options": "options",
+    "entries": "entries",
+    "member": "members",
+    "members": "members",
+    "session": "sessions",
+    "sessions": "sessions",
+    "record": "records",
+    "records": "records",
+    "row": "rows",
+    "rows": "rows",
+}
+
+
+def unit_family(unit: str) -> tuple[str, int] | None:
+    """Return (family, multiplier to base unit), or None if unitless."""
+    unit = unit.lower()
+    if unit in TIME_UNITS:
+        return "time", TIME_UNITS[unit]
+    if unit in BYTE_UNITS:
+        return "bytes", BYTE_UNITS[unit]
+    if unit in PIXEL_UNITS:
+        return "pixels", PIXEL_UNITS[unit]
+    if unit in COUNT_UNITS:
+        return COUNT_UNITS[unit], 1
+    return None
+
+
+# Display units per family, largest first, as (multiplier, singular,
+# plural): a normalized value is shown in the largest unit that divides
+# it evenly ("7 days", not "604800 seconds").
+READABLE_UNITS: dict[str, list[tuple[int, str, str]]] = {
+    "time": [
+        (86400, "day", "days"),
+        (3600, "hour", "hours"),
+        (60, "minute", "minutes"),
+        (1, "second", "seconds"),
+    ],
+    "bytes": [
+        (1024 ** 3, "GB", "GB"),
+        (1024 ** 2, "MB", "MB"),
+        (1024, "KB", "KB"),
+        (1, "byte", "bytes"),
+    ],
+    "pixels": [(1, "px", "px")],
+}
+
+
+def format_number(value: float) -> str:
+    """*value* without a trailing ``.0`` ("3", "2.5")."""
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def format_quantity(normalized: float, family: str) -> str | None:
+    """Render a base-unit value of *family* in a readable unit, or
+    None for families without display units (counts, unitless)."""
+    units = READABLE_UNITS.get(family)
+    if not units:
+        return None
+    for multiplier, singular, plural in units:
+        count = normalized / multiplier
+        if count >= 1 and count.is_integer():
+            break
+    unit = singular if count == 1 else plural
+    return f"{format_number(count)} {unit}"
+
+
 # ── HTTP status context keywords ──────────────────────────────────────
 # Each status code maps to keywords that indicate correct usage.
 
@@ -0,0 +1,63 @@
+"""Aho-Corasick keyword automaton — all keywords in one pass."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class KeywordAutomaton:
+    """Find which of a fixed set of keywords occur in a text.
+
+    Matches are plain substrings, exactly like ``keyword in text``
+    for each keyword, but the text is scanned once regardless of
+    how many keywords there are. The trie's failure links are folded
+    into a full transition table at build time, so scanning is one
+    dict lookup per character.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: list[str] = list(dict.fromkeys(keywords))
+
+        # Trie: goto[state][char] -> state, out[state] = keyword ids
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[int, ...]] = [()]
+        for kw_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    out.append(())
+                    nxt = len(goto) - 1
+                    goto[state][ch] = nxt
+                state = nxt
+            out[state] += (kw_id,)
+
+        # Breadth-first: each state's failure target is shallower, so
+        # its transitions and outputs are complete when needed
+        delta: list[dict[str, int]] = [dict(goto[0])] * len(goto)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] += out[fail[state]]
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+
+        self._delta = delta
+        self._out = out
+
+    def find(self, text: str) -> set[str]:
+        """Return the keywords that occur anywhere in *text*."""
+        delta = self._delta
+        out = self._out
+        state = 0
+        found: set[int] = set()
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return {self.keywords[kw_id] for kw_id in found}
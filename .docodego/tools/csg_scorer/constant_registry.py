@@ -0,0 +1,240 @@
+"""Corpus constant registry — classified constants in sorted arrays.
+
+Constants are grouped by semantic group (``_SEMANTIC_GROUPS`` in
+``dim_constants_http``) and each group keeps its normalized values in
+a sorted array, so range and "where is this limit defined" queries
+are binary searches and consistency checks are one linear pass over
+sorted runs.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+from .types import ExtractedConstant
+
+# Values of one unit family within this ratio of a cluster's lowest
+# value are near misses (15 vs 16 minutes, 5 vs 6 retries) rather
+# than deliberately different settings.
+NEAR_MISS_RATIO = 1.25
+
+# Outliers need a clear majority: at least this many specs, all but
+# one of which define a value in the same cluster.
+OUTLIER_MIN_SPECS = 3
+
+
+@dataclass
+class ValueCluster:
+    """Constants of one unit family whose values lie close together."""
+
+    family: str
+    constants: list[ExtractedConstant] = field(default_factory=list)
+
+    @property
+    def spec_names(self) -> set[str]:
+        return {c.spec_name for c in self.constants}
+
+    def values_by_spec(self) -> dict[str, set[float]]:
+        per_spec: dict[str, set[float]] = {}
+        for c in self.constants:
+            per_spec.setdefault(c.spec_name, set()).add(c.comparable)
+        return per_spec
+
+
+@dataclass
+class Outlier:
+    """A spec whose values sit outside the cluster every other spec
+    in its group shares."""
+
+    spec_name: str
+    constants: list[ExtractedConstant]
+    majority: ValueCluster
+
+
+class ConstantGroup:
+    """Constants of one semantic group, in corpus and value order."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.constants: list[ExtractedConstant] = []
+        self._values: list[float] = []
+        self._by_value: list[ExtractedConstant] = []
+        # Unit family → (values, constants), each ascending by value
+        self._families: dict[
+            str, tuple[list[float], list[ExtractedConstant]]
+        ] = {}
+        self._sorted = True
+
+    def add(self, constant: ExtractedConstant) -> None:
+        self.constants.append(constant)
+        self._sorted = False
+
+    def _ensure_sorted(self) -> None:
+        if self._sorted:
+            return
+        # Stable sort: equal values stay in corpus order
+        self._by_value = sorted(self.constants, key=lambda c: c.comparable)
+        self._values = [c.comparable for c in self._by_value]
+        self._families = {}
+        for c in self._by_value:
+            values, constants = self._families.setdefault(c.family, ([], []))
+            values.append(c.comparable)
+            constants.append(c)
+        self._sorted = True
+
+    @property
+    def values(self) -> list[float]:
+        """Normalized values, ascending."""
+        self._ensure_sorted()
+        return self._values
+
+    @property
+    def spec_names(self) -> set[str]:
+        return {c.spec_name for c in self.constants}
+
+    def in_range(
+        self,
+        low: float | None = None,
+        high: float | None = None,
+        *,
+        family: str,
+    ) -> list[ExtractedConstant]:
+        """Constants of unit *family* with ``low <= normalized value
+        <= high``; values of different families are never compared."""
+        self._ensure_sorted()
+        values, constants = self._families.get(family, ([], []))
+        lo = 0 if low is None else bisect_left(values, low)
+        hi = len(values) if high is None else bisect_right(values, high)
+        return constants[lo:hi]
+
+    def where(self, value: float, *, family: str) -> list[ExtractedConstant]:
+        """Constants of unit *family* defining exactly *value* (in base
+        units)."""
+        return self.in_range(value, value, family=family)
+
+    def spec_ranges(self) -> dict[str, tuple[float, float]]:
+        """(lowest, highest) normalized value per spec."""
+        self._ensure_sorted()
+        ranges: dict[str, tuple[float, float]] = {}
+        for c, value in zip(self._by_value, self._values):
+            low, _ = ranges.get(c.spec_name, (value, value))
+            ranges[c.spec_name] = (low, value)
+        return ranges
+
+    def shared_values(self) -> list[float]:
+        """Values that every contributing spec defines."""
+        self._ensure_sorted()
+        needed = len(self.spec_names)
+        shared: list[float] = []
+        i = 0
+        while i < len(self._values):
+            j = bisect_right(self._values, self._values[i], lo=i)
+            specs = {c.spec_name for c in self._by_value[i:j]}
+            if len(specs) == needed:
+                shared.append(self._values[i])
+            i = j
+        return shared
+
+    def clusters(self, ratio: float = NEAR_MISS_RATIO) -> list[ValueCluster]:
+        """Sweep values by (family, value) into clusters, O(n log n).
+
+        A cluster starts at its lowest value and takes every later
+        value of the same family up to ``lowest * ratio``.
+        """
+        ordered = sorted(
+            self.constants, key=lambda c: (c.family, c.comparable),
+        )
+        clusters: list[ValueCluster] = []
+        start = 0.0
+        for c in ordered:
+            value = c.comparable
+            current = clusters[-1] if clusters else None
+            if (
+                current is None
+                or current.family != c.family
+                or value > start * ratio
+                or (start <= 0 and value != start)
+            ):
+                current = ValueCluster(family=c.family)
+                clusters.append(current)
+                start = value
+            current.constants.append(c)
+        return clusters
+
+    def near_misses(
+        self, ratio: float = NEAR_MISS_RATIO,
+    ) -> list[ValueCluster]:
+        """Clusters where specs use close but different values and no
+        single value is shared by every spec in the cluster."""
+        misses: list[ValueCluster] = []
+        for cluster in self.clusters(ratio):
+            per_spec = cluster.values_by_spec()
+            if len(per_spec) < 2:
+                continue
+            if set.intersection(*per_spec.values()):
+                continue
+            misses.append(cluster)
+        return misses
+
+    def outliers(self, ratio: float = NEAR_MISS_RATIO) -> list[Outlier]:
+        """Specs that disagree with a cluster shared by all others."""
+        found: list[Outlier] = []
+        by_family: dict[str, list[ValueCluster]] = {}
+        for cluster in self.clusters(ratio):
+            by_family.setdefault(cluster.family, []).append(cluster)
+        for clusters in by_family.values():
+            family_specs = set().union(*(c.spec_names for c in clusters))
+            if len(family_specs) < OUTLIER_MIN_SPECS:
+                continue
+            for cluster in clusters:
+                missing = family_specs - cluster.spec_names
+                if len(missing) != 1:
+                    continue
+                spec_name = missing.pop()
+                found.append(Outlier(
+                    spec_name=spec_name,
+                    constants=[
+                        c for other in clusters for c in other.constants
+                        if c.spec_name == spec_name
+                    ],
+                    majority=cluster,
+                ))
+                break
+        return found
+
+
+class ConstantRegistry:
+    """Every classified constant of a corpus, by semantic group."""
+
+    def __init__(self) -> None:
+        self.groups: dict[str, ConstantGroup] = {}
+
+    def add(self, group_name: str, constant: ExtractedConstant) -> None:
+        group = self.groups.get(group_name)
+        if group is None:
+            group = self.groups[group_name] = ConstantGroup(group_name)
+        group.add(constant)
+
+    def group(self, group_name: str) -> ConstantGroup | None:
+        return self.groups.get(group_name)
+
+    def cross_spec_groups(self) -> list[ConstantGroup]:
+        """Groups defined by two or more specs, in first-seen order."""
+        return [g for g in self.groups.values() if len(g.spec_names) >= 2]
+
+    def in_range(
+        self,
+        low: float | None = None,
+        high: float | None = None,
+        *,
+        family: str,
+    ) -> list[tuple[str, ExtractedConstant]]:
+        """(group, constant) pairs of unit *family* whose value lies in
+        [low, high], so a bytes range never picks up seconds or pixels.
+        """
+        return [
+            (name, c)
+            for name, group in self.groups.items()
+            for c in group.in_range(low, high, family=family)
+        ]
@@ -0,0 +1,283 @@
+"""Incremental corpus loading — per-spec extracts and cross-spec
+verdicts cached by content hash.
+
+Extraction depends only on one file, so each spec's
+``ParsedCorpusSpec`` is stored under a key derived from its name and
+content. Data derived from one spec (e.g. constant classification)
+is stored under the same key, and every cross-spec verdict (one
+constant group, one role's permission pairs) under a key built from
+the keys of the specs that contribute to it. Editing one spec
+changes only its own key, so only the groups and roles it takes part
+in are recomputed on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+from scoring_common import CACHE_DIR
+from scoring_common.parallel import parallel_map
+
+from .parser import parse_spec_text
+from .types import (
+    ExtractedConstant,
+    HttpStatusMention,
+    ParsedCorpusSpec,
+    PermissionRow,
+    StateTransition,
+)
+
+T = TypeVar("T")
+
+# Disk cache: .docodego/tools/.cache/csg/corpus.json
+CORPUS_CACHE_PATH = CACHE_DIR / "csg" / "corpus.json"
+
+# Bump when the cache file layout changes. Changes to extraction or
+# cached checks are caught by the source fingerprint below.
+CORPUS_CACHE_VERSION = 4
+CORPUS_CACHE_LIMIT = 50_000
+
+_SECTIONS = ("specs", "derived", "verdicts")
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint() -> str:
+    """Digest of the CSG and shared-module sources.
+
+    Extracts, per-spec data and verdicts are all produced by this
+    code, so any edit to it invalidates the whole cache.
+    """
+    root = Path(__file__).resolve().parent
+    digest = hashlib.sha256()
+    for package in (root, root.parent / "scoring_common"):
+        for source in sorted(package.glob("*.py")):
+            digest.update(source.name.encode() + b"\0")
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _spec_key(name: str, raw: bytes) -> str:
+    # Extracted rows embed the spec name, so it is part of the key
+    return hashlib.sha256(name.encode() + b"\0" + raw).hexdigest()
+
+
+def _decode(raw: bytes) -> str:
+    """Decode like ``Path.read_text`` (universal newlines)."""
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# ── Extract (de)serialization ─────────────────────────────────────────
+
+
+def _dump_spec(spec: ParsedCorpusSpec) -> dict:
+    data = asdict(spec)
+    del data["filepath"]
+    return data
+
+
+def _load_spec(data: dict, filepath: Path) -> ParsedCorpusSpec:
+    return ParsedCorpusSpec(
+        filepath=filepath,
+        name=data["name"],
+        business_rules=data["business_rules"],
+        constraints=data["constraints"],
+        acceptance_criteria=data["acceptance_criteria"],
+        permission_rows=[
+            PermissionRow(**row) for row in data["permission_rows"]
+        ],
+        state_transitions=[
+            StateTransition(**row) for row in data["state_transitions"]
+        ],
+        http_status_mentions=[
+            HttpStatusMention(**row)
+            for row in data["http_status_mentions"]
+        ],
+        constants=[ExtractedConstant(**row) for row in data["constants"]],
+    )
+
+
+# ── Disk cache ────────────────────────────────────────────────────────
+
+
+class CorpusCache:
+    """Extracts, per-spec derived data and verdicts in one JSON file."""
+
+    def __init__(self, path: Path = CORPUS_CACHE_PATH) -> None:
+        self.path = path
+        self._entries: dict[str, dict] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = {section: {} for section in _SECTIONS}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if (
+                    data.get("version") == CORPUS_CACHE_VERSION
+                    and data.get("code") == _code_fingerprint()
+                ):
+                    for section in _SECTIONS:
+                        self._entries[section] = dict(data[section])
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+        return self._entries
+
+    def get(self, section: str, key: str) -> object | None:
+        return self._load()[section].get(key)
+
+    def put(self, section: str, key: str, value: object) -> None:
+        self._load()[section][key] = value
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed, dropping the oldest entries."""
+        if not self._dirty or self._entries is None:
+            return
+        data: dict[str, object] = {
+            "version": CORPUS_CACHE_VERSION, "code": _code_fingerprint(),
+        }
+        for section in _SECTIONS:
+            entries = list(self._entries[section].items())
+            data[section] = dict(entries[-CORPUS_CACHE_LIMIT:])
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps(data, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            tmp.replace(self.path)
+            self._dirty = False
+        except OSError:
+            pass  # cache write failure is non-fatal
+
+
+# ── Corpus index ──────────────────────────────────────────────────────
+
+
+class CorpusIndex:
+    """The specs of one corpus plus memo tables keyed by content.
+
+    Without a cache (or for specs that were not loaded through
+    ``load_corpus``), memos live for this index only, so scoring a
+    plain list of specs behaves exactly as before.
+    """
+
+    def __init__(
+        self,
+        specs: list[ParsedCorpusSpec],
+        *,
+        keys: dict[int, str] | None = None,
+        cache: CorpusCache | None = None,
+    ) -> None:
+        self.specs = specs
+        self._keys = keys or {}
+        self._cache = cache
+        self._memo: dict[tuple[str, str], object] = {}
+
+    def spec_key(self, spec: ParsedCorpusSpec) -> str | None:
+        """Content key of *spec*, or None if it was not loaded by key."""
+        return self._keys.get(id(spec))
+
+    def _memoized(
+        self, section: str, key: str | None, compute: Callable[[], T],
+    ) -> T:
+        if key is None:
+            return compute()
+        if (section, key) in self._memo:
+            return self._memo[section, key]
+        value = self._cache.get(section, key) if self._cache else None
+        if value is None:
+            value = compute()
+            if self._cache:
+                self._cache.put(section, key, value)
+        self._memo[section, key] = value
+        return value
+
+    def per_spec(
+        self, kind: str, spec: ParsedCorpusSpec, compute: Callable[[], T],
+    ) -> T:
+        """Data derived from *spec* alone, computed once per content.
+
+        *compute* must return JSON-compatible data; cached values come
+        back with tuples turned into lists.
+        """
+        key = self.spec_key(spec)
+        return self._memoized(
+            "derived", f"{kind}:{key}" if key else None, compute,
+        )
+
+    def aggregate(
+        self,
+        kind: str,
+        name: str,
+        members: Iterable[ParsedCorpusSpec],
+        compute: Callable[[], T],
+    ) -> T:
+        """A cross-spec verdict over *members*, in corpus order.
+
+        Reused while the same specs, with the same content, contribute
+        to *name* in the same order.
+        """
+        keys = [self.spec_key(spec) for spec in members]
+        if any(key is None for key in keys):
+            return compute()
+        digest = hashlib.sha256(
+            "\0".join([kind, name, *keys]).encode(),
+        ).hexdigest()
+        return self._memoized("verdicts", digest, compute)
+
+
+def _extract(item: tuple[str, Path]) -> dict:
+    """Worker: parse one spec and return its compact extract."""
+    text, filepath = item
+    return _dump_spec(parse_spec_text(text, filepath))
+
+
+def load_corpus(
+    md_files: list[Path],
+    cache: CorpusCache | None = None,
+    *,
+    jobs: int = 1,
+) -> CorpusIndex:
+    """Parse *md_files*, reusing cached extracts for unchanged content.
+
+    Files that miss the cache are parsed across *jobs* worker
+    processes; workers return plain-dict extracts, which pickle
+    compactly and are what the cache stores anyway.
+    """
+    extracts: list[dict | None] = []
+    keys: list[str] = []
+    misses: list[tuple[int, tuple[str, Path]]] = []
+    for filepath in md_files:
+        raw = filepath.read_bytes()
+        key = _spec_key(filepath.stem, raw)
+        cached = cache.get("specs", key) if cache else None
+        if cached is None:
+            misses.append((len(extracts), (_decode(raw), filepath)))
+        extracts.append(cached)
+        keys.append(key)
+
+    parsed = parallel_map(_extract, [item for _, item in misses], jobs=jobs)
+    for (pos, _), data in zip(misses, parsed):
+        extracts[pos] = data
+        if cache:
+            cache.put("specs", keys[pos], data)
+
+    specs = [
+        _load_spec(data, filepath)
+        for data, filepath in zip(extracts, md_files)
+    ]
+    return CorpusIndex(
+        specs,
+        keys={id(spec): key for spec, key in zip(specs, keys)},
+        cache=cache,
+    )
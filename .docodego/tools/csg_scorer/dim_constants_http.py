@@ -6,7 +6,10 @@ import re
 
 from scoring_common.types import DimensionResult
 
-from .anti_gaming import HTTP_STATUS_CONTEXT
+from .anti_gaming import HTTP_STATUS_CONTEXT, format_number, format_quantity
+from .automaton import KeywordAutomaton
+from .constant_registry import ConstantGroup, ConstantRegistry
+from .corpus import CorpusIndex
 from .types import (
     ExtractedConstant,
     HttpStatusMention,
@@ -45,26 +48,94 @@ _NON_TEMPORAL_GROUPS: set[str] = {
 }
 
 
-# ── Dimension 1: Shared Constants (0-25) ─────────────────────────────
+# ── Keyword index ─────────────────────────────────────────────────────
+# A keyword matches when it appears at the start of a word (regex
+# "\b" + keyword), i.e. some \w+ token of the context begins with it.
+# Each context is tokenized once and token prefixes are looked up in
+# a keyword → groups index, so classification no longer runs one
+# regex per group keyword. Multi-word keywords ("time out") keep a
+# word-boundary regex, searched only when their first word occurs
+# as a whole token.
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class _KeywordIndex:
+    """Precomputed keyword → group lookup over ``_SEMANTIC_GROUPS``."""
+
+    def __init__(
+        self, groups: list[tuple[str, list[str], int, bool]],
+    ) -> None:
+        self.groups = groups
+        # Group indices (priority order) each keyword belongs to
+        self.groups_by_keyword: dict[str, list[int]] = {}
+        # Single-word keywords, matched as token prefixes
+        self.stems: set[str] = set()
+        # Multi-word keywords by their first word
+        self.phrases: dict[str, list[tuple[str, re.Pattern[str]]]] = {}
+        # Groups that need no keyword hits at all
+        self.unconditional: set[int] = set()
+
+        for idx, (_, keywords, min_hits, _) in enumerate(groups):
+            if min_hits <= 0:
+                self.unconditional.add(idx)
+            for kw in keywords:
+                self.groups_by_keyword.setdefault(kw, []).append(idx)
+                lead = _WORD_RE.match(kw)
+                if lead is None:
+                    continue  # cannot follow a word boundary
+                if lead.end() == len(kw):
+                    self.stems.add(kw)
+                else:
+                    self.phrases.setdefault(lead.group(), []).append(
+                        (kw, re.compile(r"\b" + re.escape(kw))),
+                    )
+        self.stem_lengths = sorted({len(kw) for kw in self.stems})
+        # Shortest-stem prefixes — most tokens fail this single lookup
+        head = self.stem_lengths[0] if self.stem_lengths else 0
+        self.head_length = head
+        self.heads = {kw[:head] for kw in self.stems}
+
+    def match(self, text: str) -> set[str]:
+        """Return every keyword that occurs at a word start in *text*."""
+        lower = text.lower()
+        tokens = _WORD_RE.findall(lower)
+        found: set[str] = set()
+        for token in tokens:
+            if token[:self.head_length] not in self.heads:
+                continue
+            for length in self.stem_lengths:
+                if length > len(token):
+                    break
+                if token[:length] in self.stems:
+                    found.add(token[:length])
+        if self.phrases:
+            for lead in self.phrases.keys() & set(tokens):
+                for kw, pattern in self.phrases[lead]:
+                    if pattern.search(lower):
+                        found.add(kw)
+        return found
 
-# Pre-compiled word-boundary patterns for each keyword
-_KW_PATTERNS: dict[str, re.Pattern[str]] = {}
+    def candidates(self, found: set[str]) -> list[int]:
+        """Indices of groups that can match *found*, by priority."""
+        indices = set(self.unconditional)
+        for kw in found:
+            indices.update(self.groups_by_keyword[kw])
+        return sorted(indices)
 
 
-def _kw_match(keyword: str, text: str) -> bool:
-    """Check if *keyword* appears as a whole word in *text*."""
-    pat = _KW_PATTERNS.get(keyword)
-    if pat is None:
-        pat = re.compile(r"\b" + re.escape(keyword), re.I)
-        _KW_PATTERNS[keyword] = pat
-    return pat.search(text) is not None
+_KEYWORD_INDEX = _KeywordIndex(_SEMANTIC_GROUPS)
+
+
+# ── Dimension 1: Shared Constants (0-25) ─────────────────────────────
 
 
 def _classify_constant_group(
     ctx: str, *, is_temporal: bool = False,
 ) -> str | None:
-    lower = ctx.lower()
-    for group_name, keywords, min_hits, temporal_only in _SEMANTIC_GROUPS:
+    found = _KEYWORD_INDEX.match(ctx)
+    for idx in _KEYWORD_INDEX.candidates(found):
+        group_name, keywords, min_hits, temporal_only = _SEMANTIC_GROUPS[idx]
         # Skip non-temporal groups for time-unit constants
         if is_temporal and group_name in _NON_TEMPORAL_GROUPS:
             continue
@@ -73,9 +144,7 @@ def _classify_constant_group(
             continue
         # Deduplicate overlapping keywords — if stem "expir" already
         # matched, longer form "expires" is redundant (1 concept)
-        matched: list[str] = [
-            kw for kw in keywords if _kw_match(kw, lower)
-        ]
+        matched: list[str] = [kw for kw in keywords if kw in found]
         unique = []
         for kw in sorted(matched, key=len):
             if not any(other in kw for other in unique):
@@ -85,37 +154,145 @@ def _classify_constant_group(
     return None
 
 
+def spec_constant_groups(
+    constants: list[ExtractedConstant],
+) -> list[str | None]:
+    """Semantic group of each constant of one spec (None = ungrouped)."""
+    return [
+        _classify_constant_group(
+            c.context, is_temporal=c.normalized_seconds is not None,
+        )
+        for c in constants
+    ]
+
+
+def _check_constant_group(group: ConstantGroup) -> tuple[bool, str]:
+    """Return (consistent, issue) for one cross-spec constant group."""
+    # If any single spec's values span a wide range (>5x), the
+    # group is mixing sub-concepts (e.g. session TTL 604800s vs
+    # refresh window 86400s) — skip consistency check.
+    for lo, hi in group.spec_ranges().values():
+        if lo > 0 and hi / lo > 5:
+            return True, ""
+
+    if group.shared_values():
+        return True, ""
+
+    return False, (
+        f"Inconsistent '{group.name}': "
+        + ", ".join(_constant_details(group.constants)[:4])
+    )
+
+
+def _source_value(c: ExtractedConstant) -> str:
+    """The constant as written in its spec, e.g. "15 minutes"."""
+    return f"{format_number(c.value)} {c.unit}"
+
+
+def _constant_details(constants: list[ExtractedConstant]) -> list[str]:
+    """One "spec=value unit (lines N, M)" entry per spec.
+
+    Values are compared normalized, so a value a spec repeats, or
+    states in two units ("1 hour (3600 seconds)"), is listed once
+    with every line it appears on; different values of one spec are
+    joined with " / ".
+    """
+    by_spec: dict[str, dict[float, tuple[ExtractedConstant, list[int]]]] = {}
+    for c in constants:
+        values = by_spec.setdefault(c.spec_name, {})
+        _, lines = values.setdefault(c.comparable, (c, []))
+        if c.line_num not in lines:
+            lines.append(c.line_num)
+    spec_details: list[str] = []
+    for spec_name, values in by_spec.items():
+        stated = []
+        for c, lines in values.values():
+            label = "line" if len(lines) == 1 else "lines"
+            stated.append(
+                f"{_source_value(c)} ({label} "
+                f"{', '.join(map(str, lines))})",
+            )
+        spec_details.append(f"{spec_name}=" + " / ".join(stated))
+    return spec_details
+
+
+def _constant_drift(group: ConstantGroup) -> list[str]:
+    """Near-miss clusters and outliers of one group, as suggestions."""
+    findings: list[str] = []
+    for cluster in group.near_misses():
+        findings.append(
+            f"Near-miss values for '{group.name}': "
+            + ", ".join(_constant_details(cluster.constants)[:4]),
+        )
+    for outlier in group.outliers():
+        typical = outlier.majority.constants[0]
+        shown = (
+            format_quantity(typical.comparable, typical.family)
+            or _source_value(typical)
+        )
+        others = len(outlier.majority.spec_names)
+        findings.append(
+            f"Outlier for '{group.name}': "
+            + ", ".join(_constant_details(outlier.constants)[:2])
+            + f" vs {shown} in {others} other spec(s)",
+        )
+    return findings
+
+
+def build_constant_registry(
+    specs: list[ParsedCorpusSpec],
+    *,
+    index: CorpusIndex | None = None,
+) -> tuple[ConstantRegistry, dict[str, list[ParsedCorpusSpec]]]:
+    """Classify every constant into a registry.
+
+    Also returns the specs contributing to each group, in corpus
+    order, which key the cached per-group verdicts.
+    """
+    if index is None:
+        index = CorpusIndex(specs)
+    registry = ConstantRegistry()
+    members: dict[str, list[ParsedCorpusSpec]] = {}
+    for spec in specs:
+        if not spec.constants:
+            continue
+        spec_groups = index.per_spec(
+            "constant-groups", spec,
+            lambda: spec_constant_groups(spec.constants),
+        )
+        for c, group in zip(spec.constants, spec_groups):
+            if group is None:
+                continue
+            registry.add(group, c)
+            spec_members = members.setdefault(group, [])
+            if not spec_members or spec_members[-1] is not spec:
+                spec_members.append(spec)
+    return registry, members
+
+
 def score_shared_constants(
     specs: list[ParsedCorpusSpec],
+    *,
+    index: CorpusIndex | None = None,
 ) -> DimensionResult:
-    """Score consistency of shared constants across specs."""
-    result = DimensionResult(name="Shared Constants", score=0)
+    """Score consistency of shared constants across specs.
 
-    all_constants: list[ExtractedConstant] = []
-    for spec in specs:
-        all_constants.extend(spec.constants)
+    With an *index*, per-spec classification and per-group verdicts
+    are reused for specs whose content has not changed.
+    """
+    result = DimensionResult(name="Shared Constants", score=0)
+    if index is None:
+        index = CorpusIndex(specs)
 
-    if not all_constants:
+    if not any(spec.constants for spec in specs):
         result.score = 25
         result.suggestions.append(
             "No numeric constants found across specs",
         )
         return result
 
-    groups: dict[str, list[ExtractedConstant]] = {}
-    for c in all_constants:
-        is_temporal = c.normalized_seconds is not None
-        group = _classify_constant_group(
-            c.context, is_temporal=is_temporal,
-        )
-        if group is not None:
-            groups.setdefault(group, []).append(c)
-
-    cross_spec_groups: dict[str, list[ExtractedConstant]] = {}
-    for group_name, constants in groups.items():
-        spec_names = {c.spec_name for c in constants}
-        if len(spec_names) >= 2:
-            cross_spec_groups[group_name] = constants
+    registry, members = build_constant_registry(specs, index=index)
+    cross_spec_groups = registry.cross_spec_groups()
 
     if not cross_spec_groups:
         result.score = 25
@@ -124,55 +301,27 @@ def score_shared_constants(
     total_groups = len(cross_spec_groups)
     consistent = 0
 
-    for group_name, constants in cross_spec_groups.items():
-        per_spec: dict[str, set[float]] = {}
-        for c in constants:
-            val = (
-                c.normalized_seconds
-                if c.normalized_seconds is not None
-                else c.value
-            )
-            per_spec.setdefault(c.spec_name, set()).add(val)
-
-        # If any single spec's values span a wide range (>5x), the
-        # group is mixing sub-concepts (e.g. session TTL 604800s vs
-        # refresh window 86400s) — skip consistency check.
-        mixed = False
-        for vs in per_spec.values():
-            if len(vs) >= 2:
-                lo, hi = min(vs), max(vs)
-                if lo > 0 and hi / lo > 5:
-                    mixed = True
-                    break
-        if mixed:
-            consistent += 1
-            continue
-
-        all_values = [vs for vs in per_spec.values()]
-        common = all_values[0]
-        for vs in all_values[1:]:
-            common = common & vs
-
-        if common:
+    for group in cross_spec_groups:
+        is_consistent, issue = index.aggregate(
+            "constant-group", group.name, members[group.name],
+            lambda: _check_constant_group(group),
+        )
+        if is_consistent:
             consistent += 1
         else:
-            spec_details: list[str] = []
-            seen: set[str] = set()
-            for c in constants:
-                key = f"{c.spec_name}={c.value} {c.unit}"
-                if key not in seen:
-                    seen.add(key)
-                    spec_details.append(
-                        f"{key} (line {c.line_num})",
-                    )
-            result.issues.append(
-                f"Inconsistent '{group_name}': "
-                + ", ".join(spec_details[:4]),
-            )
+            result.issues.append(issue)
             result.suggestions.append(
-                f"Reconcile '{group_name}' values across specs",
+                f"Reconcile '{group.name}' values across specs",
             )
 
+    # Informational drift report — close-but-different values and
+    # single-spec outliers that exact matching does not catch
+    for group in cross_spec_groups:
+        result.suggestions.extend(index.aggregate(
+            "constant-drift", group.name, members[group.name],
+            lambda: _constant_drift(group),
+        ))
+
     ratio = consistent / total_groups if total_groups > 0 else 1.0
     if ratio >= 1.0:
         result.score = 25
@@ -190,32 +339,44 @@ def score_shared_constants(
 
 # ── Dimension 2: HTTP Status Semantics (0-25) ────────────────────────
 
+# Every context keyword in one automaton; keyword → codes it counts for
+_HTTP_KEYWORDS = KeywordAutomaton(
+    kw for keywords in HTTP_STATUS_CONTEXT.values() for kw in keywords
+)
+_CODES_BY_KEYWORD: dict[str, list[int]] = {}
+for _code, _keywords in HTTP_STATUS_CONTEXT.items():
+    for _kw in _keywords:
+        _CODES_BY_KEYWORD.setdefault(_kw, []).append(_code)
+
+
+def _status_keyword_hits(context: str) -> dict[int, int]:
+    """Count distinct context keywords per status code in one pass."""
+    hits = dict.fromkeys(HTTP_STATUS_CONTEXT, 0)
+    for kw in _HTTP_KEYWORDS.find(context.lower()):
+        for code in _CODES_BY_KEYWORD[kw]:
+            hits[code] += 1
+    return hits
+
 
 def _classify_http_context(
     code: int, context: str,
 ) -> tuple[bool, str]:
-    lower = context.lower()
     if code not in HTTP_STATUS_CONTEXT:
         return True, ""
 
-    own_keywords = HTTP_STATUS_CONTEXT[code]
-    own_hits = sum(1 for kw in own_keywords if kw in lower)
-
-    other_hits: dict[int, int] = {}
-    for other_code, other_keywords in HTTP_STATUS_CONTEXT.items():
-        if other_code == code:
-            continue
-        hits = sum(1 for kw in other_keywords if kw in lower)
-        if hits > 0:
-            other_hits[other_code] = hits
-
-    if own_hits > 0:
+    hits = _status_keyword_hits(context)
+    if hits[code] > 0:
         return True, ""
 
-    for other_code, hits in sorted(
+    other_hits = {
+        other_code: count
+        for other_code, count in hits.items()
+        if other_code != code and count > 0
+    }
+    for other_code, count in sorted(
         other_hits.items(), key=lambda x: -x[1],
     ):
-        if hits >= 2:
+        if count >= 2:
             return False, f"{code} used in {other_code} context"
 
     return True, ""
@@ -240,11 +401,14 @@ def score_http_status_semantics(
 
     correct = 0
     total = len(relevant)
+    # The same status line is often repeated verbatim across specs
+    verdicts: dict[tuple[int, str], tuple[bool, str]] = {}
 
     for mention in relevant:
-        is_correct, reason = _classify_http_context(
-            mention.code, mention.context,
-        )
+        key = (mention.code, mention.context)
+        if key not in verdicts:
+            verdicts[key] = _classify_http_context(*key)
+        is_correct, reason = verdicts[key]
         if is_correct:
             correct += 1
         else:
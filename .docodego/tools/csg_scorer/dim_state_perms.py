@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 
 from scoring_common.types import DimensionResult
 
 from .anti_gaming import TERMINAL_STATES, role_level
+from .corpus import CorpusIndex
+from .state_graph import StateGraph
 from .types import (
     ParsedCorpusSpec,
     PermissionRow,
@@ -38,13 +41,65 @@ _FILLER = {
 # ── Dimension 3: State Machine Consistency (0-25) ────────────────────
 
 
+def _spec_graph_findings(
+    transitions: list[StateTransition],
+) -> tuple[bool, list[str]]:
+    """(has unreachable states, states with guard conflicts) of one spec."""
+    graph = StateGraph(transitions)
+    return (
+        bool(graph.unreachable_states()),
+        [conflict.state for conflict in graph.guard_conflicts()],
+    )
+
+
+def _suggest_spec_graph_fixes(
+    result: DimensionResult,
+    specs: list[ParsedCorpusSpec],
+    index: CorpusIndex,
+) -> None:
+    """Informational per-spec checks — reported, never scored.
+
+    State names are local to a spec's table, so reachability and
+    guard ambiguity are judged on each spec's own graph.
+    """
+    unreachable: list[str] = []
+    ambiguous: list[str] = []
+    for spec in specs:
+        if not spec.state_transitions:
+            continue
+        has_unreachable, conflict_states = index.per_spec(
+            "state-graph", spec,
+            lambda: _spec_graph_findings(spec.state_transitions),
+        )
+        if has_unreachable:
+            unreachable.append(spec.name)
+        for state in conflict_states:
+            ambiguous.append(f"{spec.name} ('{state}')")
+
+    if unreachable:
+        result.suggestions.append(
+            f"{len(unreachable)} spec(s) have states unreachable from "
+            f"their initial state: {', '.join(unreachable[:3])}",
+        )
+    if ambiguous:
+        result.suggestions.append(
+            f"{len(ambiguous)} state(s) have transitions to different "
+            f"targets on the same trigger and guard: "
+            f"{', '.join(ambiguous[:3])}",
+        )
+
+
 def score_state_machine_consistency(
     specs: list[ParsedCorpusSpec],
+    *,
+    index: CorpusIndex | None = None,
 ) -> DimensionResult:
     """Score cross-spec state machine transition consistency."""
     result = DimensionResult(
         name="State Machine Consistency", score=0,
     )
+    if index is None:
+        index = CorpusIndex(specs)
 
     all_transitions: list[StateTransition] = []
     for spec in specs:
@@ -54,31 +109,21 @@ def score_state_machine_consistency(
         result.score = 25
         return result
 
-    from_states: set[str] = set()
-    to_states: set[str] = set()
-    for t in all_transitions:
-        if t.from_state and t.from_state != "(none)":
-            from_states.add(t.from_state)
-        to_states.add(t.to_state)
+    graph = StateGraph(all_transitions)
 
     issues_found = 0
     total_checks = 0
 
-    only_targets = to_states - from_states
-    for state in only_targets:
+    for state in graph.dead_ends():
         normalized = state.lower().replace(" ", "_")
         if any(t in normalized for t in TERMINAL_STATES):
             continue
         if any(p in normalized for p in _LEAF_STEMS):
             continue
         base = re.sub(r"\s*\(.*?\)", "", normalized).strip()
-        if base in from_states:
+        if graph.adjacency.get(base):
             continue
-        referencing = [
-            t.spec_name for t in all_transitions
-            if t.to_state == state
-        ]
-        unique_specs = sorted(set(referencing))
+        unique_specs = graph.referencing_specs(state)
         if len(unique_specs) < 2:
             continue
         total_checks += 1
@@ -89,18 +134,12 @@ def score_state_machine_consistency(
         )
 
     # Check for ambiguous states across specs
-    state_guards: dict[str, list[tuple[str, str]]] = {}
-    for t in all_transitions:
-        if t.guard:
-            state_guards.setdefault(t.from_state, []).append(
-                (t.spec_name, t.guard),
-            )
-
-    for state, guards in state_guards.items():
-        spec_names = {g[0] for g in guards}
+    for spec_names in graph.guarded_specs.values():
         if len(spec_names) >= 2:
             total_checks += 1
 
+    _suggest_spec_graph_fixes(result, specs, index)
+
     if total_checks == 0:
         result.score = 25
         return result
@@ -130,9 +169,11 @@ def _normalize_action_key(action: str) -> str:
     return " ".join(w for w in words if w not in _FILLER)
 
 
-def _actions_overlap(a: str, b: str) -> bool:
-    key_a = set(_normalize_action_key(a).split())
-    key_b = set(_normalize_action_key(b).split())
+def _action_tokens(action: str) -> frozenset[str]:
+    return frozenset(_normalize_action_key(action).split())
+
+
+def _tokens_overlap(key_a: frozenset[str], key_b: frozenset[str]) -> bool:
     if not key_a or not key_b:
         return False
     overlap = key_a & key_b
@@ -145,13 +186,65 @@ def _actions_overlap(a: str, b: str) -> bool:
     return len(overlap) >= min_len * threshold
 
 
+def _cross_spec_pairs(
+    granted: list[PermissionRow], denied: list[PermissionRow],
+) -> int:
+    """Count granted×denied pairs that come from different specs."""
+    denied_per_spec = Counter(d.spec_name for d in denied)
+    return sum(
+        len(denied) - denied_per_spec[g.spec_name] for g in granted
+    )
+
+
+def _role_conflicts(
+    role_name: str, perms: list[PermissionRow],
+) -> tuple[int, list[str]]:
+    """Return (cross-spec pairs, conflict issues) for one role."""
+    granted = [p for p in perms if p.allowed]
+    denied = [p for p in perms if not p.allowed]
+    issues: list[str] = []
+
+    # Actions that share no token can never overlap, so only
+    # denied rows reachable through a shared token are compared
+    denied_tokens = [_action_tokens(d.action) for d in denied]
+    denied_by_token: dict[str, list[int]] = {}
+    for idx, tokens in enumerate(denied_tokens):
+        for token in tokens:
+            denied_by_token.setdefault(token, []).append(idx)
+
+    for g in granted:
+        g_tokens = _action_tokens(g.action)
+        candidates: set[int] = set()
+        for token in g_tokens:
+            candidates.update(denied_by_token.get(token, ()))
+        for idx in sorted(candidates):
+            d = denied[idx]
+            if g.spec_name == d.spec_name:
+                continue
+            if _tokens_overlap(g_tokens, denied_tokens[idx]):
+                issues.append(
+                    f"Conflict for role '{role_name}': "
+                    f"granted in {g.spec_name}, "
+                    f"denied in {d.spec_name}",
+                )
+    return _cross_spec_pairs(granted, denied), issues
+
+
 def score_permission_symmetry(
     specs: list[ParsedCorpusSpec],
+    *,
+    index: CorpusIndex | None = None,
 ) -> DimensionResult:
-    """Score permission consistency and least privilege."""
+    """Score permission consistency and least privilege.
+
+    With an *index*, a role's conflicts are reused while the specs
+    that assign it are unchanged.
+    """
     result = DimensionResult(
         name="Permission Symmetry", score=0,
     )
+    if index is None:
+        index = CorpusIndex(specs)
 
     all_permissions: list[PermissionRow] = []
     for spec in specs:
@@ -163,27 +256,26 @@ def score_permission_symmetry(
 
     # ── Symmetry checks (0-15) ──────────────────────────────────
     by_role: dict[str, list[PermissionRow]] = {}
-    for p in all_permissions:
-        by_role.setdefault(p.role.lower().strip(), []).append(p)
+    members: dict[str, list[ParsedCorpusSpec]] = {}
+    for spec in specs:
+        for p in spec.permission_rows:
+            role_name = p.role.lower().strip()
+            by_role.setdefault(role_name, []).append(p)
+            role_members = members.setdefault(role_name, [])
+            if not role_members or role_members[-1] is not spec:
+                role_members.append(spec)
 
     conflicts = 0
     total_pairs = 0
 
     for role_name, perms in by_role.items():
-        granted = [p for p in perms if p.allowed]
-        denied = [p for p in perms if not p.allowed]
-        for g in granted:
-            for d in denied:
-                if g.spec_name == d.spec_name:
-                    continue
-                total_pairs += 1
-                if _actions_overlap(g.action, d.action):
-                    conflicts += 1
-                    result.issues.append(
-                        f"Conflict for role '{role_name}': "
-                        f"granted in {g.spec_name}, "
-                        f"denied in {d.spec_name}",
-                    )
+        pairs, issues = index.aggregate(
+            "role-permissions", role_name, members[role_name],
+            lambda: _role_conflicts(role_name, perms),
+        )
+        total_pairs += pairs
+        conflicts += len(issues)
+        result.issues.extend(issues)
 
     if total_pairs > 0:
         sym_ratio = (total_pairs - conflicts) / total_pairs
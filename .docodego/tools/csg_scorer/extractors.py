@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import re
 
-from .anti_gaming import TIME_UNITS
+from scoring_common.tables import Table, find_tables
+
+from .anti_gaming import TIME_UNITS, unit_family
 from .types import (
     ExtractedConstant,
     HttpStatusMention,
@@ -42,64 +44,32 @@ _HTTP_STATUS_RE = re.compile(
     r"\b(HTTP\s+)?([1-5]\d{2})\b",
 )
 
-# ── Table parsing ─────────────────────────────────────────────────────
-
-_TABLE_ROW_RE = re.compile(r"^\|(.+)\|$")
-_TABLE_SEP_RE = re.compile(r"^\|[\s\-:|]+\|$")
-
-
 # ── Table parsing helpers ─────────────────────────────────────────────
 
+# Header words of a State Machine table's first two columns; tables
+# laid out differently (e.g. one row per state) carry no transitions
+_FROM_HEADER_RE = re.compile(r"\b(from|current|source)\b", re.I)
+_TO_HEADER_RE = re.compile(r"\b(to|next|target)\b", re.I)
 
-def parse_table_rows(
-    content_lines: list[str],
-) -> list[list[str]]:
-    """Parse markdown table rows into lists of cell values.
-
-    Skips the header separator row. Returns all data rows.
-    """
-    rows: list[list[str]] = []
-    header_found = False
-    separator_found = False
-
-    for line in content_lines:
-        stripped = line.strip()
-        if not _TABLE_ROW_RE.match(stripped):
-            if header_found and separator_found and rows:
-                break
-            continue
-
-        if _TABLE_SEP_RE.match(stripped):
-            separator_found = True
-            continue
-
-        if not header_found:
-            header_found = True
-            cells = [
-                c.strip() for c in stripped.strip("|").split("|")
-            ]
-            rows.append(cells)
-            continue
-
-        if separator_found:
-            cells = [
-                c.strip() for c in stripped.strip("|").split("|")
-            ]
-            rows.append(cells)
 
-    return rows
+def first_table(content_lines: list[str]) -> Table | None:
+    """The first table of a section that has a header separator."""
+    for table in find_tables(content_lines):
+        if table.has_header:
+            return table
+    return None
 
 
 def parse_permission_table(
     content_lines: list[str], spec_name: str,
 ) -> list[PermissionRow]:
     """Parse Permission Model table into PermissionRow objects."""
-    rows = parse_table_rows(content_lines)
-    if len(rows) < 2:
+    table = first_table(content_lines)
+    if table is None:
         return []
 
     result: list[PermissionRow] = []
-    for row in rows[1:]:  # skip header
+    for row in table.rows:
         if len(row) < 3:
             continue
         role = row[0].strip()
@@ -127,13 +97,25 @@ def parse_permission_table(
 def parse_state_machine_table(
     content_lines: list[str], spec_name: str,
 ) -> list[StateTransition]:
-    """Parse State Machine table into StateTransition objects."""
-    rows = parse_table_rows(content_lines)
-    if len(rows) < 2:
+    """Parse State Machine table into StateTransition objects.
+
+    Only a From | To | Trigger | Guard table is read; a table whose
+    first two headers do not name the source and target state yields
+    no transitions.
+    """
+    table = first_table(content_lines)
+    if table is None:
+        return []
+    header = table.header or []
+    if not (
+        len(header) >= 2
+        and _FROM_HEADER_RE.search(header[0])
+        and _TO_HEADER_RE.search(header[1])
+    ):
         return []
 
     result: list[StateTransition] = []
-    for row in rows[1:]:  # skip header
+    for row in table.rows:
         if len(row) < 3:
             continue
         from_state = row[0].strip().lower().replace(" ", "_")
@@ -156,25 +138,58 @@ def parse_state_machine_table(
 # ── Constant extraction ───────────────────────────────────────────────
 
 
+class WordIndex:
+    """Whitespace-split words of a file with per-line word offsets.
+
+    Built once per file. A context window over a range of lines is a
+    slice of ``words`` rather than a re-join and re-split of those
+    lines, and windows are memoized, so several matches on one line
+    share a single window.
+    """
+
+    def __init__(self, lines: list[str]) -> None:
+        self.words: list[str] = []
+        # line_starts[i] = index in words of line i's first word;
+        # the final entry is len(words)
+        self.line_starts: list[int] = []
+        for line in lines:
+            self.line_starts.append(len(self.words))
+            self.words.extend(line.split())
+        self.line_starts.append(len(self.words))
+        self._windows: dict[tuple[int, int, int], str] = {}
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts) - 1
+
+    def window(self, first_line: int, end_line: int, size: int) -> str:
+        """Middle *size* words of lines [first_line, end_line)."""
+        first_line = max(0, first_line)
+        end_line = min(self.line_count, end_line)
+        key = (first_line, end_line, size)
+        cached = self._windows.get(key)
+        if cached is not None:
+            return cached
+        lo = self.line_starts[first_line]
+        hi = self.line_starts[end_line]
+        if hi - lo > size:
+            mid = (hi - lo) // 2
+            lo += max(0, mid - size // 2)
+            hi = min(hi, lo + size)
+        text = " ".join(self.words[lo:hi])
+        self._windows[key] = text
+        return text
+
+
 def _get_context_window(
-    lines: list[str], line_idx: int, window: int = 25,
+    index: WordIndex, line_idx: int, window: int = 25,
 ) -> str:
     """Get a word-based context window around a given line.
 
     Uses ±1 line to keep context tight and avoid bleeding keywords
     from unrelated paragraphs into the classification window.
     """
-    start = max(0, line_idx - 1)
-    end = min(len(lines), line_idx + 2)
-    text = " ".join(lines[start:end])
-    words = text.split()
-    if len(words) <= window:
-        return " ".join(words)
-    mid = len(words) // 2
-    half = window // 2
-    s = max(0, mid - half)
-    e = min(len(words), s + window)
-    return " ".join(words[s:e])
+    return index.window(line_idx - 1, line_idx + 2, window)
 
 
 def _normalize_number(raw: str) -> float:
@@ -186,9 +201,13 @@ def extract_constants_from_text(
     text: str,
     base_line: int,
     spec_name: str,
-    lines_for_context: list[str],
+    word_index: WordIndex,
 ) -> list[ExtractedConstant]:
-    """Extract numeric constants from a section's text."""
+    """Extract numeric constants from a section's text.
+
+    *word_index* indexes the whole file; *base_line* is the
+    section's first line in it.
+    """
     results: list[ExtractedConstant] = []
     text_lines = text.split("\n")
 
@@ -199,9 +218,7 @@ def extract_constants_from_text(
             value = _normalize_number(m.group(1))
             unit = m.group(2).lower()
             multiplier = TIME_UNITS.get(unit, 1)
-            ctx = _get_context_window(
-                lines_for_context, abs_line,
-            )
+            ctx = _get_context_window(word_index, abs_line)
             results.append(ExtractedConstant(
                 value=value,
                 unit=unit,
@@ -209,14 +226,15 @@ def extract_constants_from_text(
                 context=ctx,
                 line_num=abs_line + 1,
                 spec_name=spec_name,
+                family="time",
+                normalized=value * multiplier,
             ))
 
         for m in _COUNT_RE.finditer(line):
             value = _normalize_number(m.group(1))
             unit = m.group(2).lower()
-            ctx = _get_context_window(
-                lines_for_context, abs_line,
-            )
+            family, multiplier = unit_family(unit) or ("", 1)
+            ctx = _get_context_window(word_index, abs_line)
             results.append(ExtractedConstant(
                 value=value,
                 unit=unit,
@@ -224,14 +242,14 @@ def extract_constants_from_text(
                 context=ctx,
                 line_num=abs_line + 1,
                 spec_name=spec_name,
+                family=family,
+                normalized=value * multiplier if family else None,
             ))
 
         for m in _NAMED_RE.finditer(line):
             value = _normalize_number(m.group(2))
             qualifier = m.group(1).lower().strip()
-            ctx = _get_context_window(
-                lines_for_context, abs_line,
-            )
+            ctx = _get_context_window(word_index, abs_line)
             results.append(ExtractedConstant(
                 value=value,
                 unit=qualifier,
@@ -248,25 +266,21 @@ def extract_constants_from_text(
 
 
 def extract_http_statuses(
-    lines: list[str], spec_name: str,
+    lines: list[str],
+    spec_name: str,
+    word_index: WordIndex | None = None,
 ) -> list[HttpStatusMention]:
     """Find all HTTP status code mentions with 30-word context."""
+    if word_index is None:
+        word_index = WordIndex(lines)
     results: list[HttpStatusMention] = []
     for i, line in enumerate(lines):
         for m in _HTTP_STATUS_RE.finditer(line):
             code = int(m.group(2))
             if code < 100 or code > 599:
                 continue
-            # 30-word context window
-            start = max(0, i - 2)
-            end = min(len(lines), i + 3)
-            text = " ".join(lines[start:end])
-            words = text.split()
-            if len(words) > 30:
-                mid = len(words) // 2
-                s = max(0, mid - 15)
-                words = words[s:s + 30]
-            context = " ".join(words)
+            # 30-word context window over ±2 lines
+            context = word_index.window(i - 2, i + 3, 30)
             results.append(HttpStatusMention(
                 code=code,
                 context=context,
@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 
 from .extractors import (
+    WordIndex,
     extract_constants_from_text,
     extract_http_statuses,
     parse_permission_table,
@@ -27,6 +28,7 @@ __all__ = [
     "PermissionRow",
     "StateTransition",
     "parse_spec",
+    "parse_spec_text",
 ]
 
 # ── Heading detection ──────────────────────────────────────────────────
@@ -114,7 +116,11 @@ def _extract_sections(
 
 def parse_spec(filepath: Path) -> ParsedCorpusSpec:
     """Parse a single spec file for cross-spec analysis data."""
-    markdown = filepath.read_text(encoding="utf-8")
+    return parse_spec_text(filepath.read_text(encoding="utf-8"), filepath)
+
+
+def parse_spec_text(markdown: str, filepath: Path) -> ParsedCorpusSpec:
+    """Parse spec *markdown* already read from *filepath*."""
     lines = markdown.split("\n")
     spec_name = filepath.stem
 
@@ -150,9 +156,12 @@ def parse_spec(filepath: Path) -> ParsedCorpusSpec:
             content, spec_name,
         )
 
+    # Word offsets shared by every context window in this file
+    word_index = WordIndex(lines)
+
     # Extract HTTP status mentions from entire file
     result.http_status_mentions = extract_http_statuses(
-        lines, spec_name,
+        lines, spec_name, word_index,
     )
 
     # Extract constants from business rules, constraints, and AC
@@ -164,7 +173,7 @@ def parse_spec(filepath: Path) -> ParsedCorpusSpec:
             text = "\n".join(content)
             result.constants.extend(
                 extract_constants_from_text(
-                    text, start, spec_name, lines,
+                    text, start, spec_name, word_index,
                 ),
             )
 
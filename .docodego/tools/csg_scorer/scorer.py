@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 from scoring_common.types import DimensionResult
 
+from .corpus import CorpusIndex
 from .dim_constants_http import score_http_status_semantics, score_shared_constants
 from .dim_state_perms import score_permission_symmetry, score_state_machine_consistency
 from .types import ParsedCorpusSpec
@@ -48,19 +49,25 @@ def score_corpus(
     *,
     threshold: int = 60,
     fail_on_zero_dimension: bool = True,
+    index: CorpusIndex | None = None,
 ) -> CSGResult:
     """Score a corpus of parsed specs against the CSG rubric.
 
     Returns a full CSGResult with per-dimension scores, status,
-    and gate decision.
+    and gate decision. Pass the *index* from ``load_corpus`` to
+    reuse cached per-spec and per-group results.
     """
+    if index is None:
+        index = CorpusIndex(specs)
     result = CSGResult(
-        shared_constants=score_shared_constants(specs),
+        shared_constants=score_shared_constants(specs, index=index),
         http_status_semantics=score_http_status_semantics(specs),
         state_machine_consistency=score_state_machine_consistency(
-            specs,
+            specs, index=index,
+        ),
+        permission_symmetry=score_permission_symmetry(
+            specs, index=index,
         ),
-        permission_symmetry=score_permission_symmetry(specs),
     )
 
     # Gate logic
@@ -0,0 +1,219 @@
+"""State machine graph — adjacency indexes over StateTransition rows.
+
+Every analysis here is a single linear pass (O(states + transitions))
+over indexes built once in the constructor, so corpus-wide checks no
+longer rescan the transition list per state.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+from .types import StateTransition
+
+# Pseudo-state used in the From column for a machine's initial state
+INITIAL_MARKER = "(none)"
+
+# Guard cells that mean "unguarded" rather than naming a condition
+_NO_GUARD = {"", "none", "n/a", "-", "—", "always"}
+
+
+@dataclass
+class GuardConflict:
+    """Transitions of one spec that leave a state on the same trigger
+    and guard but lead to different targets — nothing picks between
+    them."""
+
+    spec_name: str
+    state: str
+    trigger: str
+    guard: str
+    targets: list[str]
+
+
+def _normalize_guard(guard: str) -> str:
+    return re.sub(r"\s+", " ", guard.strip().lower())
+
+
+class StateGraph:
+    """Directed graph of states built from transition rows.
+
+    ``adjacency`` and ``reverse`` map each state to its successors and
+    predecessors in first-seen order. ``target_specs`` records which
+    specs name a state as a transition target, and ``guarded_specs``
+    which specs guard transitions out of it. ``entries`` holds the
+    states a ``(none)`` row marks as initial.
+    """
+
+    def __init__(self, transitions: Iterable[StateTransition]) -> None:
+        self.transitions: list[StateTransition] = list(transitions)
+        self.adjacency: dict[str, dict[str, None]] = {}
+        self.reverse: dict[str, dict[str, None]] = {}
+        self.target_specs: dict[str, dict[str, None]] = {}
+        self.guarded_specs: dict[str, set[str]] = {}
+        self.entries: dict[str, None] = {}
+
+        for t in self.transitions:
+            self.reverse.setdefault(t.to_state, {})
+            self.adjacency.setdefault(t.to_state, {})
+            self.target_specs.setdefault(t.to_state, {})[t.spec_name] = None
+            if t.from_state == INITIAL_MARKER:
+                self.entries[t.to_state] = None
+            elif t.from_state:
+                self.adjacency.setdefault(t.from_state, {})[t.to_state] = None
+                self.reverse.setdefault(t.from_state, {})
+                self.reverse[t.to_state][t.from_state] = None
+            if t.guard:
+                self.guarded_specs.setdefault(t.from_state, set()).add(
+                    t.spec_name,
+                )
+
+    @property
+    def states(self) -> list[str]:
+        return list(self.adjacency)
+
+    def referencing_specs(self, state: str) -> list[str]:
+        """Sorted names of the specs that transition into *state*."""
+        return sorted(self.target_specs.get(state, {}))
+
+    # ── Analyses ──────────────────────────────────────────────────
+
+    def dead_ends(self) -> list[str]:
+        """States that are entered but never left."""
+        return [
+            state for state, successors in self.adjacency.items()
+            if not successors
+        ]
+
+    def reachable(self, roots: Iterable[str]) -> set[str]:
+        """States reachable from *roots* (inclusive), breadth-first."""
+        seen = {r for r in roots if r in self.adjacency}
+        queue = deque(seen)
+        while queue:
+            for nxt in self.adjacency[queue.popleft()]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+        return seen
+
+    def roots(self) -> list[str]:
+        """States that no transition leads into."""
+        return [
+            state for state, predecessors in self.reverse.items()
+            if not predecessors
+        ]
+
+    def source_cycles(self) -> list[list[str]]:
+        """Cycles of states that no transition from outside enters."""
+        components = self.strongly_connected_components()
+        label = {
+            state: i for i, members in enumerate(components)
+            for state in members
+        }
+        return [
+            members for i, members in enumerate(components)
+            if len(members) > 1 and not any(
+                label[pred] != i
+                for state in members for pred in self.reverse[state]
+            )
+        ]
+
+    def unreachable_states(self) -> list[str]:
+        """States no path from an entry state leads to.
+
+        Every root is an entry alongside the ``(none)`` rows, so a
+        table of several sub-machines is judged from each of their
+        starts. A table without ``(none)`` rows may also be one closed
+        loop, so each loop nothing enters is then seeded from its
+        first-listed state.
+        """
+        seeds = dict.fromkeys([*self.entries, *self.roots()])
+        if not self.entries:
+            order = {state: i for i, state in enumerate(self.adjacency)}
+            for members in self.source_cycles():
+                seeds[min(members, key=order.__getitem__)] = None
+        seen = self.reachable(seeds)
+        return [s for s in self.adjacency if s not in seen]
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """Tarjan's algorithm, iterative to avoid deep recursion.
+
+        Components come out in reverse topological order: a component
+        is listed before any component that has an edge into it.
+        """
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+
+        for root in self.adjacency:
+            if root in index:
+                continue
+            work = [(root, iter(self.adjacency[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for nxt in successors:
+                    if nxt not in index:
+                        index[nxt] = lowlink[nxt] = len(index)
+                        stack.append(nxt)
+                        on_stack.add(nxt)
+                        work.append((nxt, iter(self.adjacency[nxt])))
+                        advanced = True
+                        break
+                    if nxt in on_stack:
+                        lowlink[node] = min(lowlink[node], index[nxt])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def guard_conflicts(self) -> list[GuardConflict]:
+        """Same-spec transitions out of one state sharing a trigger and
+        a guard.
+
+        Rows on different triggers never conflict: the event already
+        decides between them.
+        """
+        by_guard: dict[tuple[str, str, str, str], dict[str, None]] = {}
+        original: dict[tuple[str, str, str, str], StateTransition] = {}
+        for t in self.transitions:
+            guard = _normalize_guard(t.guard)
+            if guard in _NO_GUARD or t.from_state == INITIAL_MARKER:
+                continue
+            key = (
+                t.spec_name, t.from_state,
+                _normalize_guard(t.trigger), guard,
+            )
+            by_guard.setdefault(key, {})[t.to_state] = None
+            original.setdefault(key, t)
+        conflicts: list[GuardConflict] = []
+        for key, targets in by_guard.items():
+            if len(targets) < 2:
+                continue
+            first = original[key]
+            conflicts.append(GuardConflict(
+                spec_name=first.spec_name, state=first.from_state,
+                trigger=first.trigger, guard=first.guard,
+                targets=list(targets),
+            ))
+        return conflicts
@@ -36,13 +36,25 @@ class HttpStatusMention:
 
 @dataclass
 class ExtractedConstant:
-    """A numeric constant extracted from a spec."""
+    """A numeric constant extracted from a spec.
+
+    ``family`` names the unit family ("time", "bytes", "digits", ...)
+    and ``normalized`` is the value in that family's base unit; both
+    are empty for unitless qualifiers such as "at least 3".
+    """
     value: float
     unit: str
     normalized_seconds: float | None
     context: str
     line_num: int
     spec_name: str = ""
+    family: str = ""
+    normalized: float | None = None
+
+    @property
+    def comparable(self) -> float:
+        """Value used for cross-spec comparison."""
+        return self.normalized if self.normalized is not None else self.value
 
 
 @dataclass
@@ -0,0 +1 @@
+"""Cross-cycle corpus diff — what changed between two spec cycles."""
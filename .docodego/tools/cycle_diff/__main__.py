@@ -0,0 +1,64 @@
+"""CLI entry point for the cross-cycle corpus diff."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from scoring_common import fix_encoding, load_dotenv
+
+fix_encoding()
+load_dotenv()
+
+from csg_scorer.corpus import CorpusCache
+
+from .differ import diff_cycles
+from .reporter import format_json, format_text
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cycle-diff",
+        description=(
+            "DoCoDeGo Cycle Diff — constants, permissions, state "
+            "transitions, links and statuses that changed between "
+            "two spec cycles."
+        ),
+    )
+    parser.add_argument(
+        "old",
+        help="Earlier cycle directory (or its output/specs directory)",
+    )
+    parser.add_argument(
+        "new",
+        help="Later cycle directory (or its output/specs directory)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+
+    args = parser.parse_args(argv)
+
+    for path in (args.old, args.new):
+        if not Path(path).is_dir():
+            print(f"Error: directory not found: {path}", file=sys.stderr)
+            return 1
+
+    # Extracts of changed specs go through the shared CSG cache
+    cache = CorpusCache()
+    diff = diff_cycles(Path(args.old), Path(args.new), cache=cache)
+    cache.save()
+
+    if args.format == "json":
+        print(format_json(diff))
+    else:
+        print(format_text(diff))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""Align two cycles' specs and diff the extracts of changed ones.
+
+Every file on both sides is read and hashed once; specs whose bytes
+are identical are skipped without parsing. Only changed specs are
+loaded — CSG extracts through the CSG corpus cache, SHS metadata by
+parsing — so the expensive work is proportional to what changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Hashable, TypeVar
+
+from csg_scorer.corpus import CorpusCache, CorpusIndex, load_corpus
+from csg_scorer.dim_constants_http import spec_constant_groups
+from csg_scorer.types import ParsedCorpusSpec
+from shs_scorer.parser import ParsedHealthSpec
+from shs_scorer.parser import parse_spec as parse_health_spec
+
+T = TypeVar("T", bound=Hashable)
+
+_ID_RE = re.compile(r"^id\s*:\s*(.+)$")
+
+# Categories reported per spec, in output order
+CATEGORIES = ("status", "constants", "permissions", "transitions", "links")
+
+
+# ── Result types ──────────────────────────────────────────────────────
+
+
+@dataclass
+class CategoryDiff:
+    """Added, removed and changed entries of one category."""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass
+class SpecDiff:
+    """One spec that was added, removed or changed between cycles."""
+
+    key: str
+    change: str  # "added", "removed" or "changed"
+    old_path: Path | None = None
+    new_path: Path | None = None
+    categories: dict[str, CategoryDiff] = field(default_factory=dict)
+
+
+@dataclass
+class CycleDiff:
+    """Every spec-level difference between two spec directories."""
+
+    old_root: Path
+    new_root: Path
+    specs: list[SpecDiff] = field(default_factory=list)
+    unchanged: int = 0
+
+    def count(self, change: str) -> int:
+        return sum(1 for s in self.specs if s.change == change)
+
+
+# ── Alignment ─────────────────────────────────────────────────────────
+
+
+@dataclass
+class _SpecFile:
+    path: Path
+    digest: str
+
+
+def specs_dir(cycle: Path) -> Path:
+    """Accept a cycle directory (``cycle-NN``) or a specs directory."""
+    nested = cycle / "output" / "specs"
+    return nested if nested.is_dir() else cycle
+
+
+def _frontmatter_id(raw: bytes) -> str:
+    """The ``id:`` value of a spec's frontmatter, or ""."""
+    lines = raw.decode("utf-8", errors="replace").splitlines()
+    if not lines or lines[0].strip() != "---":
+        return ""
+    for line in lines[1:]:
+        line = line.strip()
+        if line == "---":
+            break
+        m = _ID_RE.match(line)
+        if m:
+            return m.group(1).strip().strip('"').strip("'")
+    return ""
+
+
+def _index_specs(root: Path) -> dict[str, _SpecFile]:
+    """Map alignment key → file: frontmatter id, else file stem.
+
+    A key claimed by more than one file falls back to the path
+    relative to *root* for all of them.
+    """
+    by_key: dict[str, list[tuple[str, _SpecFile]]] = {}
+    for path in sorted(root.rglob("*.md")):
+        raw = path.read_bytes()
+        spec = _SpecFile(path, hashlib.sha256(raw).hexdigest())
+        key = _frontmatter_id(raw) or path.stem
+        by_key.setdefault(key, []).append(
+            (path.relative_to(root).as_posix(), spec),
+        )
+    index: dict[str, _SpecFile] = {}
+    for key, entries in by_key.items():
+        if len(entries) == 1:
+            index[key] = entries[0][1]
+        else:
+            index.update(entries)
+    return index
+
+
+# ── Per-category diffs ────────────────────────────────────────────────
+
+
+def _multiset_diff(
+    old: list[T], new: list[T],
+) -> tuple[list[T], list[T]]:
+    """(added, removed), counting duplicates, in first-seen order."""
+    old_counts, new_counts = Counter(old), Counter(new)
+    added: list[T] = []
+    for entry in dict.fromkeys(new):
+        added.extend([entry] * (new_counts[entry] - old_counts[entry]))
+    removed: list[T] = []
+    for entry in dict.fromkeys(old):
+        removed.extend([entry] * (old_counts[entry] - new_counts[entry]))
+    return added, removed
+
+
+def _diff_status(
+    old: ParsedHealthSpec | None, new: ParsedHealthSpec | None,
+) -> CategoryDiff:
+    diff = CategoryDiff()
+    before = old.frontmatter.get("status", "") if old else ""
+    after = new.frontmatter.get("status", "") if new else ""
+    if before and after and before != after:
+        diff.changed.append(f"{before} → {after}")
+    elif after and not before:
+        diff.added.append(after)
+    elif before and not after:
+        diff.removed.append(before)
+    return diff
+
+
+def _constant_entries(
+    spec: ParsedCorpusSpec | None, corpus: CorpusIndex,
+) -> dict[str, list[tuple[str, str]]]:
+    """Constants by semantic group as (value text, unit family)."""
+    entries: dict[str, list[tuple[str, str]]] = {}
+    if spec is None:
+        return entries
+    # Same memo CSG scoring uses, so cached classifications are reused
+    groups = corpus.per_spec(
+        "constant-groups", spec,
+        lambda: spec_constant_groups(spec.constants),
+    )
+    for c, group in zip(spec.constants, groups):
+        entries.setdefault(group or "ungrouped", []).append(
+            (f"{c.value:g} {c.unit}", c.family),
+        )
+    return entries
+
+
+def _diff_constants(
+    old: ParsedCorpusSpec | None,
+    new: ParsedCorpusSpec | None,
+    corpus: CorpusIndex,
+) -> CategoryDiff:
+    """Per group; a removed and an added value of the same unit
+    family within one group pair up as a change."""
+    diff = CategoryDiff()
+    old_groups = _constant_entries(old, corpus)
+    new_groups = _constant_entries(new, corpus)
+    for group in dict.fromkeys([*old_groups, *new_groups]):
+        added, removed = _multiset_diff(
+            old_groups.get(group, []), new_groups.get(group, []),
+        )
+        for before in list(removed):
+            after = next((a for a in added if a[1] == before[1]), None)
+            if after is None:
+                continue
+            added.remove(after)
+            removed.remove(before)
+            diff.changed.append(f"{group}: {before[0]} → {after[0]}")
+        diff.added.extend(f"{group}: {a[0]}" for a in added)
+        diff.removed.extend(f"{group}: {r[0]}" for r in removed)
+    return diff
+
+
+def _diff_permissions(
+    old: ParsedCorpusSpec | None, new: ParsedCorpusSpec | None,
+) -> CategoryDiff:
+    """Keyed by (role, action); a flipped allowed flag is a change."""
+    def rows(spec: ParsedCorpusSpec | None) -> dict[tuple[str, str], bool]:
+        if spec is None:
+            return {}
+        return {
+            (p.role.strip(), p.action.strip()): p.allowed
+            for p in spec.permission_rows
+        }
+
+    def label(allowed: bool) -> str:
+        return "allowed" if allowed else "denied"
+
+    diff = CategoryDiff()
+    before, after = rows(old), rows(new)
+    for key, allowed in after.items():
+        role, action = key
+        if key not in before:
+            diff.added.append(f"{role}: {action} ({label(allowed)})")
+        elif before[key] != allowed:
+            diff.changed.append(
+                f"{role}: {action} ({label(before[key])} → "
+                f"{label(allowed)})",
+            )
+    for (role, action), allowed in before.items():
+        if (role, action) not in after:
+            diff.removed.append(f"{role}: {action} ({label(allowed)})")
+    return diff
+
+
+def _diff_transitions(
+    old: ParsedCorpusSpec | None, new: ParsedCorpusSpec | None,
+) -> CategoryDiff:
+    """Keyed by (from, to); a new trigger or guard is a change."""
+    def rows(
+        spec: ParsedCorpusSpec | None,
+    ) -> dict[tuple[str, str], tuple[str, str]]:
+        if spec is None:
+            return {}
+        return {
+            (t.from_state, t.to_state): (t.trigger, t.guard)
+            for t in spec.state_transitions
+        }
+
+    diff = CategoryDiff()
+    before, after = rows(old), rows(new)
+    for key, detail in after.items():
+        edge = f"{key[0]} → {key[1]}"
+        if key not in before:
+            diff.added.append(edge)
+        elif before[key] != detail:
+            what = [
+                name for name, b, a in zip(
+                    ("trigger", "guard"), before[key], detail,
+                )
+                if b != a
+            ]
+            diff.changed.append(f"{edge} ({', '.join(what)})")
+    for key in before:
+        if key not in after:
+            diff.removed.append(f"{key[0]} → {key[1]}")
+    return diff
+
+
+def _diff_links(
+    old: ParsedHealthSpec | None, new: ParsedHealthSpec | None,
+) -> CategoryDiff:
+    """Distinct link targets that appeared or disappeared."""
+    before = [target for _, target, _ in old.all_md_links] if old else []
+    after = [target for _, target, _ in new.all_md_links] if new else []
+    added, removed = _multiset_diff(
+        list(dict.fromkeys(before)), list(dict.fromkeys(after)),
+    )
+    return CategoryDiff(added=added, removed=removed)
+
+
+# ── Driver ────────────────────────────────────────────────────────────
+
+
+def diff_cycles(
+    old_cycle: Path,
+    new_cycle: Path,
+    *,
+    cache: CorpusCache | None = None,
+) -> CycleDiff:
+    """Diff the specs of two cycles (or spec directories)."""
+    old_root, new_root = specs_dir(old_cycle), specs_dir(new_cycle)
+    old_index, new_index = _index_specs(old_root), _index_specs(new_root)
+    result = CycleDiff(old_root=old_root, new_root=new_root)
+
+    pending: list[SpecDiff] = []
+    for key in dict.fromkeys([*old_index, *new_index]):
+        before, after = old_index.get(key), new_index.get(key)
+        if before and after and before.digest == after.digest:
+            result.unchanged += 1
+            continue
+        change = "changed" if before and after else (
+            "added" if after else "removed"
+        )
+        pending.append(SpecDiff(
+            key=key,
+            change=change,
+            old_path=before.path if before else None,
+            new_path=after.path if after else None,
+        ))
+
+    # Load extracts for changed specs only, both sides in one batch
+    paths = [
+        path for spec in pending
+        for path in (spec.old_path, spec.new_path) if path is not None
+    ]
+    corpus = load_corpus(paths, cache)
+    extracts = dict(zip(paths, corpus.specs))
+
+    for spec in pending:
+        old_csg = extracts.get(spec.old_path) if spec.old_path else None
+        new_csg = extracts.get(spec.new_path) if spec.new_path else None
+        old_shs = parse_health_spec(spec.old_path) if spec.old_path else None
+        new_shs = parse_health_spec(spec.new_path) if spec.new_path else None
+        categories = {
+            "status": _diff_status(old_shs, new_shs),
+            "constants": _diff_constants(old_csg, new_csg, corpus),
+            "permissions": _diff_permissions(old_csg, new_csg),
+            "transitions": _diff_transitions(old_csg, new_csg),
+            "links": _diff_links(old_shs, new_shs),
+        }
+        spec.categories = {
+            name: diff for name, diff in categories.items() if diff
+        }
+        result.specs.append(spec)
+
+    return result
@@ -0,0 +1,85 @@
+"""Output formatters for cross-cycle diffs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .differ import CATEGORIES, CycleDiff, SpecDiff
+
+_MARKERS = {"added": "+", "removed": "-", "changed": "~"}
+
+
+def _spec_path(spec: SpecDiff, root: Path) -> str:
+    path = spec.new_path or spec.old_path
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _summary(diff: CycleDiff) -> str:
+    return (
+        f"{diff.count('changed')} changed, {diff.count('added')} added, "
+        f"{diff.count('removed')} removed, {diff.unchanged} unchanged"
+    )
+
+
+def format_text(diff: CycleDiff) -> str:
+    """Format a cycle diff as a human-readable report."""
+    lines = [
+        "Cycle Diff",
+        f"  old: {diff.old_root.as_posix()}",
+        f"  new: {diff.new_root.as_posix()}",
+        f"  {_summary(diff)}",
+    ]
+    for spec in diff.specs:
+        root = diff.new_root if spec.new_path else diff.old_root
+        lines.append("")
+        lines.append(
+            f"{_MARKERS[spec.change]} {spec.key}  ({_spec_path(spec, root)})",
+        )
+        for name in CATEGORIES:
+            category = spec.categories.get(name)
+            if category is None:
+                continue
+            lines.append(f"    {name}:")
+            for change in ("changed", "added", "removed"):
+                marker = _MARKERS[change]
+                for entry in getattr(category, change):
+                    lines.append(f"      {marker} {entry}")
+    return "\n".join(lines)
+
+
+def _spec_to_dict(spec: SpecDiff) -> dict[str, Any]:
+    return {
+        "key": spec.key,
+        "change": spec.change,
+        "old_path": spec.old_path.as_posix() if spec.old_path else None,
+        "new_path": spec.new_path.as_posix() if spec.new_path else None,
+        "categories": {
+            name: {
+                "added": category.added,
+                "removed": category.removed,
+                "changed": category.changed,
+            }
+            for name, category in spec.categories.items()
+        },
+    }
+
+
+def format_json(diff: CycleDiff) -> str:
+    """Format a cycle diff as JSON."""
+    data = {
+        "old": diff.old_root.as_posix(),
+        "new": diff.new_root.as_posix(),
+        "summary": {
+            "changed": diff.count("changed"),
+            "added": diff.count("added"),
+            "removed": diff.count("removed"),
+            "unchanged": diff.unchanged,
+        },
+        "specs": [_spec_to_dict(spec) for spec in diff.specs],
+    }
+    return json.dumps(data, indent=2, ensure_ascii=False)
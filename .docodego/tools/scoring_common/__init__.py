@@ -6,7 +6,8 @@ import os
 from pathlib import Path
 
 from scoring_common.audit import write_audit
-from scoring_common.cli import add_common_args
+from scoring_common.cli import add_common_args, add_jobs_arg
+from scoring_common.parallel import parallel_map
 from scoring_common.reporter import (
     bar,
     dim_to_dict,
@@ -17,14 +18,17 @@ from scoring_common.reporter import (
 from scoring_common.types import DimensionResult
 
 __all__ = [
+    "CACHE_DIR",
     "DimensionResult",
     "add_common_args",
+    "add_jobs_arg",
     "bar",
     "dim_to_dict",
     "fix_encoding",
     "format_json",
     "format_text",
     "load_dotenv",
+    "parallel_map",
     "result_to_dict",
     "write_audit",
 ]
@@ -32,6 +36,9 @@ __all__ = [
 # tools.env lives at the tools/ root (parent of scoring_common/)
 _DOTENV_PATH = Path(__file__).resolve().parent.parent / "tools.env"
 
+# Disk caches of every tool: .docodego/tools/.cache/<tool or source>/
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
 
 def load_dotenv() -> None:
     """Load .env from the tools directory. Existing env vars take priority."""
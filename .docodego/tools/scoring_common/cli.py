@@ -30,3 +30,13 @@ def add_common_args(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Write audit JSON to this directory (or set DOCODEGO_CYCLE)",
     )
+
+
+def add_jobs_arg(parser: argparse.ArgumentParser) -> None:
+    """Add --jobs (parallel spec parsing) to *parser*."""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing specs (default: 1, 0 = all CPUs)",
+    )
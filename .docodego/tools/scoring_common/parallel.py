@@ -0,0 +1,41 @@
+"""Process-pool fan-out for per-file work (spec parsing)."""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Chunks handed out per worker. More than one lets fast workers pick
+# up the slack of a slow chunk; few enough that per-task pickling
+# overhead stays negligible.
+CHUNKS_PER_WORKER = 4
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Worker count for a ``--jobs`` value (0 = one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def parallel_map(
+    fn: Callable[[T], R], items: Iterable[T], *, jobs: int = 1,
+) -> list[R]:
+    """Apply *fn* to every item, in order, across *jobs* processes.
+
+    *fn* must be a module-level function, and items and results must
+    be picklable. With one job (or a single item) everything runs
+    in-process, so the serial path pays no pool start-up cost.
+    """
+    items = list(items)
+    jobs = min(resolve_jobs(jobs), len(items))
+    if jobs <= 1:
+        return [fn(item) for item in items]
+    chunksize = max(1, math.ceil(len(items) / (jobs * CHUNKS_PER_WORKER)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
@@ -0,0 +1,166 @@
+"""Markdown table tokenizer shared by the scorers.
+
+``find_tables`` makes one pass over a file's lines and records each
+table as a span of line indexes; cells are only split when a caller
+asks for a table's rows, so counting tables never tokenizes a cell.
+Cell splitting honours escaped pipes (``\\|``) and code spans, so a
+``a || b`` inside backticks stays in one cell. ``min_cells`` sets how
+many cells a line needs to count as a row: CSG reads any row, while
+SHS counts only rows of two or more cells, as it always has.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+# Header separator row: only pipes, dashes, colons and spaces
+_SEPARATOR_RE = re.compile(r"^\|[\s\-:|]+\|$")
+
+
+def is_table_line(stripped: str, min_cells: int = 1) -> bool:
+    """True for a stripped line that starts with a pipe and has at
+    least *min_cells* more, each past a non-empty cell."""
+    if not stripped.startswith("|"):
+        return False
+    pos = 0
+    for _ in range(min_cells):
+        pos = stripped.find("|", pos + 2)
+        if pos < 0:
+            return False
+    return True
+
+
+def _closing_fence(row: str, fence: str, pos: int) -> int:
+    """Index of the next backtick run exactly as long as *fence*, or -1."""
+    n = len(row)
+    while True:
+        close = row.find(fence, pos)
+        if close < 0:
+            return -1
+        end = close + len(fence)
+        if end >= n or row[end] != "`":
+            return close
+        while end < n and row[end] == "`":
+            end += 1
+        pos = end
+
+
+def split_cells(row: str) -> list[str]:
+    """Stripped cell values of one stripped table row.
+
+    The outer pipes are dropped. ``\\|`` is a literal pipe, and pipes
+    inside a code span do not separate cells.
+    """
+    if "\\" not in row and "`" not in row:
+        body = row[1:-1] if row.endswith("|") and len(row) > 1 else row[1:]
+        return [cell.strip() for cell in body.split("|")]
+
+    cells: list[str] = []
+    buf: list[str] = []
+    n = len(row)
+    i = 1 if row.startswith("|") else 0
+    at_delimiter = False
+    while i < n:
+        ch = row[i]
+        at_delimiter = False
+        if ch == "\\" and i + 1 < n and row[i + 1] == "|":
+            buf.append("|")
+            i += 2
+        elif ch == "`":
+            j = i
+            while j < n and row[j] == "`":
+                j += 1
+            fence = row[i:j]
+            close = _closing_fence(row, fence, j)
+            if close < 0:
+                # Unmatched run: literal backticks
+                buf.append(fence)
+                i = j
+            else:
+                end = close + len(fence)
+                buf.append(row[i:end].replace("\\|", "|"))
+                i = end
+        elif ch == "|":
+            cells.append("".join(buf).strip())
+            buf = []
+            at_delimiter = True
+            i += 1
+        else:
+            buf.append(ch)
+            i += 1
+    if not at_delimiter:
+        cells.append("".join(buf).strip())
+    return cells
+
+
+class Table:
+    """One table: consecutive row lines ``lines[start:end]``.
+
+    ``header`` is the first row before the separator line and ``rows``
+    the data rows after it; both are split on first access only.
+    """
+
+    def __init__(
+        self, lines: Sequence[str], start: int, end: int,
+        separator: int | None,
+    ) -> None:
+        self.lines = lines
+        self.start = start
+        self.end = end
+        # Line index of the header separator row, if any
+        self.separator = separator
+        self._rows: list[list[str]] | None = None
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @property
+    def has_header(self) -> bool:
+        return self.separator is not None
+
+    @property
+    def header(self) -> list[str] | None:
+        if not self.has_header:
+            return None
+        return split_cells(self.lines[self.start].strip())
+
+    @property
+    def rows(self) -> list[list[str]]:
+        """Data rows below the separator (every row if there is none)."""
+        if self._rows is None:
+            first = self.start
+            if self.separator is not None:
+                first = self.separator + 1
+            self._rows = []
+            for i in range(first, self.end):
+                stripped = self.lines[i].strip()
+                if not _SEPARATOR_RE.match(stripped):
+                    self._rows.append(split_cells(stripped))
+        return self._rows
+
+
+def find_tables(
+    lines: Sequence[str], start: int = 0, end: int | None = None,
+    *, min_cells: int = 1,
+) -> list[Table]:
+    """Every table in ``lines[start:end]``, in one pass."""
+    end = len(lines) if end is None else end
+    tables: list[Table] = []
+    first: int | None = None
+    separator: int | None = None
+    for i in range(start, end):
+        stripped = lines[i].strip()
+        if is_table_line(stripped, min_cells):
+            if first is None:
+                # A header row comes first, even an all-blank one
+                first, separator = i, None
+            elif separator is None and _SEPARATOR_RE.match(stripped):
+                separator = i
+        elif first is not None:
+            tables.append(Table(lines, first, i, separator))
+            first = None
+    if first is not None:
+        tables.append(Table(lines, first, end, separator))
+    return tables
+
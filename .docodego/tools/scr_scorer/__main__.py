@@ -13,9 +13,13 @@ load_dotenv()
 
 from scoring_common.audit import resolve_audit_dir, write_audit
 
-from .parser import parse_manifest
+from . import registry
+from .parser import SDDM, parse_manifest
+from .resolver import NODE_BUDGET, TransitiveResolver, resolver_for
 from .reporter import TOOL_KEY, _result_to_dict, format_json, format_text
-from .scorer import score_corpus
+from .scorer import ManifestScores, SCRResult, score_corpus, score_manifest
+from .snapshot import DEFAULT_SNAPSHOT, Snapshot
+from .transport import SingleFlight
 
 
 def _resolve_manifest(
@@ -47,7 +51,263 @@ def _resolve_manifest(
     return None
 
 
+def _add_registry_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--registry",
+        action="append",
+        default=[],
+        metavar="ECOSYSTEM=URL",
+        help=(
+            "Base URL for an ecosystem's registry (npm, pypi, "
+            "crates.io), e.g. a mirror; repeatable"
+        ),
+    )
+
+
+def _configure_registries(entries: list[str]) -> bool:
+    """Apply --registry overrides. Prints an error and returns False
+    on a malformed entry or unknown ecosystem."""
+    overrides: dict[str, str] = {}
+    for entry in entries:
+        ecosystem, sep, url = entry.partition("=")
+        if not sep or not ecosystem.strip() or not url.strip():
+            print(
+                f"Error: --registry expects ECOSYSTEM=URL, got: {entry}",
+                file=sys.stderr,
+            )
+            return False
+        overrides[ecosystem.strip()] = url.strip()
+    if not overrides:
+        return True
+    try:
+        registry.configure_registries(overrides)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return False
+    return True
+
+
+# Manifest-level results shared by every main() call in this process
+# (audit_all runs groups in parallel threads). Keyed by resolved
+# manifest path, mtime and data source; concurrent callers are
+# coalesced.
+_manifest_runs: dict[tuple, tuple[SDDM, ManifestScores]] = {}
+_manifest_flight = SingleFlight()
+
+
+def _score_manifest_once(
+    manifest_path: Path,
+    *,
+    offline: bool,
+    snapshot: Path | None,
+    max_stale_hours: float,
+) -> tuple[SDDM, ManifestScores]:
+    """Parse and score *manifest_path* once per process."""
+    key = (
+        manifest_path, manifest_path.stat().st_mtime_ns, offline, snapshot,
+        max_stale_hours,
+    )
+
+    def _run() -> tuple[SDDM, ManifestScores]:
+        if key not in _manifest_runs:
+            sddm = parse_manifest(manifest_path)
+            _manifest_runs[key] = (
+                sddm,
+                score_manifest(
+                    sddm, offline=offline, max_stale_hours=max_stale_hours,
+                ),
+            )
+        return _manifest_runs[key]
+
+    return _manifest_flight.do(key, _run)
+
+
+def prewarm_main(argv: list[str]) -> int:
+    """Fill the registry cache for every package in a manifest."""
+    parser = argparse.ArgumentParser(
+        prog="scr-scorer prewarm",
+        description=(
+            "Fetch registry metadata and OSV results for every package "
+            "in a dependencies.md manifest so later audits are "
+            "served from a fresh cache."
+        ),
+    )
+    parser.add_argument(
+        "manifest",
+        help="Path to dependencies.md manifest",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Concurrent registry requests (default: 8)",
+    )
+    _add_registry_arg(parser)
+    args = parser.parse_args(argv)
+    if not _configure_registries(args.registry):
+        return 1
+
+    manifest_path = Path(args.manifest)
+    if not manifest_path.is_file():
+        print(
+            f"Error: manifest not found: {args.manifest}",
+            file=sys.stderr,
+        )
+        return 1
+
+    sddm = parse_manifest(manifest_path)
+    packages = [
+        (ref.name, ref.version, ref.ecosystem)
+        for ref in sddm.unique_packages.values()
+    ]
+    metadata_ok, osv_ok = registry.prewarm(packages, jobs=args.jobs)
+    print(
+        f"  prewarmed {len(packages)} package(s): "
+        f"registry {metadata_ok}, osv {osv_ok}",
+    )
+    return 0
+
+
+def snapshot_main(argv: list[str]) -> int:
+    """Import an OSV export and npm metadata into a local snapshot."""
+    parser = argparse.ArgumentParser(
+        prog="scr-scorer snapshot",
+        description=(
+            "Import an OSV ecosystem export and npm packuments into "
+            "an indexed SQLite snapshot used by --offline runs."
+        ),
+    )
+    parser.add_argument(
+        "--db",
+        default=str(DEFAULT_SNAPSHOT),
+        help=f"Snapshot database path (default: {DEFAULT_SNAPSHOT})",
+    )
+    parser.add_argument(
+        "--osv",
+        default=None,
+        help="OSV export: all.zip or a directory of advisory JSON files",
+    )
+    parser.add_argument(
+        "--npm",
+        default=None,
+        help="npm packuments: a directory, .zip, or .tar(.gz) of JSON",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.osv and not args.npm:
+        parser.error("nothing to import: pass --osv and/or --npm")
+    for source in (args.osv, args.npm):
+        if source and not Path(source).exists():
+            print(f"Error: not found: {source}", file=sys.stderr)
+            return 1
+
+    snapshot = Snapshot(Path(args.db))
+    try:
+        if args.osv:
+            count = snapshot.import_osv(Path(args.osv))
+            print(f"  osv: {count} advisories")
+        if args.npm:
+            count = snapshot.import_npm(Path(args.npm))
+            print(f"  npm: {count} packages")
+    finally:
+        snapshot.close()
+    print(f"  snapshot: {Path(args.db).as_posix()}")
+    return 0
+
+
+def depth_main(argv: list[str]) -> int:
+    """Print the transitive dependency footprint of each manifest entry."""
+    parser = argparse.ArgumentParser(
+        prog="scr-scorer depth",
+        description=(
+            "Resolve the transitive dependency graph of every "
+            "manifest entry and report its size, depth and heaviest "
+            "subtrees."
+        ),
+    )
+    parser.add_argument(
+        "manifest",
+        help="Path to dependencies.md manifest",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=NODE_BUDGET,
+        help=f"Max nodes visited per entry (default: {NODE_BUDGET})",
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=None,
+        help="Resolve from this snapshot database instead of the network",
+    )
+    _add_registry_arg(parser)
+    args = parser.parse_args(argv)
+    if not _configure_registries(args.registry):
+        return 1
+
+    manifest_path = Path(args.manifest)
+    if not manifest_path.is_file():
+        print(
+            f"Error: manifest not found: {args.manifest}",
+            file=sys.stderr,
+        )
+        return 1
+    if args.snapshot:
+        if not Path(args.snapshot).is_file():
+            print(
+                f"Error: snapshot not found: {args.snapshot}",
+                file=sys.stderr,
+            )
+            return 1
+        registry.use_snapshot(Snapshot(Path(args.snapshot)))
+
+    sddm = parse_manifest(manifest_path)
+    resolvers: dict[str, TransitiveResolver] = {}
+    print(f"{'Package':<40} {'Direct':>6} {'Trans.':>7} {'Depth':>5}  Heaviest")
+    for name, ref in sddm.unique_packages.items():
+        if not registry.has_registry(ref.ecosystem):
+            continue
+        if ref.ecosystem not in resolvers:
+            resolvers[ref.ecosystem] = resolver_for(
+                ref.ecosystem, node_budget=args.budget,
+            )
+        spec = registry.normalize_range(ref.version, ref.ecosystem)
+        report = resolvers[ref.ecosystem].resolve(name, spec or "latest")
+        if not report.resolved:
+            print(f"{name:<40} {'?':>6} {'?':>7} {'?':>5}  (not found)")
+            continue
+        count = f"{report.transitive}{'+' if report.truncated else ''}"
+        heaviest = ", ".join(
+            f"{dep} ({size})" for dep, size in report.heaviest
+        )
+        print(
+            f"{name:<40} {report.direct:>6} {count:>7} "
+            f"{report.max_depth:>5}  {heaviest}",
+        )
+    return 0
+
+
+_SUBCOMMANDS = {
+    "depth": depth_main,
+    "prewarm": prewarm_main,
+    "snapshot": snapshot_main,
+}
+
+
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    try:
+        if argv and argv[0] in _SUBCOMMANDS:
+            return _SUBCOMMANDS[argv[0]](argv[1:])
+        return score_main(argv)
+    finally:
+        # Let queued background refreshes finish, within a bound
+        registry.shutdown_refreshes()
+
+
+def score_main(argv: list[str]) -> int:
+    """Score one or more spec groups against their manifests."""
     parser = argparse.ArgumentParser(
         prog="scr-scorer",
         description=(
@@ -56,8 +316,13 @@ def main(argv: list[str] | None = None) -> int:
         ),
     )
     parser.add_argument(
-        "directory",
-        help="Spec group directory (used for audit path)",
+        "directories",
+        nargs="+",
+        metavar="directory",
+        help=(
+            "Spec group directory (used for audit path); groups that "
+            "resolve to the same manifest share one scoring pass"
+        ),
     )
     parser.add_argument(
         "--manifest",
@@ -71,45 +336,107 @@ def main(argv: list[str] | None = None) -> int:
         "--offline",
         action="store_true",
         default=False,
-        help="Skip network queries (live is default)",
+        help=(
+            "Skip network queries (live is default); scores from the "
+            "local snapshot if one exists"
+        ),
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=None,
+        help=(
+            "Score offline from this snapshot database "
+            f"(default with --offline: {DEFAULT_SNAPSHOT})"
+        ),
     )
+    parser.add_argument(
+        "--max-stale",
+        type=float,
+        default=registry.MAX_STALE_HOURS,
+        help=(
+            "Serve cache entries up to this many hours past their TTL "
+            "while refreshing in the background (OSV results at most "
+            f"{registry.OSV_MAX_STALE_HOURS}h); 0 disables "
+            f"(default: {registry.MAX_STALE_HOURS})"
+        ),
+    )
+    _add_registry_arg(parser)
     add_common_args(parser)
 
     args = parser.parse_args(argv)
-
-    directory = Path(args.directory)
-    if not directory.is_dir():
-        print(
-            f"Error: directory not found: {args.directory}",
-            file=sys.stderr,
-        )
+    if not _configure_registries(args.registry):
         return 1
 
-    # Resolve manifest
-    manifest_path = _resolve_manifest(directory, args.manifest)
-    if manifest_path is None:
-        print(
-            "Error: dependencies.md manifest not found. "
-            "Use --manifest to specify the path.",
-            file=sys.stderr,
+    directories = [Path(d) for d in args.directories]
+    for directory in directories:
+        if not directory.is_dir():
+            print(
+                f"Error: directory not found: {directory.as_posix()}",
+                file=sys.stderr,
+            )
+            return 1
+
+    # Resolve manifests; key the work by manifest so groups sharing
+    # one dependencies.md are parsed and scored against it once
+    by_manifest: dict[Path, list[Path]] = {}
+    for directory in directories:
+        manifest_path = _resolve_manifest(directory, args.manifest)
+        if manifest_path is None:
+            print(
+                "Error: dependencies.md manifest not found. "
+                "Use --manifest to specify the path.",
+                file=sys.stderr,
+            )
+            return 1
+        by_manifest.setdefault(manifest_path.resolve(), []).append(directory)
+
+    # Offline runs score from a local snapshot when one is available
+    offline = args.offline
+    snapshot_path = Path(args.snapshot) if args.snapshot else None
+    if snapshot_path is None and offline and DEFAULT_SNAPSHOT.exists():
+        snapshot_path = DEFAULT_SNAPSHOT
+    if snapshot_path is not None:
+        if not snapshot_path.is_file():
+            print(
+                f"Error: snapshot not found: {snapshot_path.as_posix()}",
+                file=sys.stderr,
+            )
+            return 1
+        registry.use_snapshot(Snapshot(snapshot_path))
+        offline = False
+
+    audit_dir = resolve_audit_dir(args.audits)
+    exit_code = 0
+
+    for manifest_path, group_dirs in by_manifest.items():
+        sddm, manifest_scores = _score_manifest_once(
+            manifest_path, offline=offline, snapshot=snapshot_path,
+            max_stale_hours=args.max_stale,
         )
-        return 1
+        for directory in group_dirs:
+            result = score_corpus(
+                sddm,
+                threshold=args.threshold,
+                fail_on_zero_dimension=not args.no_zero_veto,
+                spec_dir=directory,
+                manifest_scores=manifest_scores,
+            )
+            _emit(result, directory, args, audit_dir)
+            if not result.approved:
+                exit_code = 1
 
-    # Parse manifest into SDDM
-    sddm = parse_manifest(manifest_path)
+    return exit_code
 
-    # Score the corpus
-    result = score_corpus(
-        sddm,
-        offline=args.offline,
-        threshold=args.threshold,
-        fail_on_zero_dimension=not args.no_zero_veto,
-        spec_dir=directory,
-    )
 
+def _emit(
+    result: SCRResult,
+    directory: Path,
+    args: argparse.Namespace,
+    audit_dir: Path | None,
+) -> None:
+    """Write the audit file or print the report for one group."""
     display_path = directory.as_posix()
 
-    audit_dir = resolve_audit_dir(args.audits)
     if audit_dir:
         tool_dict = _result_to_dict(result, threshold=args.threshold)
         # Use a synthetic _corpus path for the audit file
@@ -130,8 +457,6 @@ def main(argv: list[str] | None = None) -> int:
             result, filename=display_path, threshold=args.threshold,
         ))
 
-    return 1 if not result.approved else 0
-
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,334 @@
+"""Registry adapters — npm, PyPI and crates.io behind one interface.
+
+Every adapter projects its registry's response into the same
+packument-shaped dict, so vitality, depth and version resolution
+never need to know which ecosystem a package came from::
+
+    {
+        "name": "requests",
+        "dist-tags": {"latest": "2.32.3"},
+        "time": {"modified": "2024-05-29T15:37:47+00:00"},
+        "versions": {
+            "2.32.3": {
+                "dependencies": {"urllib3": ">=1.21.1 <3"},
+            },
+        },
+    }
+
+PyPI and crates.io only expose dependencies cheaply for one release,
+so their projections carry dependencies for the latest version only.
+"""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+from abc import ABC, abstractmethod
+
+# ── Adapter interface ─────────────────────────────────────────────────
+
+
+class RegistryAdapter(ABC):
+    """How to fetch and project one registry's package metadata.
+
+    ``cache_source`` names the disk cache directory. Adapters whose
+    main document lacks dependencies set ``detail_url`` to fetch
+    them for the latest version in a second (also cached) request.
+    Subclasses must implement ``package_url`` and ``project``; an
+    adapter missing either fails when it is instantiated.
+    """
+
+    label = ""
+    cache_source = ""
+    osv_ecosystem = ""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url.rstrip("/")
+
+    @abstractmethod
+    def package_url(self, name: str) -> str:
+        """URL of *name*'s main metadata document."""
+
+    @abstractmethod
+    def project(self, payload: dict) -> dict:
+        """Project the main document into the packument shape."""
+
+    def detail_url(self, name: str, version: str) -> str | None:
+        return None
+
+    def project_detail(self, payload: dict) -> dict[str, str]:
+        return {}
+
+    def normalize_name(self, name: str) -> str:
+        return name
+
+    def normalize_range(self, spec: str) -> str:
+        """Rewrite a native version requirement as an npm-style range."""
+        return spec
+
+
+def _version_entry(
+    dependencies: dict[str, str] | None = None, deprecated: str = "",
+) -> dict:
+    entry: dict = {}
+    if dependencies:
+        entry["dependencies"] = dependencies
+    if deprecated:
+        entry["deprecated"] = deprecated
+    return entry
+
+
+# ── npm ───────────────────────────────────────────────────────────────
+
+
+def project_npm(doc: dict) -> dict:
+    """Keep only the packument fields SCR reads."""
+    versions = {
+        ver: {
+            key: meta[key]
+            for key in ("dependencies", "deprecated")
+            if key in meta
+        }
+        for ver, meta in doc.get("versions", {}).items()
+        if isinstance(meta, dict)
+    }
+    return {
+        "name": doc.get("name", ""),
+        "dist-tags": doc.get("dist-tags", {}),
+        "time": {"modified": doc.get("time", {}).get("modified", "")},
+        "versions": versions,
+    }
+
+
+class NpmAdapter(RegistryAdapter):
+    """registry.npmjs.org packuments."""
+
+    label = "npm"
+    cache_source = "npm"
+    osv_ecosystem = "npm"
+
+    def package_url(self, name: str) -> str:
+        # Scoped packages need URL encoding: @scope/name → @scope%2fname
+        return f"{self.base_url}/{name.replace('/', '%2f')}"
+
+    def project(self, payload: dict) -> dict:
+        return project_npm(payload)
+
+
+# ── PyPI ──────────────────────────────────────────────────────────────
+
+# "urllib3 (<3,>=1.21.1) ; extra == 'socks'" → name, requirement, marker
+_REQUIREMENT_RE = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*"
+    r"\(?([^;()]*)\)?\s*(?:;(.*))?$",
+)
+
+_INACTIVE_CLASSIFIER = "Development Status :: 7 - Inactive"
+
+# Leading release segment of a PEP 440 version ("1.4.5" of "1.4.5rc1")
+_RELEASE_RE = re.compile(r"\d+(?:\.\d+)+")
+
+
+def _compatible_range(version: str) -> str:
+    """PEP 440 ``~=`` release clause as explicit npm bounds.
+
+    ``~=X.Y`` → ``>=X.Y <(X+1).0``, ``~=X.Y.Z`` → ``>=X.Y.Z <X.(Y+1).0``.
+    Carets are avoided on purpose: npm's ``^0.2`` stops at ``0.3``,
+    while ``~=0.2`` allows every ``0.*`` release.
+    """
+    release = _RELEASE_RE.match(version)
+    if release is None:
+        return ">=" + version
+    prefix = [int(part) for part in release.group(0).split(".")][:-1]
+    prefix[-1] += 1
+    upper = ".".join(str(part) for part in (prefix + [0])[:3])
+    return f">={version} <{upper}"
+
+
+class PyPIAdapter(RegistryAdapter):
+    """PyPI JSON API (``/pypi/<name>/json``)."""
+
+    label = "PyPI"
+    cache_source = "pypi"
+    osv_ecosystem = "PyPI"
+
+    def normalize_name(self, name: str) -> str:
+        """PEP 503 normalized project name."""
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    def package_url(self, name: str) -> str:
+        return f"{self.base_url}/pypi/{urllib.parse.quote(name)}/json"
+
+    def normalize_range(self, spec: str) -> str:
+        """Map PEP 440 specifiers onto npm range syntax."""
+        parts = []
+        for clause in spec.split(","):
+            clause = clause.strip()
+            if clause.startswith("~="):
+                clause = _compatible_range(clause[2:].strip())
+            elif clause.startswith("=="):
+                clause = clause[2:].strip()
+            elif clause.startswith("!="):
+                continue  # exclusions cannot narrow a max-satisfying pick
+            parts.append(clause)
+        return " ".join(parts)
+
+    def project(self, payload: dict) -> dict:
+        info = payload.get("info", {}) or {}
+        releases = payload.get("releases", {}) or {}
+        latest = info.get("version", "")
+
+        uploads = [
+            f.get("upload_time_iso_8601", "")
+            for files in releases.values()
+            for f in files or []
+        ]
+        modified = max((u for u in uploads if u), default="")
+
+        versions: dict[str, dict] = {}
+        for version, files in releases.items():
+            yanked = bool(files) and all(f.get("yanked") for f in files)
+            reason = next(
+                (f.get("yanked_reason") for f in files or []
+                 if f.get("yanked_reason")),
+                "",
+            )
+            versions[version] = _version_entry(
+                deprecated=(f"yanked: {reason}" if reason else "yanked")
+                if yanked else "",
+            )
+
+        dependencies: dict[str, str] = {}
+        for requirement in info.get("requires_dist") or []:
+            m = _REQUIREMENT_RE.match(requirement)
+            if not m:
+                continue
+            name, spec, marker = m.groups()
+            if marker and "extra" in marker:
+                continue  # optional extras are not installed by default
+            dependencies[self.normalize_name(name)] = (
+                self.normalize_range(spec.strip()) or "latest"
+            )
+        deprecated = ""
+        if _INACTIVE_CLASSIFIER in (info.get("classifiers") or []):
+            deprecated = "inactive"
+        if latest:
+            previous = versions.get(latest, {})
+            versions[latest] = _version_entry(
+                dependencies,
+                previous.get("deprecated", "") or deprecated,
+            )
+
+        return {
+            "name": self.normalize_name(info.get("name", "")),
+            "dist-tags": {"latest": latest} if latest else {},
+            "time": {"modified": modified},
+            "versions": versions,
+        }
+
+
+# ── crates.io ─────────────────────────────────────────────────────────
+
+
+class CratesAdapter(RegistryAdapter):
+    """crates.io API (``/api/v1/crates/<name>``)."""
+
+    label = "crates.io"
+    cache_source = "crates"
+    osv_ecosystem = "crates.io"
+
+    def package_url(self, name: str) -> str:
+        return f"{self.base_url}/api/v1/crates/{urllib.parse.quote(name)}"
+
+    def detail_url(self, name: str, version: str) -> str:
+        return (
+            f"{self.package_url(name)}/"
+            f"{urllib.parse.quote(version)}/dependencies"
+        )
+
+    def normalize_range(self, spec: str) -> str:
+        """Cargo requirements: a bare version means caret."""
+        parts = []
+        for clause in spec.split(","):
+            clause = clause.strip()
+            if clause and clause[0].isdigit():
+                clause = "^" + clause
+            parts.append(clause)
+        return " ".join(parts)
+
+    def project(self, payload: dict) -> dict:
+        crate = payload.get("crate", {}) or {}
+        latest = (
+            crate.get("max_stable_version")
+            or crate.get("newest_version")
+            or crate.get("max_version")
+            or ""
+        )
+        versions = {
+            v["num"]: _version_entry(
+                deprecated="yanked" if v.get("yanked") else "",
+            )
+            for v in payload.get("versions", []) or []
+            if v.get("num")
+        }
+        return {
+            "name": crate.get("name", ""),
+            "dist-tags": {"latest": latest} if latest else {},
+            "time": {"modified": crate.get("updated_at", "") or ""},
+            "versions": versions,
+        }
+
+    def project_detail(self, payload: dict) -> dict[str, str]:
+        """Normal, non-optional dependencies of one crate version."""
+        return {
+            dep["crate_id"]: self.normalize_range(dep.get("req", "")) or "latest"
+            for dep in payload.get("dependencies", []) or []
+            if dep.get("crate_id")
+            and dep.get("kind", "normal") == "normal"
+            and not dep.get("optional")
+        }
+
+
+# ── Registry table ────────────────────────────────────────────────────
+
+DEFAULT_URLS = {
+    "npm": "https://registry.npmjs.org",
+    "pypi": "https://pypi.org",
+    "crates.io": "https://crates.io",
+}
+
+_ADAPTER_TYPES: dict[str, type[RegistryAdapter]] = {
+    "npm": NpmAdapter,
+    "pypi": PyPIAdapter,
+    "crates.io": CratesAdapter,
+}
+
+# Manifest "Ecosystem" spellings → canonical key
+ECOSYSTEM_ALIASES = {
+    "npm": "npm",
+    "pypi": "pypi",
+    "pip": "pypi",
+    "python": "pypi",
+    "crates.io": "crates.io",
+    "crates": "crates.io",
+    "cargo": "crates.io",
+    "rust": "crates.io",
+}
+
+
+def canonical_ecosystem(ecosystem: str) -> str | None:
+    """Return the adapter key for a manifest ecosystem, or None."""
+    return ECOSYSTEM_ALIASES.get(ecosystem.strip().lower())
+
+
+def build_adapters(
+    overrides: dict[str, str] | None = None,
+) -> dict[str, RegistryAdapter]:
+    """Instantiate every adapter, with optional base-URL overrides."""
+    urls = dict(DEFAULT_URLS)
+    for ecosystem, url in (overrides or {}).items():
+        key = canonical_ecosystem(ecosystem)
+        if key is None:
+            raise ValueError(f"unknown registry ecosystem: {ecosystem}")
+        urls[key] = url
+    return {key: cls(urls[key]) for key, cls in _ADAPTER_TYPES.items()}
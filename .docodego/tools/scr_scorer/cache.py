@@ -0,0 +1,128 @@
+"""Disk cache for registry responses with HTTP validators."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from scoring_common import CACHE_DIR
+
+# Disk cache: .docodego/tools/.cache/<source>/<key>.json
+
+
+@dataclass
+class CacheEntry:
+    """A cached registry response plus the validators to revalidate it.
+
+    ``etag`` and ``last_modified`` are the raw ``ETag`` and
+    ``Last-Modified`` response headers, replayed as
+    ``If-None-Match`` / ``If-Modified-Since`` once the entry is stale.
+    A set ``negative`` records a failed lookup (the HTTP status,
+    or 0 for no response) so it is not retried until it expires.
+    """
+
+    payload: object
+    cached_at: datetime
+    etag: str = ""
+    last_modified: str = ""
+    negative: int | None = None
+
+    def age_hours(self) -> float:
+        """Hours since the entry was written or last revalidated."""
+        delta = datetime.now(timezone.utc) - self.cached_at
+        return delta.total_seconds() / 3600
+
+    @property
+    def is_negative(self) -> bool:
+        """True if the entry records a failed lookup, not a payload."""
+        return self.negative is not None
+
+    def is_fresh(self, ttl_hours: float) -> bool:
+        """True if the entry is within *ttl_hours*."""
+        return self.age_hours() <= ttl_hours
+
+    @property
+    def has_validators(self) -> bool:
+        """True if the entry can be revalidated conditionally."""
+        return bool(self.etag or self.last_modified)
+
+
+def cache_path(source: str, name: str) -> Path:
+    """Return the cache file path for a given source + key."""
+    safe = hashlib.sha256(name.encode()).hexdigest()[:16]
+    return CACHE_DIR / source / f"{safe}.json"
+
+
+def read_entry(path: Path) -> CacheEntry | None:
+    """Read a cache entry regardless of age. None if absent or corrupt."""
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        ts = data.get("_cached_at", "")
+        if not ts:
+            return None
+        return CacheEntry(
+            payload=data.get("payload"),
+            cached_at=datetime.fromisoformat(ts),
+            etag=data.get("etag", ""),
+            last_modified=data.get("last_modified", ""),
+            negative=data.get("negative"),
+        )
+    except (json.JSONDecodeError, ValueError, OSError, AttributeError):
+        return None
+
+
+def write_entry(
+    path: Path,
+    payload: object,
+    *,
+    etag: str = "",
+    last_modified: str = "",
+) -> None:
+    """Write a payload and its validators to the cache."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data: dict[str, object] = {
+            "_cached_at": datetime.now(timezone.utc).isoformat(),
+            "payload": payload,
+        }
+        if etag:
+            data["etag"] = etag
+        if last_modified:
+            data["last_modified"] = last_modified
+        path.write_text(
+            json.dumps(data, separators=(",", ":")),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass  # cache write failure is non-fatal
+
+
+def refresh_entry(path: Path, entry: CacheEntry) -> None:
+    """Reset the TTL of *entry* after a 304 Not Modified."""
+    write_entry(
+        path,
+        entry.payload,
+        etag=entry.etag,
+        last_modified=entry.last_modified,
+    )
+
+
+def write_negative(path: Path, status: int) -> None:
+    """Record a failed lookup (404, error status, or 0 = no response)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "_cached_at": datetime.now(timezone.utc).isoformat(),
+            "negative": status,
+        }
+        path.write_text(
+            json.dumps(data, separators=(",", ":")),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass  # cache write failure is non-fatal
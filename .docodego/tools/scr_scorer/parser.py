@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import re
 import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
+
+from .cache import CACHE_DIR
 
 
 @dataclass
@@ -142,19 +149,181 @@ def parse_manifest(path: Path) -> SDDM:
 # Scoped packages are unambiguous: @scope/name
 _SCOPED_RE = re.compile(r"@[a-z][a-z0-9._-]*/[a-z][a-z0-9._-]*[a-z0-9]")
 
-_FRONTMATTER_FENCE = "---"
+# Phrases that put a package mention in negation context. Matched
+# against ASCII-lowercased bytes, which is what str.lower() does to
+# every character these phrases can contain.
+_NEGATION_PHRASES = (b"equals 0", b"pnpm dlx", b"npx ", b"instead of")
+
+# Frontmatter fences and "## " headings — the only lines that change
+# scanner state. Anchored on the preceding newline so the search
+# jumps from line to line instead of trying every offset; the first
+# line is handled by prefixing one newline to the text.
+_STRUCTURE_RE = re.compile(
+    r"\n[^\S\n]*(?:(?P<fence>---)[^\S\n]*$|(?P<heading>## [^\n]*))",
+    re.MULTILINE,
+)
+
+_SKIPPED_STEMS = frozenset({
+    "README", "ROADMAP", "REVIEW", "CHANGELOG", "DEPENDENCIES",
+})
+
+# Per-file results keyed by content hash. Bump the version whenever
+# the scan rules change so stale results are discarded.
+SCAN_CACHE_PATH = CACHE_DIR / "scan" / "scoped-packages.json"
+SCAN_CACHE_VERSION = 1
+SCAN_CACHE_LIMIT = 50_000
+
+# Scoped package mentions of one file: [(package_name, line_number)]
+FileMentions = list[tuple[str, int]]
+
+
+def _negated_lines(raw: bytes) -> set[int]:
+    """Line numbers that contain a negation phrase."""
+    lowered = raw.lower()
+    lines: set[int] = set()
+    for phrase in _NEGATION_PHRASES:
+        line, pos = 1, 0
+        idx = lowered.find(phrase)
+        while idx != -1:
+            line += lowered.count(b"\n", pos, idx)
+            pos = idx
+            lines.add(line)
+            idx = lowered.find(phrase, idx + 1)
+    return lines
+
+
+def _line_numbered(
+    text: str, matches: Iterator[re.Match[str]],
+) -> Iterator[tuple[int, int, re.Match[str]]]:
+    """Yield (offset, line_number, match) for matches in text order.
+
+    *text* carries the leading newline added by ``_scan_source``, so
+    counting starts at line 0. A structure match begins on the
+    newline before its line and reports the previous line number;
+    only its offset is used.
+    """
+    line, pos = 0, 0
+    for m in matches:
+        line += text.count("\n", pos, m.start())
+        pos = m.start()
+        yield pos, line, m
+
 
+def _scan_source(raw: bytes) -> FileMentions:
+    """Return the first in-scope mention of each scoped package.
 
-def _is_negation_line(line: str) -> bool:
-    """Return True if a line mentions a package in negation context."""
-    lower = line.lower()
-    return (
-        "equals 0" in lower
-        or "pnpm dlx" in lower
-        or "npx " in lower
-        or "instead of" in lower
+    Skips frontmatter, Failure Modes sections, lines in negation
+    context (the line itself or the next one has a negation
+    phrase) and ``@repo/`` workspace packages. Each rule makes one
+    pass over the whole file; structure and package matches are
+    then merged by offset and replayed in text order.
+    """
+    if b"\r" in raw:
+        # Match text-mode reads (universal newlines)
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    negated = _negated_lines(raw)
+    # The leading newline lets _STRUCTURE_RE match on line 1; it
+    # shifts every offset by one, so package offsets are shifted too
+    text = "\n" + raw.decode("utf-8")
+    tokens = heapq.merge(
+        _line_numbered(text, _STRUCTURE_RE.finditer(text)),
+        _line_numbered(text, _SCOPED_RE.finditer(text)),
+        key=lambda token: token[0],
     )
 
+    mentions: FileMentions = []
+    seen: set[str] = set()
+    fences = 0
+    in_frontmatter = False
+    in_failure_modes = False
+    for _, line, m in tokens:
+        if m.re is _STRUCTURE_RE:
+            if m.group("fence"):
+                fences += 1
+                in_frontmatter = fences == 1
+            elif not in_frontmatter:
+                heading = m.group("heading").rstrip()
+                in_failure_modes = heading == "## Failure Modes"
+            continue
+        if in_frontmatter or in_failure_modes:
+            continue
+        if line in negated or line + 1 in negated:
+            continue
+        name = m.group(0)
+        if name.startswith("@repo/") or name in seen:
+            continue
+        seen.add(name)
+        mentions.append((name, line))
+    return mentions
+
+
+class _ScanCache:
+    """Content-hash → mentions map, persisted as one JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, FileMentions] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, FileMentions]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == SCAN_CACHE_VERSION:
+                    self._entries = {
+                        digest: [tuple(m) for m in mentions]
+                        for digest, mentions in data["files"].items()
+                    }
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+        return self._entries
+
+    def get(self, digest: str) -> FileMentions | None:
+        with self._lock:
+            return self._load().get(digest)
+
+    def put(self, digest: str, mentions: FileMentions) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[digest] = mentions
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed, dropping the oldest entries."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            entries = list(self._entries.items())[-SCAN_CACHE_LIMIT:]
+            data = {"version": SCAN_CACHE_VERSION, "files": dict(entries)}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(
+                    json.dumps(data, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+                tmp.replace(self.path)
+                self._dirty = False
+            except OSError:
+                pass  # cache write failure is non-fatal
+
+
+_scan_cache = _ScanCache(SCAN_CACHE_PATH)
+
+
+def _scan_file(path: Path) -> FileMentions:
+    """Scan one spec file, reusing cached results for unchanged content."""
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    cached = _scan_cache.get(digest)
+    if cached is not None:
+        return cached
+    mentions = _scan_source(raw)
+    _scan_cache.put(digest, mentions)
+    return mentions
+
 
 def scan_unlisted_packages(
     spec_dir: Path, manifest_names: set[str],
@@ -165,62 +334,20 @@ def scan_unlisted_packages(
     for packages found in spec prose that are absent from the
     manifest. Only detects scoped packages (@scope/name). Skips
     negation contexts and Failure Modes sections.
-    """
-    unlisted: list[tuple[str, str, int]] = []
-
-    md_files = sorted(spec_dir.rglob("*.md"))
-    for md_file in md_files:
-        stem_upper = md_file.stem.upper()
-        if stem_upper in (
-            "README", "ROADMAP", "REVIEW", "CHANGELOG",
-            "DEPENDENCIES",
-        ):
-            continue
 
-        text = md_file.read_text(encoding="utf-8")
-        lines = text.split("\n")
-        seen_in_file: set[str] = set()
-
-        in_frontmatter = False
-        fm_count = 0
-        in_failure_modes = False
-
-        for line_num, line in enumerate(lines, start=1):
-            stripped = line.strip()
-
-            # Skip frontmatter
-            if stripped == _FRONTMATTER_FENCE:
-                fm_count += 1
-                in_frontmatter = fm_count == 1
-                if fm_count == 2:
-                    in_frontmatter = False
-                continue
-            if in_frontmatter:
-                continue
-
-            # Track sections — skip Failure Modes
-            if stripped.startswith("## "):
-                in_failure_modes = stripped == "## Failure Modes"
-            if in_failure_modes:
-                continue
-
-            # Skip negation context (current + next line)
-            idx = line_num - 1
-            fwd = lines[idx : idx + 2]
-            if any(_is_negation_line(w) for w in fwd):
-                continue
-
-            # Scoped packages
-            for m in _SCOPED_RE.finditer(stripped):
-                name = m.group(0)
-                if name.startswith("@repo/"):
-                    continue
-                if name in seen_in_file:
-                    continue
-                seen_in_file.add(name)
-                if name not in manifest_names:
-                    unlisted.append(
-                        (name, md_file.name, line_num),
-                    )
-
-    return unlisted
+    Per-file results are cached by content hash, so unchanged specs
+    are not re-scanned.
+    """
+    md_files = [
+        path for path in sorted(spec_dir.rglob("*.md"))
+        if path.stem.upper() not in _SKIPPED_STEMS
+    ]
+    per_file = [_scan_file(path) for path in md_files]
+    _scan_cache.save()
+
+    return [
+        (name, md_file.name, line)
+        for md_file, mentions in zip(md_files, per_file)
+        for name, line in mentions
+        if name not in manifest_names
+    ]
@@ -1,142 +1,388 @@
-"""HTTP clients for OSV and npm registry APIs with disk cache."""
+"""HTTP clients for OSV and package registry APIs with disk cache."""
 
 from __future__ import annotations
 
-import hashlib
-import json
-import urllib.request
-import urllib.error
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable
+
+from .adapters import (
+    RegistryAdapter,
+    build_adapters,
+    canonical_ecosystem,
+)
+from .cache import (
+    CacheEntry,
+    cache_path,
+    read_entry,
+    refresh_entry,
+    write_entry,
+    write_negative,
+)
+from .semver import exact_version, resolve_version
+from .snapshot import Snapshot
+from .transport import SingleFlight, fetch, host_unreachable
 
 # ── Config ────────────────────────────────────────────────────────────
 
-TIMEOUT = 5  # seconds per request
 OSV_URL = "https://api.osv.dev/v1/query"
-NPM_URL = "https://registry.npmjs.org"
 
-# Disk cache: .docodego/tools/.cache/<source>/<key>.json
-# TTL: npm 24h, osv 6h (vulnerabilities change more often)
-_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
-NPM_TTL_HOURS = 24
+# Disk cache TTL: registry metadata 24h, osv 6h (vulnerabilities
+# change more often). Stale entries are revalidated with
+# If-None-Match / If-Modified-Since; a 304 Not Modified only resets
+# the TTL.
+METADATA_TTL_HOURS = 24
 OSV_TTL_HOURS = 6
 
-# In-memory cache for npm responses (shared across dimensions)
-_npm_cache: dict[str, dict | None] = {}
+# Negative cache TTL: a 404 is unlikely to change within the hour;
+# other failures (timeouts, 5xx after retries) are retried sooner.
+NOT_FOUND_TTL_HOURS = 1
+FAILURE_TTL_HOURS = 0.25
 
+# Stale-while-revalidate: an entry up to this many hours past its TTL
+# is served immediately and refreshed in the background (default of
+# every ``max_stale_hours`` parameter). 0 disables. OSV results are
+# never served more than OSV_MAX_STALE_HOURS past their TTL, so a
+# newly published advisory is not hidden for a day.
+MAX_STALE_HOURS = 24
+OSV_MAX_STALE_HOURS = 1
+REFRESH_WORKERS = 4
 
-# ── Disk cache ────────────────────────────────────────────────────────
+# Seconds shutdown_refreshes waits for queued refreshes to finish
+REFRESH_DRAIN_SECONDS = 30
 
+# Registry adapters by canonical ecosystem (see configure_registries)
+_adapters: dict[str, RegistryAdapter] = build_adapters()
 
-def _cache_key(source: str, name: str) -> Path:
-    """Return the cache file path for a given source + package name."""
-    safe = hashlib.sha256(name.encode()).hexdigest()[:16]
-    return _CACHE_DIR / source / f"{safe}.json"
+# In-memory cache for projected metadata, keyed by (ecosystem, name)
+# and shared across dimensions
+_metadata_cache: dict[tuple[str, str], dict | None] = {}
 
+# Local snapshot — when set, lookups never touch the network
+_snapshot: Snapshot | None = None
 
-def _read_cache(path: Path, ttl_hours: int) -> dict | None:
-    """Read a cached JSON file if it exists and is fresh."""
-    if not path.exists():
-        return None
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        ts = data.get("_cached_at", "")
-        if not ts:
-            return None
-        cached_at = datetime.fromisoformat(ts)
-        age_hours = (
-            datetime.now(timezone.utc) - cached_at
-        ).total_seconds() / 3600
-        if age_hours > ttl_hours:
-            return None
-        return data.get("payload")
-    except (json.JSONDecodeError, ValueError, OSError):
+# Concurrent identical lookups (e.g. audit groups scored in parallel
+# threads) share one in-flight request
+_flight = SingleFlight()
+
+# Background refresh state (stale-while-revalidate)
+_refresh_pool: ThreadPoolExecutor | None = None
+_refresh_lock = threading.Lock()
+_refreshing: dict[Path, Future] = {}
+
+
+# ── Snapshot mode ─────────────────────────────────────────────────────
+
+
+def use_snapshot(snapshot: Snapshot | None) -> None:
+    """Serve npm and OSV lookups from *snapshot* instead of the network.
+
+    The snapshot only holds npm metadata; other ecosystems have no
+    registry data in snapshot mode.
+    """
+    global _snapshot
+    _snapshot = snapshot
+    _metadata_cache.clear()
+
+
+def snapshot_active() -> bool:
+    """True if lookups are served from a snapshot (see use_snapshot)."""
+    return _snapshot is not None
+
+
+# ── Registry selection ────────────────────────────────────────────────
+
+
+def configure_registries(overrides: dict[str, str]) -> None:
+    """Point ecosystems at alternative base URLs (mirrors, fixtures).
+
+    Raises ValueError for an ecosystem without an adapter.
+    """
+    global _adapters
+    _adapters = build_adapters(overrides)
+    _metadata_cache.clear()
+
+
+def _adapter(ecosystem: str) -> RegistryAdapter | None:
+    key = canonical_ecosystem(ecosystem)
+    return _adapters.get(key) if key else None
+
+
+def has_registry(ecosystem: str) -> bool:
+    """True if packages of *ecosystem* have a registry adapter."""
+    return _adapter(ecosystem) is not None
+
+
+def registry_label(ecosystem: str) -> str:
+    """Display name of *ecosystem*'s registry (e.g. "PyPI")."""
+    adapter = _adapter(ecosystem)
+    return adapter.label if adapter else ecosystem
+
+
+def normalize_range(spec: str, ecosystem: str) -> str:
+    """Rewrite a native version requirement as an npm-style range."""
+    adapter = _adapter(ecosystem)
+    return adapter.normalize_range(spec) if adapter else spec
+
+
+# ── Cached fetch ──────────────────────────────────────────────────────
+
+
+def _revalidate(
+    path: Path,
+    entry: CacheEntry | None,
+    url: str,
+    *,
+    body: dict | None,
+    project: Callable[[dict], object],
+) -> object | None:
+    """Fetch *url* (conditionally if *entry* has validators) and cache it.
+
+    On 304 the entry's TTL is reset without re-downloading the body.
+    New bodies are passed through *project* before being cached. If
+    the request fails, a stale body is served instead; with nothing
+    to fall back on, the failure is negatively cached and None is
+    returned. Requests the circuit breaker stops before they reach
+    the network are never cached: they say nothing about the package.
+    """
+    validators = entry if entry is not None and entry.has_validators else None
+    short_circuited = host_unreachable(url)
+    result = fetch(url, body=body, validators=validators)
+    if result.not_modified and entry is not None:
+        refresh_entry(path, entry)
+        return entry.payload
+    if result.payload is None:
+        if entry is not None and not result.not_found:
+            return entry.payload
+        if not short_circuited:
+            write_negative(path, result.status)
         return None
 
+    projected = project(result.payload)
+    write_entry(
+        path,
+        projected,
+        etag=result.etag,
+        last_modified=result.last_modified,
+    )
+    return projected
 
-def _write_cache(path: Path, payload: object) -> None:
-    """Write a JSON payload to the cache."""
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "_cached_at": datetime.now(timezone.utc).isoformat(),
-            "payload": payload,
-        }
-        path.write_text(
-            json.dumps(data, separators=(",", ":")),
-            encoding="utf-8",
-        )
-    except OSError:
-        pass  # cache write failure is non-fatal
 
+def _refresh_in_background(
+    path: Path,
+    entry: CacheEntry,
+    url: str,
+    *,
+    body: dict | None,
+    project: Callable[[dict], object],
+) -> None:
+    """Schedule a revalidation of *entry*, at most one per cache file."""
+    global _refresh_pool
+
+    def _run() -> None:
+        try:
+            _revalidate(path, entry, url, body=body, project=project)
+        finally:
+            with _refresh_lock:
+                _refreshing.pop(path, None)
+
+    with _refresh_lock:
+        if path in _refreshing:
+            return
+        if _refresh_pool is None:
+            _refresh_pool = ThreadPoolExecutor(
+                max_workers=REFRESH_WORKERS,
+                thread_name_prefix="scr-refresh",
+            )
+        # Submitted under the lock so shutdown_refreshes cannot
+        # close the pool in between
+        _refreshing[path] = _refresh_pool.submit(_run)
 
-# ── Low-level fetch ───────────────────────────────────────────────────
 
+def shutdown_refreshes(timeout: float = REFRESH_DRAIN_SECONDS) -> None:
+    """Drain the background refresh pool, then stop it.
 
-def _fetch_json(
+    Pending refreshes get up to *timeout* seconds to finish so stale
+    entries served this run are actually revalidated; whatever is
+    still queued after that is cancelled, and only refreshes already
+    running are waited for. The pool is recreated if another refresh
+    is scheduled.
+    """
+    global _refresh_pool
+    with _refresh_lock:
+        pool, _refresh_pool = _refresh_pool, None
+        pending = list(_refreshing.values())
+    if pool is None:
+        return
+    wait(pending, timeout=timeout)
+    pool.shutdown(wait=True, cancel_futures=True)
+    with _refresh_lock:
+        _refreshing.clear()
+
+
+def _cached_fetch(
+    source: str,
+    key: str,
     url: str,
     *,
+    ttl_hours: int,
     body: dict | None = None,
-    timeout: int = TIMEOUT,
-) -> dict | None:
-    """Fetch JSON from a URL. Returns None on any error."""
-    try:
-        if body is not None:
-            data = json.dumps(body).encode()
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={"Content-Type": "application/json"},
-            )
-        else:
-            req = urllib.request.Request(url)
-
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
-    except (
-        urllib.error.URLError,
-        urllib.error.HTTPError,
-        TimeoutError,
-        OSError,
-        json.JSONDecodeError,
+    project: Callable[[dict], object] = lambda payload: payload,
+    allow_stale: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> object | None:
+    """Serve *key* from the disk cache, revalidating when stale.
+
+    A fresh entry is returned as-is. A stale entry still within
+    *max_stale_hours* past its TTL is returned immediately and refreshed
+    in a background thread (stale-while-revalidate); older entries,
+    or any stale entry when *allow_stale* is False, are revalidated
+    before returning. Negative entries short-circuit to None until
+    they expire. Concurrent calls for the same key are coalesced.
+    """
+    path = cache_path(source, key)
+    return _flight.do(
+        (path, allow_stale, max_stale_hours),
+        lambda: _serve_cached(
+            path, url,
+            ttl_hours=ttl_hours,
+            body=body,
+            project=project,
+            allow_stale=allow_stale,
+            max_stale_hours=max_stale_hours,
+        ),
+    )
+
+
+def _serve_cached(
+    path: Path,
+    url: str,
+    *,
+    ttl_hours: int,
+    body: dict | None,
+    project: Callable[[dict], object],
+    allow_stale: bool,
+    max_stale_hours: float,
+) -> object | None:
+    """Body of ``_cached_fetch`` — runs once per in-flight key."""
+    entry = read_entry(path)
+    if entry is not None and entry.is_negative:
+        negative_ttl = (
+            NOT_FOUND_TTL_HOURS if entry.negative == 404
+            else FAILURE_TTL_HOURS
+        )
+        if entry.is_fresh(negative_ttl):
+            return None
+        entry = None
+    if entry is not None and entry.is_fresh(ttl_hours):
+        return entry.payload
+
+    if (
+        allow_stale
+        and entry is not None
+        and entry.is_fresh(ttl_hours + max_stale_hours)
     ):
-        return None
+        _refresh_in_background(
+            path, entry, url, body=body, project=project,
+        )
+        return entry.payload
+
+    return _revalidate(path, entry, url, body=body, project=project)
 
 
 # ── OSV API ───────────────────────────────────────────────────────────
 
 
 def query_osv(
-    name: str, *, version: str = "", ecosystem: str = "npm",
-) -> list[dict]:
+    name: str,
+    *,
+    version: str = "",
+    ecosystem: str = "npm",
+    allow_stale: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> list[dict] | None:
     """Query OSV for vulnerabilities affecting a package.
 
     Returns a list of vulnerability objects, each with at least
-    a 'severity' field. Returns [] on network error.
-    Uses disk cache with 6h TTL.
+    a 'severity' field. Returns None on network error when no
+    cached result (fresh or stale) is available, or in snapshot mode
+    when the snapshot holds no advisories for the ecosystem.
+    *version* may be a range; it is resolved to the concrete version
+    it would install, and results are cached per resolved version.
+    Uses disk cache with 6h TTL, stale-while-revalidate (capped at
+    ``OSV_MAX_STALE_HOURS``), and conditional revalidation.
     """
-    cache_key_str = f"{ecosystem}:{name}:{version}"
-    cache_path = _cache_key("osv", cache_key_str)
-    cached = _read_cache(cache_path, OSV_TTL_HOURS)
-    if cached is not None:
-        return cached
-
+    adapter = _adapter(ecosystem)
+    if adapter is not None:
+        name = adapter.normalize_name(name)
+    # Query the exact version the manifest range installs
+    exact = resolve_exact_version(
+        name, version, ecosystem=ecosystem, allow_stale=allow_stale,
+        max_stale_hours=max_stale_hours,
+    )
+    if adapter is not None:
+        ecosystem = adapter.osv_ecosystem
     payload: dict = {
         "package": {"name": name, "ecosystem": ecosystem},
     }
-    # Include version for precise matching if available
-    clean_ver = version.lstrip("^~>=<v ").strip()
-    if clean_ver and clean_ver != "latest":
-        payload["version"] = clean_ver
-
-    result = _fetch_json(OSV_URL, body=payload)
-    if result is None:
-        return []
-    vulns = result.get("vulns", [])
-    _write_cache(cache_path, vulns)
+    if exact:
+        payload["version"] = exact
+
+    if _snapshot is not None:
+        # No advisories for the ecosystem means it was never imported,
+        # not that its packages are clean
+        if not _snapshot.has_osv(ecosystem):
+            return None
+        return _snapshot.osv(name, ecosystem, exact)
+
+    vulns = _cached_fetch(
+        "osv",
+        f"{ecosystem}:{name}:{exact}",
+        OSV_URL,
+        ttl_hours=OSV_TTL_HOURS,
+        body=payload,
+        project=lambda result: result.get("vulns", []),
+        allow_stale=allow_stale,
+        max_stale_hours=min(max_stale_hours, OSV_MAX_STALE_HOURS),
+    )
     return vulns
 
 
+def resolve_exact_version(
+    name: str,
+    spec: str,
+    *,
+    ecosystem: str = "npm",
+    allow_stale: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> str:
+    """Resolve a manifest version or range to one concrete version.
+
+    Pinned versions are returned as-is. Ranges and dist-tags are
+    resolved against the package's registry metadata for ecosystems
+    with an adapter. Otherwise the range operators are stripped as a
+    best guess; "" means unknown.
+    """
+    pinned = exact_version(spec)
+    if pinned:
+        return pinned
+    if has_registry(ecosystem):
+        metadata = query_metadata(
+            name, ecosystem=ecosystem, allow_stale=allow_stale,
+            max_stale_hours=max_stale_hours,
+        )
+        if metadata is not None:
+            resolved = resolve_version(
+                metadata, normalize_range(spec, ecosystem) or "latest",
+            )
+            if resolved:
+                return resolved
+    guess = spec.lstrip("^~>=<v ").strip()
+    return "" if guess in ("", "latest", "*") else guess
+
+
 def classify_severity(vuln: dict) -> str:
     """Extract the highest severity level from a vulnerability.
 
@@ -165,39 +411,82 @@ def classify_severity(vuln: dict) -> str:
     return "UNKNOWN"
 
 
-# ── npm Registry ──────────────────────────────────────────────────────
+# ── Package registries ────────────────────────────────────────────────
 
 
-def query_npm(name: str, *, ecosystem: str = "npm") -> dict | None:
-    """Query npm registry for package metadata.
+def query_metadata(
+    name: str,
+    *,
+    ecosystem: str = "npm",
+    allow_stale: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> dict | None:
+    """Query the package registry for *ecosystem* (npm, PyPI, crates.io).
 
-    Returns the registry response or None for non-npm ecosystems
-    or on error. Uses in-memory + disk cache (24h TTL).
+    Returns metadata projected to the packument shape described in
+    ``adapters``, or None for ecosystems without an adapter or on
+    error. Uses in-memory + disk cache (24h TTL); stale disk entries
+    are served while refreshing in the background, or revalidated
+    with If-None-Match / If-Modified-Since.
     """
-    if ecosystem != "npm":
+    adapter = _adapter(ecosystem)
+    if adapter is None:
         return None
+    name = adapter.normalize_name(name)
+    memo_key = (adapter.cache_source, name)
+    if memo_key in _metadata_cache:
+        return _metadata_cache[memo_key]
+
+    if _snapshot is not None:
+        metadata = _snapshot.npm(name) if adapter.label == "npm" else None
+        _metadata_cache[memo_key] = metadata
+        return metadata
+
+    metadata = _cached_fetch(
+        adapter.cache_source, name, adapter.package_url(name),
+        ttl_hours=METADATA_TTL_HOURS,
+        project=adapter.project,
+        allow_stale=allow_stale,
+        max_stale_hours=max_stale_hours,
+    )
+    if metadata is not None:
+        metadata = _with_latest_dependencies(
+            adapter, name, metadata, allow_stale=allow_stale,
+            max_stale_hours=max_stale_hours,
+        )
+    _metadata_cache[memo_key] = metadata
+    return metadata
 
-    if name in _npm_cache:
-        return _npm_cache[name]
-
-    cache_path = _cache_key("npm", name)
-    cached = _read_cache(cache_path, NPM_TTL_HOURS)
-    if cached is not None:
-        _npm_cache[name] = cached
-        return cached
 
-    # Scoped packages need URL encoding: @scope/name → @scope%2fname
-    encoded = name.replace("/", "%2f")
-    url = f"{NPM_URL}/{encoded}"
-    result = _fetch_json(url)
-    _npm_cache[name] = result
-    if result is not None:
-        _write_cache(cache_path, result)
-    return result
+def _with_latest_dependencies(
+    adapter: RegistryAdapter,
+    name: str,
+    metadata: dict,
+    *,
+    allow_stale: bool,
+    max_stale_hours: float,
+) -> dict:
+    """Attach the latest release's dependencies from a detail request."""
+    latest = metadata.get("dist-tags", {}).get("latest", "")
+    url = adapter.detail_url(name, latest) if latest else None
+    if url is None:
+        return metadata
+    deps = _cached_fetch(
+        f"{adapter.cache_source}-deps", f"{name}@{latest}", url,
+        ttl_hours=METADATA_TTL_HOURS,
+        project=adapter.project_detail,
+        allow_stale=allow_stale,
+        max_stale_hours=max_stale_hours,
+    )
+    if not deps:
+        return metadata
+    versions = dict(metadata.get("versions", {}))
+    versions[latest] = {**versions.get(latest, {}), "dependencies": deps}
+    return {**metadata, "versions": versions}
 
 
 def get_last_modified(npm_data: dict) -> datetime | None:
-    """Extract last-modified timestamp from npm registry data."""
+    """Extract last-modified timestamp from registry metadata."""
     time_map = npm_data.get("time", {})
     modified = time_map.get("modified")
     if not modified:
@@ -231,3 +520,79 @@ def get_dep_count(npm_data: dict) -> int:
     latest_meta = versions.get(latest, {})
     deps = latest_meta.get("dependencies", {})
     return len(deps)
+
+
+# ── Cache prewarming ──────────────────────────────────────────────────
+
+
+def _warm_all(
+    packages: Iterable[tuple[str, str, str]],
+    *,
+    jobs: int,
+    allow_stale: bool,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> tuple[int, int]:
+    """Fetch metadata and OSV results for every package concurrently."""
+
+    def _warm(pkg: tuple[str, str, str]) -> tuple[bool, bool]:
+        name, version, ecosystem = pkg
+        metadata = query_metadata(
+            name, ecosystem=ecosystem, allow_stale=allow_stale,
+            max_stale_hours=max_stale_hours,
+        )
+        osv = query_osv(
+            name, version=version, ecosystem=ecosystem,
+            allow_stale=allow_stale, max_stale_hours=max_stale_hours,
+        )
+        return metadata is not None, osv is not None
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        outcomes = list(pool.map(_warm, packages))
+    metadata_ok = sum(1 for metadata, _ in outcomes if metadata)
+    osv_ok = sum(1 for _, osv in outcomes if osv)
+    return metadata_ok, osv_ok
+
+
+def prewarm(
+    packages: Iterable[tuple[str, str, str]], *, jobs: int = 8,
+) -> tuple[int, int]:
+    """Fill the cache for (name, version, ecosystem) triples.
+
+    Stale entries are revalidated synchronously rather than served,
+    so a scheduled prewarm leaves every entry fresh. Returns the
+    number of packages with registry metadata and with OSV results.
+    """
+    return _warm_all(packages, jobs=jobs, allow_stale=False)
+
+
+def prefetch(
+    packages: Iterable[tuple[str, str, str]],
+    *,
+    jobs: int = 8,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> None:
+    """Load every package's metadata and OSV results in one concurrent
+    pass, whatever its ecosystem, so per-dimension loops hit cache."""
+    _warm_all(
+        packages, jobs=jobs, allow_stale=True,
+        max_stale_hours=max_stale_hours,
+    )
+
+
+def unreachable_registries(ecosystems: Iterable[str]) -> list[str]:
+    """Labels of registries among *ecosystems* whose breaker tripped."""
+    labels: list[str] = []
+    for ecosystem in ecosystems:
+        adapter = _adapter(ecosystem)
+        if (
+            adapter is not None
+            and adapter.label not in labels
+            and host_unreachable(adapter.base_url)
+        ):
+            labels.append(adapter.label)
+    return labels
+
+
+def osv_unreachable() -> bool:
+    """True if the circuit breaker has tripped for the OSV API."""
+    return host_unreachable(OSV_URL)
@@ -0,0 +1,173 @@
+"""Transitive dependency resolver over cached registry metadata."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
+
+from .registry import MAX_STALE_HOURS, query_metadata
+from .semver import resolve_version
+
+# Max dependency nodes visited per manifest entry. Large framework
+# closures are reported as truncated (">= budget") instead of
+# walking thousands of packuments.
+NODE_BUDGET = 1000
+
+# Concurrent registry lookups while expanding one BFS level
+RESOLVE_WORKERS = 8
+
+# Number of heaviest direct-dependency subtrees reported per entry
+HEAVIEST_LIMIT = 3
+
+# A node is one (package, requested range) pair
+NodeKey = tuple[str, str]
+
+
+@dataclass
+class DepthReport:
+    """Transitive dependency footprint of one manifest entry."""
+
+    name: str
+    direct: int = 0
+    transitive: int = 0
+    max_depth: int = 0
+    heaviest: list[tuple[str, int]] = field(default_factory=list)
+    truncated: bool = False
+    resolved: bool = True
+
+
+def _pick_version(npm_data: dict, spec: str) -> dict:
+    """Return the version metadata a dependency range resolves to.
+
+    Falls back to the ``latest`` dist-tag when nothing satisfies
+    *spec* (e.g. git or file specifiers).
+    """
+    versions = npm_data.get("versions", {})
+    resolved = resolve_version(npm_data, spec)
+    if resolved is None:
+        resolved = npm_data.get("dist-tags", {}).get("latest", "")
+    return versions.get(resolved, {})
+
+
+class TransitiveResolver:
+    """Breadth-first resolver with a shared per-node memo.
+
+    Each ``package@range`` node is expanded (one registry lookup plus
+    version selection) at most once per resolver, so subtrees shared
+    between manifest entries — or reached through several paths —
+    are resolved a single time. Closure sizes of visited nodes are
+    memoized too, so heaviest-subtree reports reuse earlier walks.
+    """
+
+    def __init__(
+        self,
+        *,
+        node_budget: int = NODE_BUDGET,
+        lookup: Callable[[str], dict | None] = query_metadata,
+    ) -> None:
+        self.node_budget = node_budget
+        self._lookup = lookup
+        self._children: dict[NodeKey, list[NodeKey] | None] = {}
+        self._closure_size: dict[NodeKey, tuple[int, bool]] = {}
+
+    # ── Node expansion ────────────────────────────────────────────
+
+    def _expand(self, node: NodeKey) -> list[NodeKey] | None:
+        """Resolve *node* to its direct dependencies (None if unknown)."""
+        name, spec = node
+        npm_data = self._lookup(name)
+        if npm_data is None:
+            return None
+        meta = _pick_version(npm_data, spec)
+        deps = meta.get("dependencies", {}) or {}
+        return sorted(deps.items())
+
+    def _expand_all(self, nodes: list[NodeKey]) -> None:
+        """Expand every not-yet-memoized node, concurrently."""
+        pending = [n for n in nodes if n not in self._children]
+        if not pending:
+            return
+        if len(pending) == 1:
+            self._children[pending[0]] = self._expand(pending[0])
+            return
+        workers = min(RESOLVE_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for node, children in zip(pending, pool.map(self._expand, pending)):
+                self._children[node] = children
+
+    # ── Graph walks ───────────────────────────────────────────────
+
+    def _walk(self, root: NodeKey) -> tuple[dict[str, int], bool]:
+        """BFS from *root*. Returns ({package: depth}, truncated)."""
+        depths: dict[str, int] = {}
+        seen: set[NodeKey] = {root}
+        frontier = [root]
+        level = 0
+        truncated = False
+        while frontier:
+            self._expand_all(frontier)
+            level += 1
+            next_frontier: list[NodeKey] = []
+            for node in frontier:
+                for child in self._children.get(node) or []:
+                    if child in seen:
+                        continue
+                    if len(seen) > self.node_budget:
+                        truncated = True
+                        break
+                    seen.add(child)
+                    depths.setdefault(child[0], level)
+                    next_frontier.append(child)
+            frontier = next_frontier
+        depths.pop(root[0], None)
+        return depths, truncated
+
+    def _subtree_size(self, node: NodeKey) -> tuple[int, bool]:
+        """Closure size of *node* including itself (memoized)."""
+        if node not in self._closure_size:
+            depths, truncated = self._walk(node)
+            self._closure_size[node] = (len(depths) + 1, truncated)
+        return self._closure_size[node]
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def resolve(self, name: str, spec: str = "latest") -> DepthReport:
+        """Report the transitive footprint of *name* at range *spec*."""
+        report = DepthReport(name=name)
+        root: NodeKey = (name, spec)
+        self._expand_all([root])
+        direct = self._children.get(root)
+        if direct is None:
+            report.resolved = False
+            return report
+
+        depths, truncated = self._walk(root)
+        report.direct = len(direct)
+        report.transitive = len(depths)
+        report.max_depth = max(depths.values(), default=0)
+        report.truncated = truncated
+
+        sizes = [(child, self._subtree_size(child)) for child in direct]
+        sizes.sort(key=lambda item: -item[1][0])
+        report.heaviest = [
+            (child[0], size) for child, (size, _) in sizes[:HEAVIEST_LIMIT]
+        ]
+        return report
+
+
+def resolver_for(
+    ecosystem: str,
+    *,
+    node_budget: int = NODE_BUDGET,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> TransitiveResolver:
+    """A resolver that looks packages up in *ecosystem*'s registry."""
+    return TransitiveResolver(
+        node_budget=node_budget,
+        lookup=partial(
+            query_metadata, ecosystem=ecosystem,
+            max_stale_hours=max_stale_hours,
+        ),
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -10,13 +11,21 @@ from scoring_common.types import DimensionResult
 
 from .parser import SDDM, scan_unlisted_packages
 from .registry import (
+    MAX_STALE_HOURS,
     classify_severity,
-    get_dep_count,
     get_last_modified,
+    has_registry,
     is_deprecated,
-    query_npm,
+    normalize_range,
+    osv_unreachable,
+    prefetch,
+    query_metadata,
     query_osv,
+    registry_label,
+    snapshot_active,
+    unreachable_registries,
 )
+from .resolver import DepthReport, TransitiveResolver, resolver_for
 
 # ── Constants ──────────────────────────────────────────────────────────
 
@@ -31,6 +40,10 @@ MAX_VITALITY = 25
 MAX_DEPTH = 20
 MAX_COVERAGE = 15
 
+# Share of a dimension's credit a package still earns when it could
+# not be checked (lookup failed, registry unreachable)
+UNVERIFIED_CREDIT = 0.5
+
 # Severity → point deduction for vulnerability scoring
 SEVERITY_DEDUCTION = {
     "CRITICAL": 10,
@@ -40,6 +53,11 @@ SEVERITY_DEDUCTION = {
     "UNKNOWN": 1,
 }
 
+# Transitive closure size above which a package is flagged
+# (-1 above WARN, -2 above HEAVY), alongside the direct-dep limits
+TRANSITIVE_WARN = 150
+TRANSITIVE_HEAVY = 300
+
 # Known-heavy frameworks exempt from depth penalties
 KNOWN_HEAVY = {
     "webpack", "vite", "next", "nuxt", "expo", "tauri",
@@ -86,8 +104,45 @@ class SCRResult:
 # ── Dimension scorers ─────────────────────────────────────────────────
 
 
+def _discount_unverified(score: int, verified: int, total: int) -> int:
+    """Scale *score* down for the packages that went unchecked.
+
+    Each of the *total* packages carries an equal share of the score;
+    the ``total - verified`` unchecked ones earn only
+    ``UNVERIFIED_CREDIT`` of theirs, so missing data never reads as
+    a clean result.
+    """
+    if total <= 0 or verified >= total:
+        return score
+    weight = (verified + UNVERIFIED_CREDIT * (total - verified)) / total
+    return int(score * weight)
+
+
+def _name_list(names: list[str], limit: int = 3) -> str:
+    """Comma-joined *names*, truncated to *limit* with a count."""
+    shown = ", ".join(names[:limit])
+    if len(names) > limit:
+        shown += f" (+{len(names) - limit} more)"
+    return shown
+
+
+def _unresolved_issue(missing: list[str], total: int) -> str:
+    """Issue text for registry packages that returned no data."""
+    where = (
+        "missing from the snapshot" if snapshot_active()
+        else "not resolved in their registry"
+    )
+    return (
+        f"{len(missing)} of {total} package(s) {where} -- scored as "
+        f"unverified: {_name_list(missing)}"
+    )
+
+
 def score_vulnerability(
-    sddm: SDDM, *, offline: bool = True,
+    sddm: SDDM,
+    *,
+    offline: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
 ) -> DimensionResult:
     """Score Known Vulnerability Exposure (0-40)."""
     result = DimensionResult(
@@ -104,10 +159,15 @@ def score_vulnerability(
         return result
 
     total_deduction = 0
+    unchecked: list[str] = []
     for name, ref in sddm.unique_packages.items():
         vulns = query_osv(
             name, version=ref.version, ecosystem=ref.ecosystem,
+            max_stale_hours=max_stale_hours,
         )
+        if vulns is None:
+            unchecked.append(name)
+            continue
         for vuln in vulns:
             sev = classify_severity(vuln)
             deduction = SEVERITY_DEDUCTION.get(sev, 1)
@@ -117,8 +177,22 @@ def score_vulnerability(
                 f"{name}: {vuln_id} ({sev}, -{deduction}pts)",
             )
 
-    result.score = max(0, MAX_VULN - total_deduction)
-    if not result.issues:
+    total = len(sddm.unique_packages)
+    result.score = _discount_unverified(
+        max(0, MAX_VULN - total_deduction), total - len(unchecked), total,
+    )
+    if unchecked:
+        if snapshot_active():
+            reason = "No OSV data in the snapshot"
+        elif osv_unreachable():
+            reason = "OSV API unreachable"
+        else:
+            reason = "OSV lookup failed"
+        result.issues.append(
+            f"{reason} -- {len(unchecked)} of {total} package(s) not "
+            f"checked for known CVEs: {_name_list(unchecked)}",
+        )
+    elif not result.issues:
         result.suggestions.append(
             "No known CVEs found for referenced packages",
         )
@@ -126,7 +200,10 @@ def score_vulnerability(
 
 
 def score_vitality(
-    sddm: SDDM, *, offline: bool = True,
+    sddm: SDDM,
+    *,
+    offline: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
 ) -> DimensionResult:
     """Score Package Vitality (0-25)."""
     result = DimensionResult(
@@ -146,20 +223,27 @@ def score_vitality(
     now = datetime.now(timezone.utc)
     vital_count = 0.0
     queried = 0
+    missing: list[str] = []
 
     for name, ref in sddm.unique_packages.items():
-        if ref.ecosystem != "npm":
+        if not has_registry(ref.ecosystem):
             continue
-        npm_data = query_npm(name)
-        if npm_data is None:
+        metadata = query_metadata(
+            name, ecosystem=ref.ecosystem, max_stale_hours=max_stale_hours,
+        )
+        if metadata is None:
+            missing.append(name)
             continue
         queried += 1
 
-        if is_deprecated(npm_data):
-            result.issues.append(f"'{name}' is deprecated on npm")
+        if is_deprecated(metadata):
+            result.issues.append(
+                f"'{name}' is deprecated on "
+                f"{registry_label(ref.ecosystem)}",
+            )
             continue
 
-        modified = get_last_modified(npm_data)
+        modified = get_last_modified(metadata)
         if modified is None:
             continue
 
@@ -179,25 +263,62 @@ def score_vitality(
 
     if queried == 0:
         result.score = OFFLINE_VITALITY_SCORE
+        unreachable = _unreachable(sddm)
+        if unreachable:
+            result.suggestions.append(
+                f"{unreachable} registry unreachable -- "
+                f"vitality scored as offline",
+            )
+        elif missing:
+            result.issues.append(_unresolved_issue(missing, len(missing)))
         return result
 
     ratio = vital_count / queried
     if ratio >= 1.0:
-        result.score = MAX_VITALITY
+        score = MAX_VITALITY
     elif ratio >= 0.9:
-        result.score = 20
+        score = 20
     elif ratio >= 0.7:
-        result.score = 15
+        score = 15
     elif ratio >= 0.5:
-        result.score = 10
+        score = 10
     else:
-        result.score = max(0, int(ratio * MAX_VITALITY))
+        score = max(0, int(ratio * MAX_VITALITY))
 
+    total = queried + len(missing)
+    result.score = _discount_unverified(score, queried, total)
+    if missing:
+        result.issues.append(_unresolved_issue(missing, total))
     return result
 
 
+def _unreachable(sddm: SDDM) -> str:
+    """Comma-joined labels of the manifest's tripped registries."""
+    return ", ".join(unreachable_registries(
+        ref.ecosystem for ref in sddm.unique_packages.values()
+    ))
+
+
+def _describe_footprint(report: DepthReport) -> str:
+    """Render a transitive footprint, e.g. for depth issues."""
+    count = f"{report.transitive}{'+' if report.truncated else ''}"
+    text = (
+        f"has {report.direct} direct / {count} transitive deps, "
+        f"depth {report.max_depth}"
+    )
+    if report.heaviest:
+        heaviest = ", ".join(
+            f"{dep} ({size})" for dep, size in report.heaviest
+        )
+        text += f"; heaviest: {heaviest}"
+    return text
+
+
 def score_depth(
-    sddm: SDDM, *, offline: bool = True,
+    sddm: SDDM,
+    *,
+    offline: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
 ) -> DimensionResult:
     """Score Supply Chain Depth (0-20)."""
     result = DimensionResult(
@@ -215,37 +336,56 @@ def score_depth(
         return result
 
     total_deduction = 0
+    queried = 0
+    missing: list[str] = []
+    resolvers: dict[str, TransitiveResolver] = {}
 
     for name, ref in sddm.unique_packages.items():
-        if ref.ecosystem != "npm":
+        if not has_registry(ref.ecosystem):
             continue
-        npm_data = query_npm(name)
-        if npm_data is None:
+        if ref.ecosystem not in resolvers:
+            resolvers[ref.ecosystem] = resolver_for(
+                ref.ecosystem, max_stale_hours=max_stale_hours,
+            )
+        spec = normalize_range(ref.version, ref.ecosystem)
+        report = resolvers[ref.ecosystem].resolve(name, spec or "latest")
+        if not report.resolved:
+            missing.append(name)
             continue
+        queried += 1
 
-        dep_count = get_dep_count(npm_data)
         base_name = name.split("/")[-1] if "/" in name else name
         is_heavy = base_name in KNOWN_HEAVY
+        footprint = _describe_footprint(report)
 
-        if dep_count > 100:
+        if report.direct > 100 or report.transitive > TRANSITIVE_HEAVY:
             if is_heavy:
                 result.suggestions.append(
-                    f"'{name}' has {dep_count} direct deps"
-                    f" (known-heavy, exempt)",
+                    f"'{name}' {footprint} (known-heavy, exempt)",
                 )
             else:
                 total_deduction += 2
-                result.issues.append(
-                    f"'{name}' has {dep_count} direct deps (-2pts)",
-                )
-        elif dep_count > 50:
+                result.issues.append(f"'{name}' {footprint} (-2pts)")
+        elif report.direct > 50 or report.transitive > TRANSITIVE_WARN:
             if not is_heavy:
                 total_deduction += 1
-                result.suggestions.append(
-                    f"'{name}' has {dep_count} direct deps (-1pt)",
-                )
+                result.suggestions.append(f"'{name}' {footprint} (-1pt)")
+
+    unreachable = _unreachable(sddm) if queried == 0 else ""
+    if unreachable:
+        result.score = OFFLINE_DEPTH_SCORE
+        result.suggestions.append(
+            f"{unreachable} registry unreachable -- "
+            f"depth scored as offline",
+        )
+        return result
 
-    result.score = max(0, MAX_DEPTH - total_deduction)
+    total = queried + len(missing)
+    result.score = _discount_unverified(
+        max(0, MAX_DEPTH - total_deduction), queried, total,
+    )
+    if missing:
+        result.issues.append(_unresolved_issue(missing, total))
     return result
 
 
@@ -337,6 +477,52 @@ def score_coverage(
 # ── Main scorer ────────────────────────────────────────────────────────
 
 
+@dataclass
+class ManifestScores:
+    """Registry-backed dimensions, which depend only on the manifest.
+
+    Computed once per manifest and shared by every spec group that
+    resolves to it; only SDDM Coverage is group-specific.
+    """
+
+    vulnerability: DimensionResult
+    vitality: DimensionResult
+    depth: DimensionResult
+
+
+def score_manifest(
+    sddm: SDDM,
+    *,
+    offline: bool = True,
+    max_stale_hours: float = MAX_STALE_HOURS,
+) -> ManifestScores:
+    """Score the registry-backed dimensions of a manifest.
+
+    Live runs first load metadata and OSV results for every package,
+    across all ecosystems, in one concurrent pass. Cache entries up
+    to *max_stale_hours* past their TTL are served while they refresh.
+    """
+    if not offline:
+        prefetch(
+            (
+                (ref.name, ref.version, ref.ecosystem)
+                for ref in sddm.unique_packages.values()
+            ),
+            max_stale_hours=max_stale_hours,
+        )
+    return ManifestScores(
+        vulnerability=score_vulnerability(
+            sddm, offline=offline, max_stale_hours=max_stale_hours,
+        ),
+        vitality=score_vitality(
+            sddm, offline=offline, max_stale_hours=max_stale_hours,
+        ),
+        depth=score_depth(
+            sddm, offline=offline, max_stale_hours=max_stale_hours,
+        ),
+    )
+
+
 def score_corpus(
     sddm: SDDM,
     *,
@@ -344,17 +530,24 @@ def score_corpus(
     threshold: int = 60,
     fail_on_zero_dimension: bool = True,
     spec_dir: Path | None = None,
+    manifest_scores: ManifestScores | None = None,
+    max_stale_hours: float = MAX_STALE_HOURS,
 ) -> SCRResult:
-    """Score a spec corpus against the SCR rubric."""
-    vuln = score_vulnerability(sddm, offline=offline)
-    vital = score_vitality(sddm, offline=offline)
-    dep = score_depth(sddm, offline=offline)
+    """Score a spec corpus against the SCR rubric.
+
+    Pass *manifest_scores* to reuse registry-backed dimensions
+    already computed for the same manifest.
+    """
+    if manifest_scores is None:
+        manifest_scores = score_manifest(
+            sddm, offline=offline, max_stale_hours=max_stale_hours,
+        )
     cov = score_coverage(sddm, spec_dir=spec_dir)
 
     result = SCRResult(
-        vulnerability=vuln,
-        vitality=vital,
-        depth=dep,
+        vulnerability=copy.deepcopy(manifest_scores.vulnerability),
+        vitality=copy.deepcopy(manifest_scores.vitality),
+        depth=copy.deepcopy(manifest_scores.depth),
         coverage=cov,
     )
 
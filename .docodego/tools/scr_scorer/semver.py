@@ -0,0 +1,248 @@
+"""Minimal semantic-version parsing and ordering (npm flavour)."""
+
+from __future__ import annotations
+
+import re
+
+# Accepts partial versions ("4", "4.1") — missing parts default to 0.
+_VERSION_RE = re.compile(
+    r"^\s*[v=]*\s*(\d+)(?:\.(\d+))?(?:\.(\d+))?"
+    r"(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?\s*$",
+)
+
+# Sort key: (major, minor, patch, prerelease_key). A release sorts
+# after all of its prereleases, so it carries (1,) vs (0, ids...).
+VersionKey = tuple[int, int, int, tuple]
+
+
+def _prerelease_key(pre: str | None) -> tuple:
+    """Order prerelease identifiers per semver §11."""
+    if not pre:
+        return (1,)
+    ids: list[tuple[int, int | str]] = []
+    for part in pre.split("."):
+        if part.isdigit():
+            ids.append((0, int(part)))
+        else:
+            ids.append((1, part))
+    return (0, *ids)
+
+
+def parse_version(text: str) -> VersionKey | None:
+    """Parse *text* into a comparable key, or None if not a version."""
+    m = _VERSION_RE.match(text)
+    if not m:
+        return None
+    major, minor, patch, pre = m.groups()
+    return (
+        int(major),
+        int(minor or 0),
+        int(patch or 0),
+        _prerelease_key(pre),
+    )
+
+
+def exact_version(spec: str) -> str | None:
+    """Return *spec* without a leading "v"/"=" if it pins one version."""
+    m = _VERSION_RE.match(spec)
+    if not m or m.group(2) is None or m.group(3) is None:
+        return None
+    return spec.strip().lstrip("v=").strip()
+
+
+def is_prerelease(key: VersionKey) -> bool:
+    """True if *key* belongs to a prerelease version."""
+    return key[3] != (1,)
+
+
+# ── Ranges ────────────────────────────────────────────────────────────
+
+# A comparator is (operator, version key); a range is an OR-list of
+# AND-sets of comparators, mirroring node-semver.
+Comparator = tuple[str, VersionKey]
+
+_RELEASE = (1,)
+_PRE_MIN = (0,)  # sorts below every prerelease of the same version
+
+_PARTIAL_RE = re.compile(
+    r"^[v=]*(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?"
+    r"(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$",
+)
+_OP_RE = re.compile(r"^(\^|~>?|>=|<=|>|<|=)?\s*(.*)$")
+_HYPHEN_RE = re.compile(r"^\s*(\S+)\s+-\s+(\S+)\s*$")
+
+
+def _partial(text: str) -> tuple[list[int | None], str | None] | None:
+    """Parse "1", "1.2", "1.x", "1.2.3-beta" into parts (None = wildcard)."""
+    m = _PARTIAL_RE.match(text)
+    if not m:
+        return None
+    parts: list[int | None] = []
+    for raw in m.groups()[:3]:
+        if raw is None or raw in ("x", "X", "*"):
+            parts.append(None)
+        else:
+            parts.append(int(raw))
+    # Anything after the first wildcard is a wildcard too
+    for i in range(1, 3):
+        if parts[i - 1] is None:
+            parts[i] = None
+    return parts, m.group(4)
+
+
+def _key(parts: list[int | None], pre: str | None = None) -> VersionKey:
+    return (
+        parts[0] or 0,
+        parts[1] or 0,
+        parts[2] or 0,
+        _prerelease_key(pre) if pre else _RELEASE,
+    )
+
+
+def _bump(parts: list[int | None], index: int) -> VersionKey:
+    """Lowest prerelease of the next version at *index* (exclusive bound)."""
+    nums = [p or 0 for p in parts]
+    nums[index] += 1
+    for i in range(index + 1, 3):
+        nums[i] = 0
+    return (nums[0], nums[1], nums[2], _PRE_MIN)
+
+
+def _comparators(token: str) -> list[Comparator] | None:
+    """Desugar one range token (e.g. "^1.2", ">=2", "1.x") to comparators."""
+    op, rest = _OP_RE.match(token).groups()
+    parsed = _partial(rest)
+    if parsed is None:
+        return None
+    parts, pre = parsed
+    major, minor, patch = parts
+
+    if major is None:
+        return [] if op in (None, "=", ">=", "<=") else None
+    if op in (None, "="):
+        if patch is not None:
+            return [("=", _key(parts, pre))]
+        index = 0 if minor is None else 1
+        return [(">=", _key(parts)), ("<", _bump(parts, index))]
+    if op == "^":
+        low = (">=", _key(parts, pre))
+        if major > 0 or minor is None:
+            return [low, ("<", _bump(parts, 0))]
+        if minor > 0 or patch is None:
+            return [low, ("<", _bump(parts, 1))]
+        return [low, ("<", _bump(parts, 2))]
+    if op in ("~", "~>"):
+        index = 0 if minor is None else 1
+        return [(">=", _key(parts, pre)), ("<", _bump(parts, index))]
+    if op == ">":
+        if patch is None:
+            index = 0 if minor is None else 1
+            return [(">=", _bump(parts, index))]
+        return [(">", _key(parts, pre))]
+    if op == "<=":
+        if patch is None:
+            index = 0 if minor is None else 1
+            return [("<", _bump(parts, index))]
+        return [("<=", _key(parts, pre))]
+    if op == "<":
+        if patch is None:
+            return [("<", (major, minor or 0, 0, _PRE_MIN))]
+        return [("<", _key(parts, pre))]
+    return [(">=", _key(parts, pre))]  # ">="
+
+
+def parse_range(spec: str) -> list[list[Comparator]] | None:
+    """Parse an npm range into OR-ed comparator sets, None if invalid."""
+    alternatives: list[list[Comparator]] = []
+    for alt in spec.split("||"):
+        alt = alt.strip()
+        hyphen = _HYPHEN_RE.match(alt)
+        if hyphen:
+            low = _comparators(">=" + hyphen.group(1))
+            high = _comparators("<=" + hyphen.group(2))
+            if low is None or high is None:
+                return None
+            alternatives.append(low + high)
+            continue
+        # Allow a space between operator and version (">= 1.2")
+        alt = re.sub(r"(\^|~>?|>=|<=|>|<|=)\s+", r"\1", alt)
+        comparators: list[Comparator] = []
+        for token in alt.split():
+            parsed = _comparators(token)
+            if parsed is None:
+                return None
+            comparators.extend(parsed)
+        alternatives.append(comparators)
+    return alternatives
+
+
+def _test(op: str, version: VersionKey, bound: VersionKey) -> bool:
+    if op == "=":
+        return version == bound
+    if op == ">":
+        return version > bound
+    if op == ">=":
+        return version >= bound
+    if op == "<":
+        return version < bound
+    return version <= bound  # "<="
+
+
+def _satisfies_set(version: VersionKey, comparators: list[Comparator]) -> bool:
+    if not all(_test(op, version, bound) for op, bound in comparators):
+        return False
+    if not is_prerelease(version):
+        return True
+    # A prerelease only matches if some comparator names a prerelease
+    # of the same major.minor.patch (node-semver's default behaviour)
+    return any(
+        is_prerelease(bound) and bound[:3] == version[:3]
+        and bound[3] != _PRE_MIN
+        for _, bound in comparators
+    )
+
+
+def satisfies(version: str, spec: str) -> bool:
+    """True if *version* is within npm range *spec*."""
+    key = parse_version(version)
+    ranges = parse_range(spec)
+    if key is None or ranges is None:
+        return False
+    return any(_satisfies_set(key, comparators) for comparators in ranges)
+
+
+def max_satisfying(versions: list[str], spec: str) -> str | None:
+    """Return the highest version in *versions* matching *spec*."""
+    ranges = parse_range(spec)
+    if ranges is None:
+        return None
+    best: tuple[VersionKey, str] | None = None
+    for version in versions:
+        key = parse_version(version)
+        if key is None:
+            continue
+        if not any(_satisfies_set(key, c) for c in ranges):
+            continue
+        if best is None or key > best[0]:
+            best = (key, version)
+    return best[1] if best else None
+
+
+def resolve_version(npm_data: dict, spec: str) -> str | None:
+    """Pick the version npm would install for *spec* from a packument.
+
+    A dist-tag name ("latest", "next") resolves through ``dist-tags``.
+    Otherwise the ``latest`` tag wins if it satisfies the range (npm's
+    preference), else the highest satisfying published version.
+    """
+    spec = spec.strip()
+    dist_tags = npm_data.get("dist-tags", {})
+    if not spec:
+        spec = "latest"
+    if spec in dist_tags:
+        return dist_tags[spec]
+    versions = list(npm_data.get("versions", {}))
+    latest = dist_tags.get("latest", "")
+    if latest and satisfies(latest, spec):
+        return latest
+    return max_satisfying(versions, spec)
@@ -0,0 +1,232 @@
+"""Local registry snapshot — OSV export + npm metadata in SQLite.
+
+Imported once from an OSV ecosystem export (the ``all.zip`` per
+ecosystem, or a directory of vulnerability JSON files) and a
+directory or archive of npm packuments. Lookups are then indexed
+local reads, so offline and air-gapped runs score real data.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sqlite3
+import tarfile
+import threading
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+from .adapters import project_npm
+from .cache import CACHE_DIR
+from .semver import parse_version
+
+DEFAULT_SNAPSHOT = CACHE_DIR / "snapshot.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS osv (
+    id TEXT NOT NULL,
+    ecosystem TEXT NOT NULL,
+    package TEXT NOT NULL,
+    doc TEXT NOT NULL,
+    PRIMARY KEY (ecosystem, package, id)
+);
+CREATE TABLE IF NOT EXISTS npm (
+    name TEXT PRIMARY KEY,
+    doc TEXT NOT NULL
+);
+"""
+
+
+# ── Archive readers ───────────────────────────────────────────────────
+
+
+def _iter_json_docs(source: Path) -> Iterator[dict]:
+    """Yield JSON objects from a directory, .zip, or .tar(.gz) archive."""
+    if source.is_dir():
+        for path in sorted(source.rglob("*.json")):
+            try:
+                yield json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                continue
+        return
+
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not info.filename.endswith(".json"):
+                    continue
+                try:
+                    yield json.loads(zf.read(info).decode("utf-8"))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+        return
+
+    if tarfile.is_tarfile(source):
+        with tarfile.open(source) as tf:
+            for member in tf:
+                if not member.isfile() or not member.name.endswith(".json"):
+                    continue
+                fh = tf.extractfile(member)
+                if fh is None:
+                    continue
+                try:
+                    yield json.load(io.TextIOWrapper(fh, encoding="utf-8"))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+
+
+# ── OSV range evaluation ──────────────────────────────────────────────
+
+
+_MIN_KEY = (0, 0, 0, (0,))
+
+
+def _event_key(event: dict):
+    """Sort key for an OSV range event ("introduced": "0" sorts first)."""
+    raw = str(next(iter(event.values()), "0"))
+    if raw == "0":
+        return _MIN_KEY
+    return parse_version(raw) or _MIN_KEY
+
+
+def _in_range(events: list[dict], version) -> bool:
+    """Evaluate an OSV SEMVER/ECOSYSTEM range against a version key."""
+    affected = False
+    for event in sorted(events, key=_event_key):
+        if "introduced" in event:
+            raw = event["introduced"]
+            intro = parse_version(raw) if raw != "0" else None
+            if raw == "0" or (intro is not None and intro <= version):
+                affected = True
+        elif "fixed" in event or "limit" in event:
+            raw = event.get("fixed", event.get("limit", ""))
+            bound = parse_version(raw)
+            if bound is not None and bound <= version:
+                affected = False
+        elif "last_affected" in event:
+            bound = parse_version(event["last_affected"])
+            if bound is not None and bound < version:
+                affected = False
+    return affected
+
+
+def osv_affects(vuln: dict, name: str, ecosystem: str, version: str) -> bool:
+    """True if *vuln* affects *name*@*version*.
+
+    An unparseable version is treated as affected — the same
+    conservative answer as an OSV query without a version.
+    """
+    key = parse_version(version)
+    if key is None:
+        return True
+    for affected in vuln.get("affected", []):
+        pkg = affected.get("package", {})
+        if pkg.get("name") != name:
+            continue
+        if pkg.get("ecosystem", "").lower() != ecosystem.lower():
+            continue
+        if version in affected.get("versions", []):
+            return True
+        for rng in affected.get("ranges", []):
+            if rng.get("type") not in ("SEMVER", "ECOSYSTEM"):
+                continue
+            if _in_range(rng.get("events", []), key):
+                return True
+    return False
+
+
+# ── Snapshot database ─────────────────────────────────────────────────
+
+
+class Snapshot:
+    """Read/write access to a snapshot database.
+
+    One connection is shared across threads behind a lock; every
+    query is a single indexed primary-key lookup.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Import ────────────────────────────────────────────────────
+
+    def import_osv(self, source: Path) -> int:
+        """Import an OSV export. Returns the number of advisories."""
+        count = 0
+        rows: list[tuple[str, str, str, str]] = []
+        for vuln in _iter_json_docs(source):
+            vuln_id = vuln.get("id")
+            if not vuln_id or vuln.get("withdrawn"):
+                continue
+            doc = json.dumps(vuln, separators=(",", ":"))
+            pairs = {
+                (
+                    a.get("package", {}).get("ecosystem", "").lower(),
+                    a.get("package", {}).get("name", ""),
+                )
+                for a in vuln.get("affected", [])
+            }
+            for ecosystem, package in pairs:
+                if package:
+                    rows.append((vuln_id, ecosystem, package, doc))
+            count += 1
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO osv VALUES (?, ?, ?, ?)", rows,
+            )
+        return count
+
+    def import_npm(self, source: Path) -> int:
+        """Import npm packuments. Returns the number of packages."""
+        rows = [
+            (projected["name"], json.dumps(projected, separators=(",", ":")))
+            for projected in map(project_npm, _iter_json_docs(source))
+            if projected["name"]
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO npm VALUES (?, ?)", rows,
+            )
+        return len(rows)
+
+    # ── Lookups ───────────────────────────────────────────────────
+
+    def npm(self, name: str) -> dict | None:
+        """Return projected npm metadata for *name*, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT doc FROM npm WHERE name = ?", (name,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def has_osv(self, ecosystem: str) -> bool:
+        """True if any advisory for *ecosystem* was imported."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM osv WHERE ecosystem = ? LIMIT 1",
+                (ecosystem.lower(),),
+            ).fetchone()
+        return row is not None
+
+    def osv(self, name: str, ecosystem: str, version: str = "") -> list[dict]:
+        """Return advisories for *name*, filtered to *version* if given."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT doc FROM osv WHERE ecosystem = ? AND package = ?",
+                (ecosystem.lower(), name),
+            ).fetchall()
+        vulns = [json.loads(row[0]) for row in rows]
+        if not version:
+            return vulns
+        return [
+            v for v in vulns if osv_affects(v, name, ecosystem, version)
+        ]
@@ -0,0 +1,245 @@
+"""HTTP transport for registry queries — retries, circuit breaker,
+and single-flight request coalescing."""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Hashable, TypeVar
+
+from .cache import CacheEntry
+
+# ── Config ────────────────────────────────────────────────────────────
+
+TIMEOUT = 5  # seconds per request
+
+# Retry 429 and transient 5xx with full-jitter exponential backoff:
+# sleep uniform(0, min(cap, base * 2**attempt)).
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 8.0
+
+# Consecutive no-response failures (timeouts, refused connections)
+# before a host is considered down for the rest of the run.
+BREAKER_THRESHOLD = 3
+
+T = TypeVar("T")
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single HTTP request.
+
+    ``status`` is the HTTP status code, or 0 when the request never
+    got a response (DNS failure, timeout, connection refused, or a
+    tripped circuit breaker). ``payload`` is the decoded JSON body
+    for 2xx responses only; a body that is not valid JSON leaves it
+    None but keeps the status, since the host did answer.
+    """
+
+    status: int
+    payload: dict | None = None
+    etag: str = ""
+    last_modified: str = ""
+    retry_after: float | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def not_found(self) -> bool:
+        return self.status == 404
+
+
+# ── Circuit breaker ───────────────────────────────────────────────────
+
+
+class CircuitBreaker:
+    """Per-host breaker that opens after consecutive failures.
+
+    Once open, a host stays open for the rest of the process — a
+    registry that timed out three times in a row will not recover
+    within a single audit run, and every further attempt would cost
+    another full TIMEOUT.
+    """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._failures: dict[str, int] = {}
+        self._open: set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            return host in self._open
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures[host] = 0
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            count = self._failures.get(host, 0) + 1
+            self._failures[host] = count
+            if count >= self.threshold:
+                self._open.add(host)
+
+
+_breaker = CircuitBreaker()
+
+
+def host_of(url: str) -> str:
+    """Return the network location used as the breaker key."""
+    return urllib.parse.urlsplit(url).netloc
+
+
+def host_unreachable(url: str) -> bool:
+    """True if the breaker for *url*'s host has tripped this run."""
+    return _breaker.is_open(host_of(url))
+
+
+# ── Single-flight ─────────────────────────────────────────────────────
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving
+    while it is in flight block on the same future and receive its
+    result (or exception). Nothing is remembered once the call
+    completes — caching is the caller's job.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+# ── Fetch ─────────────────────────────────────────────────────────────
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a delta-seconds Retry-After header (HTTP dates ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _fetch_once(
+    url: str,
+    *,
+    data: bytes | None,
+    headers: dict[str, str],
+    timeout: int,
+) -> FetchResult:
+    """Perform one HTTP request without retries."""
+    req = urllib.request.Request(url, data=data, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            raw = resp.read()
+            try:
+                payload = json.loads(raw.decode())
+            except ValueError:  # malformed body, not a transport error
+                return FetchResult(status=resp.status)
+            return FetchResult(
+                status=resp.status,
+                payload=payload,
+                etag=resp.headers.get("ETag", ""),
+                last_modified=resp.headers.get("Last-Modified", ""),
+            )
+    except urllib.error.HTTPError as exc:
+        # urllib surfaces 304 Not Modified as an HTTPError too
+        return FetchResult(
+            status=exc.code,
+            retry_after=_parse_retry_after(
+                exc.headers.get("Retry-After") if exc.headers else None,
+            ),
+        )
+    except (urllib.error.URLError, TimeoutError, OSError):
+        return FetchResult(status=0)
+
+
+def _backoff_delay(attempt: int, retry_after: float | None) -> float:
+    """Full-jitter exponential backoff, honoring Retry-After if set."""
+    if retry_after is not None:
+        return min(retry_after, BACKOFF_CAP_SECONDS)
+    ceiling = min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+def fetch(
+    url: str,
+    *,
+    body: dict | None = None,
+    validators: CacheEntry | None = None,
+    timeout: int = TIMEOUT,
+) -> FetchResult:
+    """Perform a GET (or JSON POST if *body*), optionally conditional.
+
+    When *validators* carries an ETag or Last-Modified value, the
+    request is sent with If-None-Match / If-Modified-Since so an
+    unchanged resource costs a 304 with an empty body. 429 and 5xx
+    responses are retried with jittered backoff; requests to a host
+    whose breaker has tripped return status 0 immediately.
+    """
+    host = host_of(url)
+    if _breaker.is_open(host):
+        return FetchResult(status=0)
+
+    headers: dict[str, str] = {"Accept": "application/json"}
+    data: bytes | None = None
+    if body is not None:
+        data = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    if validators is not None:
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+
+    attempt = 0
+    while True:
+        result = _fetch_once(
+            url, data=data, headers=headers, timeout=timeout,
+        )
+        if result.status == 0:
+            _breaker.record_failure(host)
+            return result
+        _breaker.record_success(host)
+        if result.status not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+            return result
+        time.sleep(_backoff_delay(attempt, result.retry_after))
+        attempt += 1
@@ -6,16 +6,21 @@ import argparse
 import sys
 from pathlib import Path
 
-from scoring_common import add_common_args, fix_encoding, load_dotenv
+from scoring_common import (
+    add_common_args,
+    add_jobs_arg,
+    fix_encoding,
+    load_dotenv,
+)
 
 fix_encoding()
 load_dotenv()
 
 from scoring_common.audit import resolve_audit_dir, write_audit
 
-from .parser import collect_specs
+from .parser import collect_groups
 from .reporter import TOOL_KEY, _result_to_dict, format_json, format_text
-from .scorer import score_corpus
+from .scorer import SHSResult, score_groups
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -27,8 +32,13 @@ def main(argv: list[str] | None = None) -> int:
         ),
     )
     parser.add_argument(
-        "directory",
-        help="Directory containing spec files to check",
+        "directories",
+        nargs="+",
+        metavar="directory",
+        help=(
+            "Directory containing spec files to check; several groups "
+            "are parsed once and share one reference graph"
+        ),
     )
     parser.add_argument(
         "--flows",
@@ -48,16 +58,18 @@ def main(argv: list[str] | None = None) -> int:
         help="Maximum lines for specs with 3+ tables (default: 650)",
     )
     add_common_args(parser)
+    add_jobs_arg(parser)
 
     args = parser.parse_args(argv)
-    spec_dir = Path(args.directory)
 
-    if not spec_dir.is_dir():
-        print(
-            f"Error: directory not found: {args.directory}",
-            file=sys.stderr,
-        )
-        return 1
+    directories = [Path(d) for d in args.directories]
+    for directory in directories:
+        if not directory.is_dir():
+            print(
+                f"Error: directory not found: {directory.as_posix()}",
+                file=sys.stderr,
+            )
+            return 1
 
     flows_dir = Path(args.flows) if args.flows else None
     if flows_dir and not flows_dir.is_dir():
@@ -68,16 +80,19 @@ def main(argv: list[str] | None = None) -> int:
         )
         flows_dir = None
 
-    specs = collect_specs(spec_dir)
-    if not specs:
-        print(
-            f"Error: no spec files found in {args.directory}",
-            file=sys.stderr,
-        )
-        return 1
+    # One parse of every group; Reference Coverage sees links
+    # crossing groups, the other dimensions stay per group
+    groups = collect_groups(directories, jobs=args.jobs)
+    for directory, specs in groups.items():
+        if not specs:
+            print(
+                f"Error: no spec files found in {directory.as_posix()}",
+                file=sys.stderr,
+            )
+            return 1
 
-    result = score_corpus(
-        specs,
+    results = score_groups(
+        groups,
         threshold=args.threshold,
         line_limit=args.line_limit,
         data_heavy_limit=args.data_heavy_limit,
@@ -85,13 +100,28 @@ def main(argv: list[str] | None = None) -> int:
         fail_on_zero_dimension=not args.no_zero_veto,
     )
 
-    display_path = spec_dir.as_posix()
     audit_dir = resolve_audit_dir(args.audits)
+    exit_code = 0
+    for directory, result in results.items():
+        _emit(result, directory, args, audit_dir)
+        if not result.approved:
+            exit_code = 1
+    return exit_code
+
+
+def _emit(
+    result: SHSResult,
+    directory: Path,
+    args: argparse.Namespace,
+    audit_dir: Path | None,
+) -> None:
+    """Write the audit file or print the report for one group."""
+    display_path = directory.as_posix()
 
     if audit_dir:
         tool_dict = _result_to_dict(result, threshold=args.threshold)
         # Use a synthetic path for the corpus audit
-        corpus_path = spec_dir / "_corpus"
+        corpus_path = directory / "_corpus"
         audit_file = write_audit(
             audit_dir, corpus_path, TOOL_KEY, tool_dict, display_path,
         )
@@ -112,8 +142,6 @@ def main(argv: list[str] | None = None) -> int:
             )
         )
 
-    return 1 if not result.approved else 0
-
 
 if __name__ == "__main__":
     sys.exit(main())
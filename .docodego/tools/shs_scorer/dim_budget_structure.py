@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 
 from scoring_common.types import DimensionResult
 
@@ -13,6 +14,7 @@ from .anti_gaming import (
     SEMVER_RE,
     VALID_STATUSES,
 )
+from .links import check_links
 from .parser import ParsedHealthSpec
 
 
@@ -83,19 +85,70 @@ def score_line_budget(
 # ── Dimension 4: Structural Completeness (0-25) ────────────────────────
 
 
-def _heading_matches_pattern(
-    heading: str, pattern: re.Pattern[str],
-) -> bool:
-    """Check if a heading matches the pattern or its aliases."""
-    if pattern.match(heading):
-        return True
-    canonical = pattern.pattern.strip("^$").replace("\\s+", " ")
-    for alias_key, alias_patterns in SECTION_ALIASES.items():
-        if pattern.match(alias_key) or alias_key.lower() == canonical.lower():
-            for alias_pat in alias_patterns:
-                if alias_pat.match(heading):
-                    return True
-    return False
+def _section_name(pattern: re.Pattern[str]) -> str:
+    """Display name of an expected-section pattern."""
+    return pattern.pattern.strip("^$").replace("\\s+", " ")
+
+
+def _build_section_matchers() -> dict[str, list[re.Pattern[str]]]:
+    """Section name → its own pattern plus every alias pattern.
+
+    An alias group applies to a section when the group's key matches
+    the section pattern or equals its display name.
+    """
+    matchers: dict[str, list[re.Pattern[str]]] = {}
+    for patterns in EXPECTED_SECTIONS.values():
+        for pattern in patterns:
+            name = _section_name(pattern)
+            if name in matchers:
+                continue
+            matchers[name] = [pattern]
+            for alias_key, alias_patterns in SECTION_ALIASES.items():
+                if (
+                    pattern.match(alias_key)
+                    or alias_key.lower() == name.lower()
+                ):
+                    matchers[name].extend(alias_patterns)
+    return matchers
+
+
+_SECTION_MATCHERS = _build_section_matchers()
+
+
+def _match_sections(heading: str) -> frozenset[str]:
+    """Regex resolution: every section *heading* satisfies."""
+    return frozenset(
+        name for name, patterns in _SECTION_MATCHERS.items()
+        if any(p.match(heading) for p in patterns)
+    )
+
+
+def _normalize_heading(heading: str) -> str:
+    return " ".join(heading.lower().split())
+
+
+# Exact lookup for section names and alias keys, normalized. Every
+# pattern separates words with \s+ and matches case-insensitively, so
+# a heading that normalizes to one of these keys resolves the same
+# way the regexes would.
+_EXACT_SECTIONS: dict[str, frozenset[str]] = {
+    _normalize_heading(key): _match_sections(key)
+    for key in (*_SECTION_MATCHERS, *SECTION_ALIASES)
+    if "?" not in key and "[" not in key
+}
+
+# Regex fallback results, keyed by raw heading
+_MATCHED_SECTIONS: dict[str, frozenset[str]] = {}
+
+
+def sections_for_heading(heading: str) -> frozenset[str]:
+    """Names of the expected sections *heading* counts as."""
+    found = _EXACT_SECTIONS.get(_normalize_heading(heading))
+    if found is None:
+        found = _MATCHED_SECTIONS.get(heading)
+        if found is None:
+            found = _MATCHED_SECTIONS[heading] = _match_sections(heading)
+    return found
 
 
 def _score_sections(
@@ -116,16 +169,16 @@ def _score_sections(
         )
         total_expected += len(expected)
 
+        present: set[str] = set()
+        for heading in spec.section_headings:
+            present |= sections_for_heading(heading)
+
         missing: list[str] = []
         for pat in expected:
-            found = any(
-                _heading_matches_pattern(h, pat)
-                for h in spec.section_headings
-            )
-            if found:
+            name = _section_name(pat)
+            if name in present:
                 total_present += 1
             else:
-                name = pat.pattern.strip("^$").replace("\\s+", " ")
                 missing.append(name)
 
         if missing:
@@ -185,43 +238,31 @@ def _score_frontmatter(
 
 def _score_link_integrity(
     specs: list[ParsedHealthSpec],
+    spec_dir: Path | None = None,
 ) -> tuple[float, list[str]]:
     """Score link resolution. Returns (ratio, issues)."""
-    issues: list[str] = []
-
-    total_links = 0
-    resolved_links = 0
-
-    for spec in specs:
-        for text, target, line_no in spec.all_md_links:
-            if not target.endswith(".md"):
-                continue
-            if target.startswith(("http://", "https://")):
-                continue
-
-            total_links += 1
-            resolved = (spec.filepath.parent / target).resolve()
-            if resolved.is_file():
-                resolved_links += 1
-            else:
-                issues.append(
-                    f"{spec.name}:{line_no}: broken link "
-                    f"[{text}]({target})"
-                )
-
+    total_links, broken = check_links(specs, spec_dir)
+    issues = [
+        f"{link.spec_name}:{link.line}: broken "
+        f"{'anchor' if link.reason == 'missing anchor' else 'link'} "
+        f"[{link.text}]({link.target})"
+        for link in broken
+    ]
+    resolved_links = total_links - len(broken)
     ratio = resolved_links / total_links if total_links > 0 else 1.0
     return ratio, issues
 
 
 def score_structural_completeness(
     specs: list[ParsedHealthSpec],
+    spec_dir: Path | None = None,
 ) -> DimensionResult:
     """Score structural completeness: sections + frontmatter + links."""
     result = DimensionResult(name="Structural Completeness", score=0)
 
     sec_ratio, sec_issues = _score_sections(specs)
     fm_ratio, fm_issues = _score_frontmatter(specs)
-    link_ratio, link_issues = _score_link_integrity(specs)
+    link_ratio, link_issues = _score_link_integrity(specs, spec_dir)
 
     result.issues.extend(sec_issues[:10])
     result.issues.extend(fm_issues[:10])
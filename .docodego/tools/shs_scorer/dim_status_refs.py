@@ -9,6 +9,12 @@ from scoring_common.types import DimensionResult
 
 from .anti_gaming import INFRASTRUCTURE_STEMS, VALID_STATUSES
 from .parser import ParsedHealthSpec
+from .ref_graph import ReferenceGraph
+
+# Hub specs: PageRank at least this many times the corpus average,
+# reported once the corpus is large enough for ranks to mean much
+HUB_RANK_FACTOR = 5.0
+HUB_MIN_SPECS = 20
 
 
 # ── Dimension 1: Status Consistency (0-25) ─────────────────────────────
@@ -95,8 +101,14 @@ def score_status_consistency(
 def score_reference_coverage(
     specs: list[ParsedHealthSpec],
     flows_dir: Path | None = None,
+    graph: ReferenceGraph | None = None,
 ) -> DimensionResult:
-    """Score reference connectivity and flow coverage."""
+    """Score reference connectivity and flow coverage.
+
+    *graph* may span more specs than *specs* (e.g. every spec group):
+    the group's specs are then judged on links from the whole graph,
+    so a spec referenced only from another group is not an orphan.
+    """
     result = DimensionResult(name="Reference Coverage", score=0)
 
     if not specs:
@@ -113,21 +125,11 @@ def score_reference_coverage(
         result.score = 25
         return result
 
-    # Count inbound references per spec
-    inbound: Counter[str] = Counter()
-    outbound_edges: list[tuple[str, str]] = []
-
-    for spec in specs:
-        for link_target in spec.related_specs_links:
-            target_stem = Path(link_target).stem
-            inbound[target_stem] += 1
-            outbound_edges.append((spec.name, target_stem))
+    if graph is None:
+        graph = ReferenceGraph(specs)
 
     # Orphan detection
-    orphans = [
-        s for s in non_infra
-        if inbound.get(s.name, 0) == 0
-    ]
+    orphans = [s for s in non_infra if graph.in_degree(s.name) == 0]
     orphan_ratio = 1.0 - (len(orphans) / len(non_infra))
 
     if orphans:
@@ -144,11 +146,8 @@ def score_reference_coverage(
 
     # Bidirectional reference check (informational only — not scored,
     # because reference graphs are naturally directional)
-    edge_set = set(outbound_edges)
-    bidi_count = sum(
-        1 for src, tgt in outbound_edges if (tgt, src) in edge_set
-    )
-    total_edges = len(outbound_edges)
+    bidi_count = graph.reciprocated_edges(spec_stems)
+    total_edges = graph.outbound_links(spec_stems)
     bidi_ratio = (bidi_count / total_edges) if total_edges > 0 else 1.0
 
     if total_edges > 0 and bidi_ratio < 1.0:
@@ -158,6 +157,8 @@ def score_reference_coverage(
             f"(bidirectional ratio: {bidi_ratio:.0%})"
         )
 
+    _graph_structure(graph, spec_stems, result)
+
     # Flow mapping (optional)
     flow_ratio = _compute_flow_ratio(spec_stems, flows_dir, result)
 
@@ -166,6 +167,45 @@ def score_reference_coverage(
     return result
 
 
+def _graph_structure(
+    graph: ReferenceGraph, spec_stems: set[str], result: DimensionResult,
+) -> None:
+    """Informational structure findings: islands and hub specs among
+    *spec_stems*."""
+    # Multi-spec clusters cut off from the main graph; lone specs
+    # without inbound links are already reported as orphans
+    islands = [
+        c for c in graph.components()[1:]
+        if len(c) > 1 and not spec_stems.isdisjoint(c)
+    ]
+    if islands:
+        sample = "; ".join(", ".join(c) for c in islands[:3])
+        suffix = (
+            f" (+{len(islands) - 3} more)" if len(islands) > 3 else ""
+        )
+        result.suggestions.append(
+            f"{len(islands)} spec cluster(s) disconnected from the main "
+            f"reference graph: {sample}{suffix}"
+        )
+
+    if len(graph) < HUB_MIN_SPECS:
+        return
+    floor = HUB_RANK_FACTOR / len(graph)
+    hubs = [
+        name for name, rank in sorted(
+            graph.pagerank().items(), key=lambda kv: -kv[1],
+        )
+        if rank >= floor and name in spec_stems
+    ]
+    if hubs:
+        suffix = f" (+{len(hubs) - 5} more)" if len(hubs) > 5 else ""
+        result.suggestions.append(
+            f"{len(hubs)} hub spec(s) rank {HUB_RANK_FACTOR:g}x+ the "
+            f"average in the reference graph (PageRank) — changes to "
+            f"them ripple widest: {', '.join(hubs[:5])}{suffix}"
+        )
+
+
 def _compute_flow_ratio(
     spec_stems: set[str],
     flows_dir: Path | None,
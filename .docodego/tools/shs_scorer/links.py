@@ -0,0 +1,209 @@
+"""Broken-link detection against a cached filesystem index.
+
+``FileIndex`` lists the corpus tree in one ``os.walk`` and keeps every
+directory listing in memory; directories outside the walked tree
+(``../`` links leaving the scanned group) are listed once on first
+use. Heading anchors are slugged once per target file. A single
+process-wide index is shared by every SHS run in the process (e.g.
+one per spec group under ``audit_all``), so each directory is listed
+and each file's anchors are built at most once.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import unquote
+
+from .parser import ParsedHealthSpec
+
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^(`{3,}|~{3,})")
+# Characters GitHub drops when slugging a heading
+_SLUG_DROP_RE = re.compile(r"[^\w\- ]")
+# Scheme-qualified targets (https:, mailto:, ...) are not files
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def heading_slug(text: str) -> str:
+    """GitHub-style anchor for a heading's text."""
+    return _SLUG_DROP_RE.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def _anchors_of(lines: list[str]) -> frozenset[str]:
+    """Anchors of every heading outside code fences, with ``-N``
+    suffixes for repeated headings as GitHub assigns them."""
+    anchors: set[str] = set()
+    seen: dict[str, int] = {}
+    fence = ""
+    for line in lines:
+        stripped = line.strip()
+        m = _FENCE_RE.match(stripped)
+        if m:
+            if not fence:
+                fence = m.group(1)[0] * 3
+            elif stripped.startswith(fence):
+                fence = ""
+            continue
+        if fence:
+            continue
+        m = _HEADING_RE.match(stripped)
+        if not m:
+            continue
+        slug = heading_slug(m.group(1))
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        anchors.add(slug if count == 0 else f"{slug}-{count}")
+    return frozenset(anchors)
+
+
+@dataclass
+class BrokenLink:
+    """A link whose target file or heading anchor does not exist."""
+
+    spec_name: str
+    text: str
+    target: str
+    line: int
+    reason: str  # "missing file" or "missing anchor"
+
+
+class FileIndex:
+    """In-memory directory listings and heading anchors."""
+
+    def __init__(self) -> None:
+        # Absolute directory → {entry name: is directory}
+        self._listings: dict[str, dict[str, bool]] = {}
+        self._walked: list[str] = []
+        self._anchors: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+
+    def walk(self, root: Path) -> None:
+        """List every directory under *root* in one walk (once)."""
+        top = os.path.abspath(root)
+        with self._lock:
+            if any(
+                top == done or top.startswith(done + os.sep)
+                for done in self._walked
+            ):
+                return
+            for dirpath, dirnames, filenames in os.walk(top):
+                entries = dict.fromkeys(filenames, False)
+                entries.update(dict.fromkeys(dirnames, True))
+                self._listings[dirpath] = entries
+            self._walked.append(top)
+
+    def _listing(self, directory: str) -> dict[str, bool]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as it:
+                    listing = {e.name: e.is_dir() for e in it}
+            except OSError:
+                listing = {}
+            self._listings[directory] = listing
+        return listing
+
+    def kind(self, path: str) -> str | None:
+        """``"file"``, ``"dir"`` or None for an absolute normalized path."""
+        parent, name = os.path.split(path)
+        if not name:
+            return "dir" if os.path.isdir(path) else None
+        is_dir = self._listing(parent).get(name)
+        if is_dir is None:
+            return None
+        return "dir" if is_dir else "file"
+
+    def anchors(self, path: str) -> frozenset[str]:
+        """Heading anchors of the markdown file at *path*."""
+        anchors = self._anchors.get(path)
+        if anchors is None:
+            try:
+                text = Path(path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                text = ""
+            anchors = self._anchors[path] = _anchors_of(text.split("\n"))
+        return anchors
+
+    def clear(self) -> None:
+        """Forget all listings and anchors (files changed on disk)."""
+        with self._lock:
+            self._listings.clear()
+            self._walked.clear()
+            self._anchors.clear()
+
+
+_SHARED_INDEX = FileIndex()
+
+
+def shared_index() -> FileIndex:
+    """The process-wide index reused across SHS runs."""
+    return _SHARED_INDEX
+
+
+def _check_link(
+    index: FileIndex, source: str, target: str,
+) -> str | None:
+    """Check one link target from file *source*.
+
+    Returns None for links that are not checked (URLs, absolute
+    paths), "" for links that resolve, else the reason it is broken.
+    """
+    target = target.strip()
+    if " " in target:
+        target = target.split()[0]  # drop a "title"
+    if target.startswith("<") and target.endswith(">"):
+        target = target[1:-1]
+    if not target or _SCHEME_RE.match(target) or target.startswith("/"):
+        return None
+
+    path_part, _, anchor = target.partition("#")
+    path_part = unquote(path_part)
+    if path_part:
+        resolved = os.path.normpath(
+            os.path.join(os.path.dirname(source), path_part),
+        )
+        if index.kind(resolved) is None:
+            return "missing file"
+    else:
+        resolved = source
+    if (
+        anchor
+        and resolved.lower().endswith(".md")
+        and unquote(anchor).lower() not in index.anchors(resolved)
+    ):
+        return "missing anchor"
+    return ""
+
+
+def check_links(
+    specs: list[ParsedHealthSpec],
+    root: Path | None = None,
+    index: FileIndex | None = None,
+) -> tuple[int, list[BrokenLink]]:
+    """(links checked, broken links) over every link in *specs*.
+
+    *root* (usually the scanned directory) is walked up front so its
+    files resolve from memory; other directories are listed lazily.
+    """
+    index = index or shared_index()
+    if root is not None:
+        index.walk(root)
+    checked = 0
+    broken: list[BrokenLink] = []
+    for spec in specs:
+        source = os.path.abspath(spec.filepath)
+        for text, target, line in spec.all_md_links:
+            reason = _check_link(index, source, target)
+            if reason is None:
+                continue
+            checked += 1
+            if reason:
+                broken.append(BrokenLink(
+                    spec_name=spec.name, text=text, target=target,
+                    line=line, reason=reason,
+                ))
+    return checked, broken
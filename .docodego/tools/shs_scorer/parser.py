@@ -6,9 +6,11 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from scoring_common.parallel import parallel_map
+from scoring_common.tables import find_tables
+
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
 _MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-_TABLE_ROW_RE = re.compile(r"^\|.+\|.+\|")
 _FRONTMATTER_KV = re.compile(r"^(\w[\w-]*)\s*:\s*(.+)$")
 
 
@@ -51,20 +53,6 @@ def _parse_frontmatter(lines: list[str]) -> tuple[dict[str, str], int]:
     return fm, 0
 
 
-def _count_tables(lines: list[str]) -> int:
-    """Count distinct markdown tables (groups of consecutive table rows)."""
-    count = 0
-    in_table = False
-    for line in lines:
-        is_row = bool(_TABLE_ROW_RE.match(line.strip()))
-        if is_row and not in_table:
-            count += 1
-            in_table = True
-        elif not is_row:
-            in_table = False
-    return count
-
-
 def _detect_spec_type(fm: dict[str, str], subdir: str) -> str:
     """Detect spec type from frontmatter id prefix or subdirectory."""
     spec_id = fm.get("id", "")
@@ -102,7 +90,11 @@ def _extract_related_links(
 
 
 def parse_spec(filepath: Path) -> ParsedHealthSpec:
-    """Parse a single spec file and extract health metadata."""
+    """Parse a single spec file and extract health metadata.
+
+    Tables (runs of rows with two or more cells) are counted with
+    ``find_tables`` on the same lines the other fields are read from.
+    """
     text = filepath.read_text(encoding="utf-8")
     lines = text.split("\n")
     subdir = filepath.parent.name
@@ -141,7 +133,7 @@ def parse_spec(filepath: Path) -> ParsedHealthSpec:
         name=filepath.stem,
         subdirectory=subdir,
         line_count=len(lines),
-        table_count=_count_tables(lines),
+        table_count=len(find_tables(lines, min_cells=2)),
         frontmatter=fm,
         section_headings=headings,
         related_specs_links=related_links,
@@ -150,19 +142,47 @@ def parse_spec(filepath: Path) -> ParsedHealthSpec:
     )
 
 
-def collect_specs(directory: Path) -> list[ParsedHealthSpec]:
+_EXCLUDED_FILES = {
+    "readme.md", "review.md", "roadmap.md", "product-context.md",
+}
+
+
+def _spec_files(directory: Path) -> list[Path]:
+    return [
+        md_file for md_file in sorted(directory.rglob("*.md"))
+        if md_file.name.lower() not in _EXCLUDED_FILES
+    ]
+
+
+def collect_specs(
+    directory: Path, *, jobs: int = 1,
+) -> list[ParsedHealthSpec]:
     """Walk a directory and parse all spec .md files.
 
-    Excludes README.md, REVIEW.md, and ROADMAP.md.
+    Excludes README.md, REVIEW.md, and ROADMAP.md. Files are parsed
+    across *jobs* worker processes.
     """
-    excluded = {
-        "readme.md", "review.md", "roadmap.md", "product-context.md",
-    }
-    specs: list[ParsedHealthSpec] = []
+    return parallel_map(parse_spec, _spec_files(directory), jobs=jobs)
+
 
-    for md_file in sorted(directory.rglob("*.md")):
-        if md_file.name.lower() in excluded:
-            continue
-        specs.append(parse_spec(md_file))
+def collect_groups(
+    directories: list[Path], *, jobs: int = 1,
+) -> dict[Path, list[ParsedHealthSpec]]:
+    """Parse the spec files of several group directories in one batch.
 
-    return specs
+    Every file is parsed once, in a single ``parallel_map`` call, even
+    when group directories overlap; each group maps to its own specs
+    in ``collect_specs`` order.
+    """
+    group_files = {
+        directory: _spec_files(directory) for directory in directories
+    }
+    unique = list(dict.fromkeys(
+        md_file for md_files in group_files.values()
+        for md_file in md_files
+    ))
+    parsed = dict(zip(unique, parallel_map(parse_spec, unique, jobs=jobs)))
+    return {
+        directory: [parsed[md_file] for md_file in md_files]
+        for directory, md_files in group_files.items()
+    }
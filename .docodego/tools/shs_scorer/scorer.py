@@ -16,6 +16,7 @@ from .dim_status_refs import (
     score_status_consistency,
 )
 from .parser import ParsedHealthSpec
+from .ref_graph import ReferenceGraph
 
 
 @dataclass
@@ -57,13 +58,21 @@ def score_corpus(
     line_limit: int = 300,
     data_heavy_limit: int = 400,
     flows_dir: Path | None = None,
+    spec_dir: Path | None = None,
+    graph: ReferenceGraph | None = None,
     fail_on_zero_dimension: bool = True,
 ) -> SHSResult:
-    """Score a spec corpus against the SHS rubric."""
+    """Score a spec corpus against the SHS rubric.
+
+    *spec_dir*, the scanned directory, is indexed up front for the
+    link integrity check. *graph*, a reference graph spanning more
+    specs than *specs*, scores Reference Coverage on those wider
+    links (see ``score_groups``).
+    """
     sc = score_status_consistency(specs)
-    rc = score_reference_coverage(specs, flows_dir=flows_dir)
+    rc = score_reference_coverage(specs, flows_dir=flows_dir, graph=graph)
     lb = score_line_budget(specs, line_limit, data_heavy_limit)
-    stc = score_structural_completeness(specs)
+    stc = score_structural_completeness(specs, spec_dir=spec_dir)
 
     result = SHSResult(
         status_consistency=sc,
@@ -97,3 +106,27 @@ def score_corpus(
         result.approved = True
 
     return result
+
+
+def score_groups(
+    groups: dict[Path, list[ParsedHealthSpec]],
+    **kwargs,
+) -> dict[Path, SHSResult]:
+    """Score several spec groups parsed in one pass.
+
+    Status Consistency, Line Budget and Structural Completeness are
+    scored per group; Reference Coverage is scored per group on one
+    reference graph of every group's specs, so links crossing groups
+    count. *kwargs* are passed to ``score_corpus``.
+    """
+    all_specs = list({
+        spec.filepath: spec
+        for specs in groups.values() for spec in specs
+    }.values())
+    graph = ReferenceGraph(all_specs)
+    return {
+        directory: score_corpus(
+            specs, spec_dir=directory, graph=graph, **kwargs,
+        )
+        for directory, specs in groups.items()
+    }
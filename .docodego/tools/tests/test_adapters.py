@@ -0,0 +1,53 @@
+"""Regression tests for PEP 440 range translation in scr_scorer.adapters."""
+
+from __future__ import annotations
+
+import unittest
+
+from scr_scorer.adapters import build_adapters
+from scr_scorer.semver import satisfies
+
+
+class CompatibleReleaseTests(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = build_adapters()["pypi"]
+
+    def assertAllows(self, spec, allowed, rejected):
+        npm_range = self.adapter.normalize_range(spec)
+        for version in allowed:
+            self.assertTrue(satisfies(version, npm_range), version)
+        for version in rejected:
+            self.assertFalse(satisfies(version, npm_range), version)
+
+    def test_two_part_zero_major_spans_every_minor(self):
+        self.assertEqual(self.adapter.normalize_range("~=0.2"), ">=0.2 <1.0")
+        self.assertAllows(
+            "~=0.2", ["0.2.0", "0.3.0", "0.9.9"], ["0.1.9", "1.0.0"],
+        )
+
+    def test_three_part_zero_major_spans_patch_releases(self):
+        self.assertEqual(
+            self.adapter.normalize_range("~=0.2.3"), ">=0.2.3 <0.3.0",
+        )
+        self.assertAllows(
+            "~=0.2.3", ["0.2.3", "0.2.10"], ["0.2.2", "0.3.0"],
+        )
+
+    def test_zero_zero_patch(self):
+        self.assertAllows("~=0.0.1", ["0.0.1", "0.0.9"], ["0.1.0"])
+
+    def test_non_zero_major(self):
+        self.assertEqual(self.adapter.normalize_range("~=2.2"), ">=2.2 <3.0")
+        self.assertEqual(
+            self.adapter.normalize_range("~=1.4.5"), ">=1.4.5 <1.5.0",
+        )
+
+    def test_combined_with_other_clauses(self):
+        self.assertEqual(
+            self.adapter.normalize_range("~=0.2, !=0.4.1"), ">=0.2 <1.0",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Regression tests for csg_scorer.state_graph guard conflicts."""
+
+from __future__ import annotations
+
+import unittest
+
+from csg_scorer.state_graph import StateGraph
+from csg_scorer.types import StateTransition
+
+
+def _row(from_state: str, to_state: str, trigger: str, guard: str):
+    return StateTransition(
+        from_state=from_state, to_state=to_state, trigger=trigger,
+        guard=guard, spec_name="spec",
+    )
+
+
+class GuardConflictTests(unittest.TestCase):
+
+    def test_same_guard_on_different_triggers_is_not_a_conflict(self):
+        # org-admin-configures-sso-provider, provider_save_error
+        guard = "Error message is visible and the form fields retain"
+        graph = StateGraph([
+            _row("save_error", "oidc_filled", "Admin dismisses (OIDC)",
+                 guard),
+            _row("save_error", "saml_filled", "Admin dismisses (SAML)",
+                 guard),
+        ])
+        self.assertEqual(graph.guard_conflicts(), [])
+
+    def test_same_trigger_and_guard_to_different_targets_conflicts(self):
+        graph = StateGraph([
+            _row("review", "approved", "Submit", "Form is valid"),
+            _row("review", "rejected", "submit ", "form  is valid"),
+        ])
+        [conflict] = graph.guard_conflicts()
+        self.assertEqual(conflict.state, "review")
+        self.assertEqual(conflict.trigger, "Submit")
+        self.assertEqual(conflict.targets, ["approved", "rejected"])
+
+    def test_unguarded_rows_never_conflict(self):
+        graph = StateGraph([
+            _row("idle", "a", "Go", "none"),
+            _row("idle", "b", "Go", "none"),
+        ])
+        self.assertEqual(graph.guard_conflicts(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()